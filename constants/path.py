@@ -26,6 +26,13 @@ BUILTINS = [
     ROOT / "src" / "builtin" / "random" / "random.py",
 ]
 
+# built executables, keyed by the hash of their source
+BUILD_CACHE = ROOT / ".uwu_cache" / "builds"
+# lexed tokens, keyed by the hash of their source and the lexer
+TOKEN_CACHE = ROOT / ".uwu_cache" / "tokens"
+# the bundled builtins that compiled programs import
+RUNTIME_DIR = ROOT / ".uwu_cache" / "runtime"
+
 LEXER_SOURCE = ROOT / "files" / "package-lexer.uwu"
 PARSER_SOURCE = ROOT / "files" / "package-parser.uwu"
 ANALYZER_SOURCE = ROOT / "files" / "package-analyzer.uwu"
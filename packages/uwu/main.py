@@ -102,6 +102,29 @@ def compile(ct: ConsoleTools) -> None:
     print('Running compiler package...')
     ct.run_subprocess([sys.executable, '-m'], 'src.compiler')
 
+def bench(ct: ConsoleTools, name = None) -> None:
+    """
+    This function can run the benchmarks.
+
+    uwu bench
+    uwu bench < benchmark name >
+    """
+    print('Running benchmarks...')
+    if name is None:
+        ct.run_subprocess([sys.executable, '-m'], 'src.benchmark')
+    else:
+        ct.run_subprocess([sys.executable, '-m', 'src.benchmark'], name)
+
+def check(ct: ConsoleTools, *patterns) -> None:
+    """
+    This function can check .uwu files without the IDE, printing the results as json.
+
+    uwu check < files | directories | globs >
+    """
+    if not patterns:
+        raise TypeError("Please specify the files to check.")
+    ct.run_subprocess([sys.executable, '-m', 'src.batch', *patterns[:-1]], patterns[-1])
+
 # Run IDE
 def build(ct: ConsoleTools) -> None:      
     """
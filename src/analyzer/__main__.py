@@ -1,15 +1,11 @@
 from constants.path import ANALYZER_SOURCE
 from .type_checker import TypeChecker
-from .error_handler import ErrorSrc
 from .analyzer import MemberAnalyzer
-from src.lexer import Lexer
+from src.lexer import Lexer, SourceLines, Whitespace
 from src.parser import Parser
-from src.parser.error_handler import ErrorSrc as parErrorSrc
 
 if __name__ == "__main__":
-    source: list[str] = [
-        line if line else "\n" for line in open(ANALYZER_SOURCE, "r").readlines()
-    ]
+    source = SourceLines.from_file(ANALYZER_SOURCE)
     max_digit_length = len(str(len(source)))
     max_width = max(len(line) for line in source) + max_digit_length + 3
     print("\nsample text file")
@@ -20,19 +16,17 @@ if __name__ == "__main__":
     print("-" * max_width)
     print("end of file\n")
 
-    l = Lexer(source)
+    l = Lexer(source, whitespace=Whitespace.SKIP)
     if l.errors:
         for err in l.errors:
             print(err)
         exit(1)
-    parErrorSrc.src = source
     p = Parser(l.tokens)
     if p.errors:
         for err in p.errors:
             print(err)
         exit(1)
 
-    ErrorSrc.src = source
     ma = MemberAnalyzer(p.program)
     if ma.errors:
         for err in ma.errors:
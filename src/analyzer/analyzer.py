@@ -1,19 +1,23 @@
 from src.lexer.token import TokenType, UniqueTokenType
+from src.lexer.context import CompileContext, current_context
 from src.analyzer.error_handler import DuplicateDefinitionError, FnUsedAsVar, FunctionAssignmentError, GlobalType, NonFunctionIdCall, UndefinedError
 from src.parser.productions import *
 
 class MemberAnalyzer:
-    def __init__(self, program: Program | None) -> None:
+    def __init__(self, program: Program | None, context: CompileContext = None) -> None:
+        'context is the compilation the program was parsed in, the current one by default'
         if not program:
             raise Exception("Program is empty!")
 
         self.program: Program = program
         self.errors = []
         self.warnings = []
+        self.context = context if context is not None else current_context()
 
         self.global_names: dict[str, tuple[Token, GlobalType]] = {}
-        self.compile_global_names()
-        self.analyze_program()
+        with self.context.activate():
+            self.compile_global_names()
+            self.analyze_program()
 
     def analyze_program(self) -> None:
         assert self.program.mainuwu
@@ -1,6 +1,7 @@
 from enum import Enum
 from src.parser.productions import *
 from src.lexer.token import Token, TokenType, UniqueTokenType
+from src.lexer.context import ErrorSource
 from src.style import AnsiColor, Styled
 
 class GlobalType(Enum):
@@ -17,11 +18,8 @@ class GlobalType(Enum):
     CLASS_METHOD = "class method"
     LOCAL_CLASS_ID = "local class identifier"
 
-class ErrorSrc:
-    src = [""]
-
 # base abstract class for all error types
-class SemanticError:
+class SemanticError(ErrorSource):
     @abstractmethod
     def __str__(self) -> str: ...
     @abstractmethod
@@ -50,22 +48,22 @@ class DuplicateDefinitionError(SemanticError):
         max_pad = max(len(index_str), len(dupe_index))
         og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
         error_range = 1 if self.duplicate.end_position is None else self.duplicate.end_position[1] - self.duplicate.position[1] + 1
-        og_border = len(ErrorSrc.src[self.original.position[0]]) + len(str(self.original.position[0] + 1))
-        dupe_border = len(ErrorSrc.src[self.duplicate.position[0]]) + len(str(self.duplicate.position[0] + 1))
+        og_border = len(self.src[self.original.position[0]]) + len(str(self.original.position[0] + 1))
+        dupe_border = len(self.src[self.duplicate.position[0]]) + len(str(self.duplicate.position[0] + 1))
         border = f"\t{'_' * (max(og_border, dupe_border) + max_pad + 2)}\n"
         msg = f"Duplicate {'' if self.original else 'bulitin '}{self.original_type}: {self.duplicate}\n"
         msg += border
         if self.original:
             msg += f"\t{' ' * max_pad} | \t"
             msg += f'Original {self.original_type} definition\n'
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
         line = '|' if self.original else ''
         msg += f"\t{' ' * max_pad} | {line}\t"
         msg += f"tried to redefine as {('another ' if self.duplicate_type == self.original_type else '')}{self.duplicate_type}\n"
-        msg += f"\t{dupe_index:{max_pad}} | {line}{ErrorSrc.src[self.duplicate.position[0]]}\n"
+        msg += f"\t{dupe_index:{max_pad}} | {line}{self.src[self.duplicate.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {line}{' ' * self.duplicate.position[1]}{'^' * (error_range)}\n"
         if self.original: msg += f"\t{' ' * max_pad} | |{'_' * (self.duplicate.position[1])}|\n"
         msg += border
@@ -78,8 +76,8 @@ class DuplicateDefinitionError(SemanticError):
         og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
         error_range = 1 if self.duplicate.end_position is None else self.duplicate.end_position[1] - self.duplicate.position[1] + 1
 
-        og_border = len(ErrorSrc.src[self.original.position[0]]) + len(str(self.original.position[0] + 1))
-        dupe_border = len(ErrorSrc.src[self.duplicate.position[0]]) + len(str(self.duplicate.position[0] + 1))
+        og_border = len(self.src[self.original.position[0]]) + len(str(self.original.position[0] + 1))
+        dupe_border = len(self.src[self.duplicate.position[0]]) + len(str(self.duplicate.position[0] + 1))
         border = f"\t{'_' * (max(og_border, dupe_border) + max_pad + 2)}\n"
 
         msg = f"Duplicate {'' if self.original else 'bulitin '}{self.original_type}: {self.duplicate}\n"
@@ -89,7 +87,7 @@ class DuplicateDefinitionError(SemanticError):
             msg += Styled.sprintln(
                 f'Original {self.original_type} definition',
                 color=AnsiColor.GREEN)
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
@@ -99,7 +97,7 @@ class DuplicateDefinitionError(SemanticError):
         msg += Styled.sprintln(
             f"tried to redefine as {('another ' if self.duplicate_type == self.original_type else '')}{self.duplicate_type}",
             color=AnsiColor.RED)
-        msg += f"\t{dupe_index:{max_pad}} | {line}{ErrorSrc.src[self.duplicate.position[0]]}\n"
+        msg += f"\t{dupe_index:{max_pad}} | {line}{self.src[self.duplicate.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {line}{' ' * self.duplicate.position[1]}{'^' * (error_range)}\n"
         if self.original: msg += f"\t{' ' * max_pad} | |{'_' * (self.duplicate.position[1])}|\n"
         msg += border
@@ -122,7 +120,7 @@ class FnUsedAsVar(SemanticError):
         index_str = str(self.original.position[0] + 1) if self.original else ""
         assign_index = str(self.usage.position[0] + 1)
         max_pad = max(len(index_str), len(assign_index))
-        max_len = max((len(ErrorSrc.src[self.original.position[0]] if self.original else ''), len(ErrorSrc.src[self.usage.position[0]])))
+        max_len = max((len(self.src[self.original.position[0]] if self.original else ''), len(self.src[self.usage.position[0]])))
         border = f"\t{'_' * ( max_len + 4 + max_pad)}\n"
         if self.original:
             og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
@@ -137,14 +135,14 @@ class FnUsedAsVar(SemanticError):
         if self.original:
             msg += f"\t{' ' * max_pad} | \t"
             msg += f'Original {global_type} definition\n'
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
 
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}\t"
         msg += f"'{name}' is a {global_type} and cannot be used as a value without calling it\n"
-        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{ErrorSrc.src[self.usage.position[0]]}\n"
+        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{self.src[self.usage.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}{' ' * self.usage.position[1]}{'^' * (error_range)}\n"
         if self.original:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.usage.position[1])}|\n"
@@ -155,7 +153,7 @@ class FnUsedAsVar(SemanticError):
         index_str = str(self.original.position[0] + 1) if self.original else ""
         assign_index = str(self.usage.position[0] + 1)
         max_pad = max(len(index_str), len(assign_index))
-        max_len = max((len(ErrorSrc.src[self.original.position[0]] if self.original else ''), len(ErrorSrc.src[self.usage.position[0]])))
+        max_len = max((len(self.src[self.original.position[0]] if self.original else ''), len(self.src[self.usage.position[0]])))
         border = f"\t{'_' * ( max_len + 4 + max_pad)}\n"
         if self.original:
             og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
@@ -172,7 +170,7 @@ class FnUsedAsVar(SemanticError):
             msg += Styled.sprintln(
                 f'Original {global_type} definition',
                 color=AnsiColor.GREEN)
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
@@ -181,7 +179,7 @@ class FnUsedAsVar(SemanticError):
         msg += Styled.sprintln(
             f"'{name}' is a {'' if self.original else 'builtin '}{global_type} and cannot be used as a value without calling it",
             color=AnsiColor.RED)
-        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{ErrorSrc.src[self.usage.position[0]]}\n"
+        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{self.src[self.usage.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}{' ' * self.usage.position[1]}{'^' * (error_range)}\n"
         if self.original:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.usage.position[1])}|\n"
@@ -203,20 +201,20 @@ class NonFunctionIdCall(SemanticError):
         index_str = str(self.original.position[0] + 1)
         dupe_index = str(self.called.position[0] + 1)
         max_pad = max(len(index_str), len(dupe_index))
-        border = f"\t{'_' * (len(ErrorSrc.src[self.original.position[0]]) + len(str(self.original.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.original.position[0]]) + len(str(self.original.position[0] + 1)) + max_pad)}\n"
         og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
         error_range = 1 if self.called.end_position is None else self.called.end_position[1] - self.called.position[1] + 1
         msg = f"Non Function Called: {self.called}\n"
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg += f'Original identifier definition\n'
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
         msg += f"\t{' ' * max_pad} | |\t"
         msg += f"Tried to call '{self.called}' as a function\n"
-        msg += f"\t{dupe_index:{max_pad}} | |{ErrorSrc.src[self.called.position[0]]}\n"
+        msg += f"\t{dupe_index:{max_pad}} | |{self.src[self.called.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.called.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.called.position[1])}|\n"
         msg += border
@@ -226,7 +224,7 @@ class NonFunctionIdCall(SemanticError):
         index_str = str(self.original.position[0] + 1)
         dupe_index = str(self.called.position[0] + 1)
         max_pad = max(len(index_str), len(dupe_index))
-        border = f"\t{'_' * (len(ErrorSrc.src[self.original.position[0]]) + len(str(self.original.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.original.position[0]]) + len(str(self.original.position[0] + 1)) + max_pad)}\n"
         og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
         error_range = 1 if self.called.end_position is None else self.called.end_position[1] - self.called.position[1] + 1
 
@@ -236,7 +234,7 @@ class NonFunctionIdCall(SemanticError):
         msg += Styled.sprintln(
             f'Original identifier definition',
             color=AnsiColor.GREEN)
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
@@ -245,7 +243,7 @@ class NonFunctionIdCall(SemanticError):
         msg += Styled.sprintln(
             f"Tried to call '{self.called}' as a function",
             color=AnsiColor.RED)
-        msg += f"\t{dupe_index:{max_pad}} | |{ErrorSrc.src[self.called.position[0]]}\n"
+        msg += f"\t{dupe_index:{max_pad}} | |{self.src[self.called.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.called.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.called.position[1])}|\n"
         msg += border
@@ -267,7 +265,7 @@ class FunctionAssignmentError(SemanticError):
         index_str = str(self.original.position[0] + 1) if self.original else ""
         assign_index = str(self.assignment.position[0] + 1)
         max_pad = max(len(index_str), len(assign_index))
-        max_len = max((len(ErrorSrc.src[self.original.position[0]] if self.original else ''), len(ErrorSrc.src[self.assignment.position[0]])))
+        max_len = max((len(self.src[self.original.position[0]] if self.original else ''), len(self.src[self.assignment.position[0]])))
         border = f"\t{'_' * ( max_len + 4 + max_pad)}\n"
         if self.original:
             og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
@@ -282,14 +280,14 @@ class FunctionAssignmentError(SemanticError):
         if self.original:
             msg += f"\t{' ' * max_pad} | \t"
             msg += f'Original {global_type} definition\n'
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
 
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}\t"
         msg += f"'{name}' is a {global_type} and cannot be assigned to\n"
-        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{ErrorSrc.src[self.assignment.position[0]]}\n"
+        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{self.src[self.assignment.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}{' ' * self.assignment.position[1]}{'^' * (error_range)}\n"
         if self.original:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.assignment.position[1])}|\n"
@@ -300,7 +298,7 @@ class FunctionAssignmentError(SemanticError):
         index_str = str(self.original.position[0] + 1) if self.original else ""
         assign_index = str(self.assignment.position[0] + 1)
         max_pad = max(len(index_str), len(assign_index))
-        max_len = max((len(ErrorSrc.src[self.original.position[0]] if self.original else ''), len(ErrorSrc.src[self.assignment.position[0]])))
+        max_len = max((len(self.src[self.original.position[0]] if self.original else ''), len(self.src[self.assignment.position[0]])))
         border = f"\t{'_' * ( max_len + 4 + max_pad)}\n"
         if self.original:
             og_range = 1 if self.original.end_position is None else self.original.end_position[1] - self.original.position[1] + 1
@@ -317,7 +315,7 @@ class FunctionAssignmentError(SemanticError):
             msg += Styled.sprintln(
                 f'Original {global_type} definition',
                 color=AnsiColor.GREEN)
-            msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.original.position[0]]}\n"
+            msg += f"\t{index_str:{max_pad}} | {self.src[self.original.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.original.position[1]}{'^' * (og_range)}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.original.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
@@ -326,7 +324,7 @@ class FunctionAssignmentError(SemanticError):
         msg += Styled.sprintln(
             f"'{name}' is a {'' if self.original else 'builtin '}{global_type} and cannot be assigned to",
             color=AnsiColor.RED)
-        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{ErrorSrc.src[self.assignment.position[0]]}\n"
+        msg += f"\t{assign_index:{max_pad}} | {'|' if self.original else ''}{self.src[self.assignment.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.original else ''}{' ' * self.assignment.position[1]}{'^' * (error_range)}\n"
         if self.original:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.assignment.position[1])}|\n"
@@ -347,13 +345,13 @@ class UndefinedError(SemanticError):
     def string(self) -> str:
         index_str = str(self.token.position[0] + 1)
         max_pad = len(index_str)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.token.position[0]]) + len(str(self.token.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.token.position[0]]) + len(str(self.token.position[0] + 1)) + max_pad)}\n"
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
         msg = f"Undefined {self.gtype}: {self.token}\n"
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg += f'Undefined {self.gtype}\n'
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += border
         return msg
@@ -361,7 +359,7 @@ class UndefinedError(SemanticError):
     def __str__(self):
         index_str = str(self.token.position[0] + 1)
         max_pad = len(index_str)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.token.position[0]]) + len(str(self.token.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.token.position[0]]) + len(str(self.token.position[0] + 1)) + max_pad)}\n"
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
 
         msg = f"Undefined {self.gtype}: {self.token}\n"
@@ -370,12 +368,12 @@ class UndefinedError(SemanticError):
         msg += Styled.sprintln(
             f'Undefined {self.gtype}',
             color=AnsiColor.RED)
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += border
         return msg
 
-class ReassignedConstantError:
+class ReassignedConstantError(ErrorSource):
     def __init__(self, token: Token, defined_token: Token,
                  header: str, token_msg: str):
         self.token = token
@@ -393,7 +391,7 @@ class ReassignedConstantError:
         index_str = str(self.token.position[0] + 1)
         defined_index = str(self.defined_token.position[0] + 1)
         max_pad = max(len(index_str), len(defined_index))
-        max_len = len(max(ErrorSrc.src[self.token.position[0]], ErrorSrc.src[self.defined_token.position[0]], key=len))
+        max_len = len(max(self.src[self.token.position[0]], self.src[self.defined_token.position[0]], key=len))
         border = f"\t{'_' * (max_len + max_pad + 4)}\n"
         defined_range = 1 if self.defined_token.end_position is None else self.defined_token.end_position[1] - self.defined_token.position[1] + 1
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
@@ -401,13 +399,13 @@ class ReassignedConstantError:
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg +="Defined as constant here\n"
-        msg += f"\t{defined_index:{max_pad}} | {ErrorSrc.src[self.defined_token.position[0]]}\n"
+        msg += f"\t{defined_index:{max_pad}} | {self.src[self.defined_token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.defined_token.position[1]}{'^' * (defined_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.defined_token.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
         msg += f"\t{' ' * max_pad} | |\t"
         msg += self.msg
-        msg += f"\n\t{index_str:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\n\t{index_str:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
         msg += border
@@ -417,7 +415,7 @@ class ReassignedConstantError:
         index_str = str(self.token.position[0] + 1)
         defined_index = str(self.defined_token.position[0] + 1)
         max_pad = max(len(index_str), len(defined_index))
-        max_len = len(max(ErrorSrc.src[self.token.position[0]], ErrorSrc.src[self.defined_token.position[0]], key=len))
+        max_len = len(max(self.src[self.token.position[0]], self.src[self.defined_token.position[0]], key=len))
         border = f"\t{'_' * (max_len + max_pad + 4)}\n"
         defined_range = 1 if self.defined_token.end_position is None else self.defined_token.end_position[1] - self.defined_token.position[1] + 1
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
@@ -429,7 +427,7 @@ class ReassignedConstantError:
             "Defined as constant here",
             color=AnsiColor.GREEN
         )
-        msg += f"\t{defined_index:{max_pad}} | {ErrorSrc.src[self.defined_token.position[0]]}\n"
+        msg += f"\t{defined_index:{max_pad}} | {self.src[self.defined_token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.defined_token.position[1]}{'^' * (defined_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.defined_token.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
@@ -439,7 +437,7 @@ class ReassignedConstantError:
             self.msg,
             color=AnsiColor.RED
         )
-        msg += f"\t{index_str:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
         msg += border
@@ -461,14 +459,14 @@ class ReturnTypeMismatchError(SemanticError):
     def string(self) -> str:
         expected_index = str(self.expected.position[0] + 1)
         max_pad = max(len(expected_index), 3)
-        expected_pad = len(ErrorSrc.src[self.expected.position[0]]) + max_pad + 3
+        expected_pad = len(self.src[self.expected.position[0]]) + max_pad + 3
         actual_pad = 17 + len(self.return_stmt.expr.flat_string()) + max_pad
         border = f"\t{'_' * max(expected_pad, actual_pad)}\n"
         msg = f"Return Type Mismatch: expected '{self.expected.flat_string()}' but got '{self.actual_type.flat_string()}'\n"
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg += f"Expected return type: '{self.expected}'\n"
-        msg += f"\t{expected_index:{max_pad}} | {ErrorSrc.src[self.expected.position[0]]}\n"
+        msg += f"\t{expected_index:{max_pad}} | {self.src[self.expected.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.expected.position[1]}{'^' * (len(self.expected.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.expected.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
@@ -483,7 +481,7 @@ class ReturnTypeMismatchError(SemanticError):
     def __str__(self):
         expected_index = str(self.expected.position[0] + 1)
         max_pad = max(len(expected_index), 3)
-        expected_pad = len(ErrorSrc.src[self.expected.position[0]]) + max_pad + 3
+        expected_pad = len(self.src[self.expected.position[0]]) + max_pad + 3
         actual_pad = 17 + len(self.return_stmt.expr.flat_string()) + max_pad
         border = f"\t{'_' * max(expected_pad, actual_pad)}\n"
 
@@ -495,7 +493,7 @@ class ReturnTypeMismatchError(SemanticError):
             f"Expected return type: '{self.expected}'",
             color=AnsiColor.GREEN,
         )
-        msg += f"\t{expected_index:{max_pad}} | {ErrorSrc.src[self.expected.position[0]]}\n"
+        msg += f"\t{expected_index:{max_pad}} | {self.src[self.expected.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.expected.position[1]}{'^' * (len(self.expected.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.expected.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
@@ -532,12 +530,12 @@ class TypeMismatchError(SemanticError):
         index_str = str(self.expected.position[0] + 1)
         assign_index_str = (str(extract_id(self.context.id).position[0] + 1) + '..n') if self.title else 'rhs'
         max_pad = max(len(index_str), len(assign_index_str))
-        border = f"\t{'_' * (len(ErrorSrc.src[self.expected.position[0]]) + len(str(self.expected.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.expected.position[0]]) + len(str(self.expected.position[0] + 1)) + max_pad)}\n"
         msg = f"{self.title} Type Mismatch: expected '{self.expected.flat_string()}' but got '{self.actual_type.flat_string()}'\n"
         msg += border
         msg += f"\t{' ' * max_pad} |    "
         msg += f"Expected type defined here\n"
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.expected.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.expected.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.expected.position[1]}{'^' * (len(self.expected.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.expected.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |  "
@@ -553,7 +551,7 @@ class TypeMismatchError(SemanticError):
         index_str = str(self.expected.position[0] + 1)
         assign_index_str = (str(extract_id(self.context.id).position[0] + 1) + '..n') if self.title else 'rhs'
         max_pad = max(len(index_str), len(assign_index_str))
-        border = f"\t{'_' * (len(ErrorSrc.src[self.expected.position[0]]) + len(str(self.expected.position[0] + 1)) + max_pad)}\n"
+        border = f"\t{'_' * (len(self.src[self.expected.position[0]]) + len(str(self.expected.position[0] + 1)) + max_pad)}\n"
 
         dtype = f"'{self.expected.to_unit_type().flat_string()}'" if self.indexing else f"'{self.expected.flat_string()}'"
         msg = f"{self.title} Type Mismatch: expected {dtype} but got '{self.actual_type.flat_string()}'\n"
@@ -564,7 +562,7 @@ class TypeMismatchError(SemanticError):
             f"Expected type defined here",
             color=AnsiColor.GREEN,
         )
-        msg += f"\t{index_str:{max_pad}} | {ErrorSrc.src[self.expected.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | {self.src[self.expected.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.expected.position[1]}{'^' * (len(self.expected.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.expected.position[1])}|\n"
 
@@ -600,14 +598,14 @@ class PrePostFixOperandError(SemanticError):
         op_index = str(self.op.position[0] + 1)
         def_index = str(self.val_definition.position[0] if self.val_definition else 0 + 1)
         max_pad = max(len(op_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.val_definition.position[0]]) if self.val_definition else 0 + max_pad + 3, len(self.val.flat_string()) + 7 + max_pad)
+        max_len = max(len(self.src[self.val_definition.position[0]]) if self.val_definition else 0 + max_pad + 3, len(self.val.flat_string()) + 7 + max_pad)
         border = f"\t{'_' * max_len}\n"
         msg = f"Non-Math {'Prefix' if not self.postfix else 'Postfix'} Operator: '{self.val.flat_string()}'\n"
         msg += border
         if self.val_definition:
             msg += f"\t{' ' * max_pad} | \t"
             msg += f"Expected type defined here\n"
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.val_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.val_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.val_definition.position[1]}{'^' * (len(self.val_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.val_definition.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.val_definition else ''}" "\t"
@@ -623,7 +621,7 @@ class PrePostFixOperandError(SemanticError):
         op_index = str(self.op.position[0] + 1)
         def_index = str(self.val_definition.position[0] if self.val_definition else 0 + 1)
         max_pad = max(len(op_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.val_definition.position[0]]) if self.val_definition else 0 + max_pad + 3, len(self.val.flat_string()) + 7 + max_pad)
+        max_len = max(len(self.src[self.val_definition.position[0]]) if self.val_definition else 0 + max_pad + 3, len(self.val.flat_string()) + 7 + max_pad)
         border = f"\t{'_' * max_len}\n"
 
         msg = f"Non-Math {'Prefix' if not self.postfix else 'Postfix'} Operator: '{self.val.flat_string()}'\n"
@@ -635,7 +633,7 @@ class PrePostFixOperandError(SemanticError):
                 f"Expected type defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.val_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.val_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.val_definition.position[1]}{'^' * (len(self.val_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.val_definition.position[1])}|\n"
 
@@ -671,8 +669,8 @@ class InfixOperandError(SemanticError):
     def string(self) -> str:
         op_str = str(self.op.position[0] + 1)
         expr_len = 5 + len(self.left.flat_string()) + len(self.op.flat_string()) + len(self.right.flat_string())
-        left_def_len = (3 + len(ErrorSrc.src[self.left_definition.position[0]])) if self.left_definition else 0
-        right_def_len = (3 + len(ErrorSrc.src[self.right_definition.position[0]])) if self.right_definition else 0
+        left_def_len = (3 + len(self.src[self.left_definition.position[0]])) if self.left_definition else 0
+        right_def_len = (3 + len(self.src[self.right_definition.position[0]])) if self.right_definition else 0
         max_len = max(expr_len, left_def_len, right_def_len)
         max_pad = max(len(op_str), len(str(self.left_definition.position[0])) if self.left_definition else 0,
                       len(str(self.right_definition.position[0])) if self.right_definition else 0)
@@ -687,7 +685,7 @@ class InfixOperandError(SemanticError):
             lhs_index = str(self.left_definition.position[0] + 1)
             msg += f"\n\t{' ' * max_pad} | \t"
             msg += f"Left value defined here\n"
-            msg += f"\t{lhs_index:{max_pad}} | {ErrorSrc.src[self.left_definition.position[0]]}\n"
+            msg += f"\t{lhs_index:{max_pad}} | {self.src[self.left_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.left_definition.position[1]}{'^' * (len(self.left_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.left_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |"
@@ -706,7 +704,7 @@ class InfixOperandError(SemanticError):
             rhs_index = str(self.right_definition.position[0] + 1)
             msg += f"\n\t{' ' * max_pad} | \t"
             msg += f"Right value defined here\n"
-            msg += f"\t{rhs_index:{max_pad}} | {ErrorSrc.src[self.right_definition.position[0]]}\n"
+            msg += f"\t{rhs_index:{max_pad}} | {self.src[self.right_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.right_definition.position[1]}{'^' * (len(self.right_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.right_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |"
@@ -725,8 +723,8 @@ class InfixOperandError(SemanticError):
     def __str__(self):
         op_str = str(self.op.position[0] + 1)
         expr_len = 5 + len(self.left.flat_string()) + len(self.op.flat_string()) + len(self.right.flat_string())
-        left_def_len = (3 + len(ErrorSrc.src[self.left_definition.position[0]])) if self.left_definition else 0
-        right_def_len = (3 + len(ErrorSrc.src[self.right_definition.position[0]])) if self.right_definition else 0
+        left_def_len = (3 + len(self.src[self.left_definition.position[0]])) if self.left_definition else 0
+        right_def_len = (3 + len(self.src[self.right_definition.position[0]])) if self.right_definition else 0
         max_len = max(expr_len, left_def_len, right_def_len)
         max_pad = max(len(op_str), len(str(self.left_definition.position[0])) if self.left_definition else 0,
                       len(str(self.right_definition.position[0])) if self.right_definition else 0)
@@ -745,7 +743,7 @@ class InfixOperandError(SemanticError):
                 f"Left value defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{lhs_index:{max_pad}} | {ErrorSrc.src[self.left_definition.position[0]]}\n"
+            msg += f"\t{lhs_index:{max_pad}} | {self.src[self.left_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.left_definition.position[1]}{'^' * (len(self.left_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.left_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |"
@@ -770,7 +768,7 @@ class InfixOperandError(SemanticError):
                 f"Right value defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{rhs_index:{max_pad}} | {ErrorSrc.src[self.right_definition.position[0]]}\n"
+            msg += f"\t{rhs_index:{max_pad}} | {self.src[self.right_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.right_definition.position[1]}{'^' * (len(self.right_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.right_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |"
@@ -806,19 +804,19 @@ class NonIterableIndexingError(SemanticError):
         tok_index = str(self.token.position[0] + 1)
         def_index = str(self.type_definition.position[0] + 1)
         max_pad = max(len(tok_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.token.position[0]]), len(ErrorSrc.src[self.type_definition.position[0]]))
+        max_len = max(len(self.src[self.token.position[0]]), len(self.src[self.type_definition.position[0]]))
         border = f"\t{'_' * (max_len + 3 + max_pad)}\n"
         msg = f"Non Iterable Indexing: '{self.usage}'\n"
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg += f"Actual type defined here\n"
-        msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.type_definition.position[0]]}\n"
+        msg += f"\t{def_index:{max_pad}} | {self.src[self.type_definition.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.type_definition.position[1]}{'^' * (len(self.type_definition.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.type_definition.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
         msg += f"\t{' ' * max_pad} | |\t"
         msg += f"Tried to index into a non iterable of type: '{self.token_type}'\n"
-        msg += f"\t{tok_index:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{tok_index:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (len(self.token.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
         msg += border
@@ -828,7 +826,7 @@ class NonIterableIndexingError(SemanticError):
         tok_index = str(self.token.position[0] + 1)
         def_index = str(self.type_definition.position[0] + 1)
         max_pad = max(len(tok_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.token.position[0]]), len(ErrorSrc.src[self.type_definition.position[0]]))
+        max_len = max(len(self.src[self.token.position[0]]), len(self.src[self.type_definition.position[0]]))
         border = f"\t{'_' * (max_len + 3 + max_pad)}\n"
 
         msg = f"Non Iterable Indexing: '{self.usage}'\n"
@@ -838,7 +836,7 @@ class NonIterableIndexingError(SemanticError):
             f"Actual type defined here",
             color=AnsiColor.GREEN,
         )
-        msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.type_definition.position[0]]}\n"
+        msg += f"\t{def_index:{max_pad}} | {self.src[self.type_definition.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.type_definition.position[1]}{'^' * (len(self.type_definition.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.type_definition.position[1])}|\n"
 
@@ -848,7 +846,7 @@ class NonIterableIndexingError(SemanticError):
             f"Tried to index into a non iterable of type: '{self.token_type}'",
             color=AnsiColor.RED
         )
-        msg += f"\t{tok_index:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{tok_index:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (len(self.token.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
 
@@ -872,14 +870,14 @@ class NonClassAccessError(SemanticError):
         id_index = str(self.id.position[0] + 1)
         def_index = str(self.id_definition.position[0] + 1) if self.id_definition else "0"
         max_pad = max(len(id_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.id.position[0]]), len(ErrorSrc.src[self.id_definition.position[0]]) if self.id_definition else 0)
+        max_len = max(len(self.src[self.id.position[0]]), len(self.src[self.id_definition.position[0]]) if self.id_definition else 0)
         border = f"\t{'_' * (max_len + 4 + max_pad)}\n"
         msg = f"Non Class Access: '{self.usage}'\n"
         msg += border
         if self.id_definition:
             msg += f"\t{' ' * max_pad} | \t"
             msg += f"Actual type defined here\n"
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.id_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.id_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.id_definition.position[1]}{'^' * (len(self.id_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.id_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
@@ -888,7 +886,7 @@ class NonClassAccessError(SemanticError):
             msg += f"Tried to do an access using a non class" f" of type: '{self.id_definition.token}'\n" if self.id_definition else "\n"
         else:
             msg += f"Tried to do an access using an uninitialized " f"'{self.id_definition.token}'\n" if self.id_definition else "variable/constant\n"
-        msg += f"\t{id_index:{max_pad}} | " f"{'|' if self.id_definition else ' '}" f"{ErrorSrc.src[self.id.position[0]]}\n"
+        msg += f"\t{id_index:{max_pad}} | " f"{'|' if self.id_definition else ' '}" f"{self.src[self.id.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.id_definition else ' '}" f"{' ' * self.id.position[1]}{'^' * (len(self.id.flat_string()))}\n"
         if self.id_definition:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.id.position[1])}|\n"
@@ -899,7 +897,7 @@ class NonClassAccessError(SemanticError):
         id_index = str(self.id.position[0] + 1)
         def_index = str(self.id_definition.position[0] + 1) if self.id_definition else "0"
         max_pad = max(len(id_index), len(def_index))
-        max_len = max(len(ErrorSrc.src[self.id.position[0]]), len(ErrorSrc.src[self.id_definition.position[0]]) if self.id_definition else 0)
+        max_len = max(len(self.src[self.id.position[0]]), len(self.src[self.id_definition.position[0]]) if self.id_definition else 0)
         border = f"\t{'_' * (max_len + 4 + max_pad)}\n"
 
         msg = f"Non Class Access: '{self.usage}'\n"
@@ -910,7 +908,7 @@ class NonClassAccessError(SemanticError):
                 f"Actual type defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.id_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.id_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.id_definition.position[1]}{'^' * (len(self.id_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.id_definition.position[1])}|\n"
 
@@ -928,7 +926,7 @@ class NonClassAccessError(SemanticError):
                 color=AnsiColor.RED
             )
 
-        msg += f"\t{id_index:{max_pad}} | " f"{'|' if self.id_definition else ' '}" f"{ErrorSrc.src[self.id.position[0]]}\n"
+        msg += f"\t{id_index:{max_pad}} | " f"{'|' if self.id_definition else ' '}" f"{self.src[self.id.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.id_definition else ' '}" f"{' ' * self.id.position[1]}{'^' * (len(self.id.flat_string()))}\n"
         if self.id_definition:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.id.position[1])}|\n"
@@ -953,19 +951,19 @@ class UndefinedClassMember(SemanticError):
     def string(self) -> str:
         property_index = str(self.property.position[0] + 1)
         max_pad = len(property_index)
-        border = f"\t{'_' * (max_pad + 4 + len(ErrorSrc.src[self.property.position[0]]))}\n"
+        border = f"\t{'_' * (max_pad + 4 + len(self.src[self.property.position[0]]))}\n"
         msg = f"Undefined {self.member_type} of '{self.cwass}': '{self.property.flat_string()}'\n"
         msg += border
         if self.actual_type and self.actual_definition.exists():
             msg += f"\t{' ' * max_pad} |\t"
             msg += f"'{self.property.flat_string()}' is a {self.actual_type} of '{self.cwass}' defined here\n"
-            msg += f"\t{str(self.actual_definition.position[0] + 1):{max_pad}} | {ErrorSrc.src[self.actual_definition.position[0]]}\n"
+            msg += f"\t{str(self.actual_definition.position[0] + 1):{max_pad}} | {self.src[self.actual_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.actual_definition.position[1]}{'^' * (len(self.actual_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.actual_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.actual_definition.exists() else ''}" "\t"
         msg += f"'{self.property.flat_string()}' is not a {self.member_type} of '{self.cwass}'\n"
-        msg += f"\t{property_index:{max_pad}} | " f"{'|' if self.actual_definition.exists() else ''}" f"{ErrorSrc.src[self.property.position[0]]}\n"
+        msg += f"\t{property_index:{max_pad}} | " f"{'|' if self.actual_definition.exists() else ''}" f"{self.src[self.property.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.actual_definition.exists() else ''}" f"{' ' * self.property.position[1]}{'^' * (len(self.property.flat_string()))}\n"
         if self.actual_type and self.actual_definition.exists():
             msg += f"\t{' ' * max_pad} | |{'_' * (self.property.position[1])}|\n"
@@ -975,7 +973,7 @@ class UndefinedClassMember(SemanticError):
     def __str__(self):
         property_index = str(self.property.position[0] + 1)
         max_pad = len(property_index)
-        border = f"\t{'_' * (max_pad + 4 + len(ErrorSrc.src[self.property.position[0]]))}\n"
+        border = f"\t{'_' * (max_pad + 4 + len(self.src[self.property.position[0]]))}\n"
 
         msg = f"Undefined {self.member_type} of '{self.cwass}': '{self.property.flat_string()}'\n"
         msg += border
@@ -985,7 +983,7 @@ class UndefinedClassMember(SemanticError):
                 f"'{self.property.flat_string()}' is a {self.actual_type} of '{self.cwass}' defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{str(self.actual_definition.position[0] + 1):{max_pad}} | {ErrorSrc.src[self.actual_definition.position[0]]}\n"
+            msg += f"\t{str(self.actual_definition.position[0] + 1):{max_pad}} | {self.src[self.actual_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.actual_definition.position[1]}{'^' * (len(self.actual_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.actual_definition.position[1])}|\n"
             msg += f"\t{' ' * max_pad} | |\n"
@@ -995,7 +993,7 @@ class UndefinedClassMember(SemanticError):
             f"'{self.property.flat_string()}' is not a {self.member_type} of '{self.cwass}'",
             color=AnsiColor.RED
         )
-        msg += f"\t{property_index:{max_pad}} | " f"{'|' if self.actual_definition.exists() else ''}" f"{ErrorSrc.src[self.property.position[0]]}\n"
+        msg += f"\t{property_index:{max_pad}} | " f"{'|' if self.actual_definition.exists() else ''}" f"{self.src[self.property.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | " f"{'|' if self.actual_definition.exists() else ''}" f"{' ' * self.property.position[1]}{'^' * (len(self.property.flat_string()))}\n"
         if self.actual_type and self.actual_definition.exists():
             msg += f"\t{' ' * max_pad} | |{'_' * (self.property.position[1])}|\n"
@@ -1025,7 +1023,7 @@ class MismatchedCallArgType(SemanticError):
         id_index = str(self.id.position[0] + 1)
         def_index = str(self.id_definition.position[0] + 1) if self.id_definition else ""
         max_pad = max(len(id_index), len(def_index))
-        max_len = max([len(arg.flat_string()) for arg in self.args] + [len(ErrorSrc.src[self.id.position[0]]), len(ErrorSrc.src[self.id_definition.position[0]]) if self.id_definition else 0])
+        max_len = max([len(arg.flat_string()) for arg in self.args] + [len(self.src[self.id.position[0]]), len(self.src[self.id_definition.position[0]]) if self.id_definition else 0])
         border = f"\t{'_' * (max_pad + 4 + max_len)}\n"
 
         msg = f"Call arg type mismatch:\n"
@@ -1033,14 +1031,14 @@ class MismatchedCallArgType(SemanticError):
         if self.id_definition:
             msg += f"\t{' ' * max_pad} |\t"
             msg += f"'{self.call_str}()' {self.global_type} defined here\n"
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.id_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.id_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.id_definition.position[1]}{'^' * (len(self.id_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.id_definition.position[1])}|\n"
 
         msg += f"\t{' ' * max_pad} | {'|' if self.id_definition else ''}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.id_definition else ''}\t"
         msg += f"'{self.call_str}()' called here\n"
-        msg += f"\t{id_index:{max_pad}} | {'|' if self.id_definition else ''}{ErrorSrc.src[self.id.position[0]]}\n"
+        msg += f"\t{id_index:{max_pad}} | {'|' if self.id_definition else ''}{self.src[self.id.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.id_definition else ''}{' ' * self.id.position[1]}{'^' * (len(self.id.flat_string()))}\n"
         if self.id_definition:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.id.position[1])}|\n"
@@ -1093,7 +1091,7 @@ class MismatchedCallArgType(SemanticError):
         id_index = str(self.id.position[0] + 1)
         def_index = str(self.id_definition.position[0] + 1) if self.id_definition else ""
         max_pad = max(len(id_index), len(def_index))
-        max_len = max([len(arg.flat_string()) for arg in self.args] + [len(ErrorSrc.src[self.id.position[0]]), len(ErrorSrc.src[self.id_definition.position[0]]) if self.id_definition else 0])
+        max_len = max([len(arg.flat_string()) for arg in self.args] + [len(self.src[self.id.position[0]]), len(self.src[self.id_definition.position[0]]) if self.id_definition else 0])
         border = f"\t{'_' * (max_pad + 4 + max_len)}\n"
 
         msg = f"Call arg type mismatch:\n"
@@ -1104,7 +1102,7 @@ class MismatchedCallArgType(SemanticError):
                 f"'{self.call_str}()' {self.global_type} defined here",
                 color=AnsiColor.GREEN,
             )
-            msg += f"\t{def_index:{max_pad}} | {ErrorSrc.src[self.id_definition.position[0]]}\n"
+            msg += f"\t{def_index:{max_pad}} | {self.src[self.id_definition.position[0]]}\n"
             msg += f"\t{' ' * max_pad} | {' ' * self.id_definition.position[1]}{'^' * (len(self.id_definition.flat_string()))}\n"
             msg += f"\t{' ' * max_pad} | {'_' * (self.id_definition.position[1])}|\n"
 
@@ -1114,7 +1112,7 @@ class MismatchedCallArgType(SemanticError):
             f"'{self.call_str}()' called here",
             color=AnsiColor.RED
         )
-        msg += f"\t{id_index:{max_pad}} | {'|' if self.id_definition else ''}{ErrorSrc.src[self.id.position[0]]}\n"
+        msg += f"\t{id_index:{max_pad}} | {'|' if self.id_definition else ''}{self.src[self.id.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {'|' if self.id_definition else ''}{' ' * self.id.position[1]}{'^' * (len(self.id.flat_string()))}\n"
         if self.id_definition:
             msg += f"\t{' ' * max_pad} | |{'_' * (self.id.position[1])}|\n"
@@ -1258,7 +1256,7 @@ class NoReturnStatement(SemanticError):
         last_stmt = final_statement(self.func.body) + 1
         rtype_index_str = str(self.func.rtype.position[0] + 1)
         max_pad = max(len(rtype_index_str), 4)
-        max_len = max(len(ErrorSrc.src[self.func.rtype.position[0]]), len(ErrorSrc.src[last_stmt-1]))
+        max_len = max(len(self.src[self.func.rtype.position[0]]), len(self.src[last_stmt-1]))
         border = f"\t{'_' * (max_len + 3 + max_pad)}\n"
         name = f"{'Function' if not self.cwass else 'Method'}"
         msg = f"{name} '{self.func.id.flat_string() if not self.cwass else (self.cwass+'.'+self.func.id.flat_string())}()' has no return statement:\n"
@@ -1267,14 +1265,14 @@ class NoReturnStatement(SemanticError):
         msg += f"{name}s that don't have return statements implicitly retuwn 'nuww'.\n"
         msg += f"\t{' ' * max_pad} |\t"
         msg += "Return type defined here\n"
-        msg += f"\t{rtype_index_str:{max_pad}} | {ErrorSrc.src[self.func.rtype.position[0]]}\n"
+        msg += f"\t{rtype_index_str:{max_pad}} | {self.src[self.func.rtype.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.func.rtype.position[1]}{'^' * (len(self.func.rtype.flat_string()))}\n"
         msg += f"\t{' ' * max_pad} |\t"
         msg += f"Consider adding a return statement somewhere\n"
         msg += f"\t{' ' * max_pad} |\t"
         msg += f"like after the statement in line {last_stmt}\n"
         default_return = default_rtype(self.func.rtype.token)
-        msg += f"\t{last_stmt:<{max_pad}} |\t\t{ErrorSrc.src[last_stmt-1].strip()}\n"
+        msg += f"\t{last_stmt:<{max_pad}} |\t\t{self.src[last_stmt-1].strip()}\n"
         msg += f"\t{f'...n':<{max_pad}} |\t\twetuwn({default_return})~\n"
         msg += f"\t{' ' * max_pad} |\t\t^^^^^^^^^{'^' * len(default_return)}\n"
         msg += border
@@ -1284,7 +1282,7 @@ class NoReturnStatement(SemanticError):
         last_stmt = final_statement(self.func.body) + 1
         rtype_index_str = str(self.func.rtype.position[0] + 1)
         max_pad = max(len(rtype_index_str), 4)
-        max_len = max(len(ErrorSrc.src[self.func.rtype.position[0]]), len(ErrorSrc.src[last_stmt-1]))
+        max_len = max(len(self.src[self.func.rtype.position[0]]), len(self.src[last_stmt-1]))
         border = f"\t{'_' * (max_len + 3 + max_pad)}\n"
         name = f"{'Function' if not self.cwass else 'Method'}"
 
@@ -1301,7 +1299,7 @@ class NoReturnStatement(SemanticError):
             "Return type defined here",
             color=AnsiColor.GREEN
         )
-        msg += f"\t{rtype_index_str:{max_pad}} | {ErrorSrc.src[self.func.rtype.position[0]]}\n"
+        msg += f"\t{rtype_index_str:{max_pad}} | {self.src[self.func.rtype.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.func.rtype.position[1]}{'^' * (len(self.func.rtype.flat_string()))}\n"
 
         msg += f"\t{' ' * max_pad} |\t"
@@ -1315,7 +1313,7 @@ class NoReturnStatement(SemanticError):
             color=AnsiColor.CYAN
         )
         default_return = default_rtype(self.func.rtype.token)
-        msg += f"\t{last_stmt:<{max_pad}} |\t\t{ErrorSrc.src[last_stmt-1].strip()}\n"
+        msg += f"\t{last_stmt:<{max_pad}} |\t\t{self.src[last_stmt-1].strip()}\n"
         msg += f"\t{f'...n':<{max_pad}} |\t\twetuwn({default_return})~\n"
         msg += f"\t{' ' * max_pad} |\t\t^^^^^^^^^{'^' * len(default_return)}\n"
         msg += border
@@ -1423,7 +1421,7 @@ class SubstringAssignmentError(SemanticError):
         index_str = str(self.token.position[0] + 1)
         defined_index = str(self.defined_token.position[0] + 1)
         max_pad = max(len(index_str), len(defined_index))
-        max_len = len(max(ErrorSrc.src[self.token.position[0]], ErrorSrc.src[self.defined_token.position[0]], key=len))
+        max_len = len(max(self.src[self.token.position[0]], self.src[self.defined_token.position[0]], key=len))
         border = f"\t{'_' * (max_len + max_pad + 4)}\n"
         defined_range = 1 if self.defined_token.end_position is None else self.defined_token.end_position[1] - self.defined_token.position[1] + 1
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
@@ -1431,13 +1429,13 @@ class SubstringAssignmentError(SemanticError):
         msg += border
         msg += f"\t{' ' * max_pad} | \t"
         msg += "Defined here\n"
-        msg += f"\t{defined_index:{max_pad}} | {ErrorSrc.src[self.defined_token.position[0]]}\n"
+        msg += f"\t{defined_index:{max_pad}} | {self.src[self.defined_token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.defined_token.position[1]}{'^' * (defined_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.defined_token.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
         msg += f"\t{' ' * max_pad} | |\t"
         msg += "Tried to assign here\n"
-        msg += f"\t{index_str:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
         msg += f"\t{' ' * max_pad} |\n"
@@ -1456,7 +1454,7 @@ class SubstringAssignmentError(SemanticError):
         index_str = str(self.token.position[0] + 1)
         defined_index = str(self.defined_token.position[0] + 1)
         max_pad = max(len(index_str), len(defined_index))
-        max_len = len(max(ErrorSrc.src[self.token.position[0]], ErrorSrc.src[self.defined_token.position[0]], key=len))
+        max_len = len(max(self.src[self.token.position[0]], self.src[self.defined_token.position[0]], key=len))
         border = f"\t{'_' * (max_len + max_pad + 4)}\n"
         defined_range = 1 if self.defined_token.end_position is None else self.defined_token.end_position[1] - self.defined_token.position[1] + 1
         error_range = 1 if self.token.end_position is None else self.token.end_position[1] - self.token.position[1] + 1
@@ -1468,7 +1466,7 @@ class SubstringAssignmentError(SemanticError):
             "Defined here",
             color=AnsiColor.GREEN
         )
-        msg += f"\t{defined_index:{max_pad}} | {ErrorSrc.src[self.defined_token.position[0]]}\n"
+        msg += f"\t{defined_index:{max_pad}} | {self.src[self.defined_token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | {' ' * self.defined_token.position[1]}{'^' * (defined_range)}\n"
         msg += f"\t{' ' * max_pad} | {'_' * (self.defined_token.position[1])}|\n"
         msg += f"\t{' ' * max_pad} | |\n"
@@ -1478,7 +1476,7 @@ class SubstringAssignmentError(SemanticError):
             "Tried to assign here",
             color=AnsiColor.RED
         )
-        msg += f"\t{index_str:{max_pad}} | |{ErrorSrc.src[self.token.position[0]]}\n"
+        msg += f"\t{index_str:{max_pad}} | |{self.src[self.token.position[0]]}\n"
         msg += f"\t{' ' * max_pad} | |{' ' * self.token.position[1]}{'^' * (error_range)}\n"
         msg += f"\t{' ' * max_pad} | |{'_' * (self.token.position[1])}|\n"
 
@@ -1,7 +1,8 @@
-from copy import deepcopy
+from copy import copy
 from .error_handler import GlobalType
 from src.analyzer.error_handler import *
 from src.lexer.token import Token, UniqueTokenType
+from src.lexer.context import CompileContext, current_context
 from src.parser.productions import *
 
 class IdProd(Enum):
@@ -22,9 +23,11 @@ class Signature:
         return (self.decl, self.dtype, self.global_type)
 
 class TypeChecker:
-    def __init__(self, program: Program):
+    def __init__(self, program: Program, context: CompileContext = None):
+        'context is the compilation the program was parsed in, the current one by default'
         self.program = program
         self.errors = []
+        self.context = context if context is not None else current_context()
 
         # Declaration, data type Token, GlobalType
         self.global_defs: dict[str, Signature] = {}
@@ -44,8 +47,9 @@ class TypeChecker:
         ## checked if it is a method call first
         self.in_class_type: Token = Token()
 
-        self.compile_global_types()
-        self.check_program()
+        with self.context.activate():
+            self.compile_global_types()
+            self.check_program()
 
     def compile_global_types(self):
         '''
@@ -504,7 +508,7 @@ class TypeChecker:
                             )
         # (DECLARATION & ASSIGNMENT) uninitialize identifiers if any errors occured in evaluating value
         if self.expr_err_count > 0 and not expected_type.type_is(TokenType.SAN):
-            decl_new = deepcopy(decl)
+            decl_new = copy(decl)
             decl_new.initialized = False
             decl_new.value = Value()
             if class_member:
@@ -515,7 +519,7 @@ class TypeChecker:
 
         # (ASSIGNMENT) initialize uninitialized identifiers
         elif not decl.initialized and not actual_type.type_is(TokenType.SAN):
-            decl_new = deepcopy(decl)
+            decl_new = copy(decl)
             decl_new.initialized = True
             if class_member:
                 repr = f"{expected_type.flat_string()}.{decl_new.id.flat_string()}"
@@ -0,0 +1 @@
+from .checker import check_file, check_files, expand, summarize
@@ -0,0 +1,32 @@
+# Entry point for batch checking
+import argparse
+import json
+import sys
+import time
+
+from src.lexer import TokenCache
+from .checker import check_files, expand, summarize
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(prog='python -m src.batch', description='checks .uwu files and prints the results as json')
+    arg_parser.add_argument('patterns', nargs='+', help='files, directories or globs of .uwu files')
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None, help='number of processes, defaults to the number of cores')
+    arg_parser.add_argument('--jsonl', action='store_true', help='print one json object per file, then the summary')
+    arg_parser.add_argument('--no-cache', action='store_true', help='lex every file instead of loading the tokens of unchanged files')
+    args = arg_parser.parse_args()
+
+    paths = expand(args.patterns)
+    start = time.perf_counter()
+    results = check_files(paths, args.jobs, cache=None if args.no_cache else TokenCache())
+    summary = summarize(results, time.perf_counter() - start)
+
+    if args.jsonl:
+        for result in results:
+            print(json.dumps(result))
+        print(json.dumps({'summary': summary}))
+    else:
+        print(json.dumps({'files': results, 'summary': summary}, indent=2))
+    rate = f"{summary['files_per_second']:.1f}" if summary['files_per_second'] else '-'
+    print(f"checked {summary['files']} files: {summary['passed']} passed, {summary['failed']} failed "
+          f"in {summary['seconds']:.2f}s ({rate} files/sec)", file=sys.stderr)
+    sys.exit(1 if summary['failed'] else 0)
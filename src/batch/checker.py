@@ -0,0 +1,104 @@
+'''
+Checks many .uwu files without the IDE.
+
+every file goes through the lexer, parser, member analyzer and type checker like a compile does,
+one file per task of a process pool, and comes back as a plain dict so that it can be dumped as json
+'''
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.lexer import CachedLexer, CompileContext, Lexer, SourceLines, TokenCache, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+
+STAGES = ['lexer', 'parser', 'analyzer', 'type_checker']
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+def expand(patterns: list[str]) -> list[str]:
+    'files matched by the globs, directories are searched for .uwu files'
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '**', '*.uwu')
+        files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(files)
+
+def describe(error, stage: str) -> dict:
+    'the error as json, positions are 1 indexed lines and 0 indexed columns like the error messages'
+    position = error.position() if callable(getattr(error, 'position', None)) else getattr(error, 'position', None)
+    try:
+        message = error.string() if hasattr(error, 'string') else str(error)
+    except Exception:
+        # some messages index the source with positions past its end
+        message = getattr(error, 'message', type(error).__name__)
+    return {
+        'stage': stage,
+        'type': type(error).__name__,
+        'line': position[0] + 1 if position else None,
+        'column': position[1] if position else None,
+        'message': ANSI_ESCAPE.sub('', str(message)).strip(),
+    }
+
+def check_file(path: str, cache: TokenCache = None) -> dict:
+    'runs every stage of the compiler up to the first one with errors, the tokens of the file are loaded from cache if given'
+    start = time.perf_counter()
+    result = {'file': path, 'ok': False, 'stage': None, 'errors': []}
+    try:
+        source = SourceLines.from_file(path)
+    except (OSError, UnicodeDecodeError) as e:
+        result['errors'].append({'stage': 'read', 'type': type(e).__name__, 'line': None, 'column': None, 'message': str(e)})
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    stage = STAGES[0]
+    context = CompileContext(source)
+    try:
+        if cache is not None:
+            lexer = CachedLexer(source, whitespace=Whitespace.SKIP, lexer=Lexer, context=context, cache=cache)
+        else:
+            lexer = Lexer(source, whitespace=Whitespace.SKIP, context=context)
+        errors = lexer.errors
+        if not errors:
+            stage = 'parser'
+            parser = Parser(lexer.tokens, context=context)
+            errors = parser.errors
+        if not errors:
+            stage = 'analyzer'
+            errors = MemberAnalyzer(parser.program, context=context).errors
+        if not errors:
+            stage = 'type_checker'
+            errors = TypeChecker(parser.program, context=context).errors
+        result['errors'] = [describe(e, stage) for e in errors]
+    except Exception as e:
+        # a crash is reported as an error of the stage it happened in
+        result['errors'] = [{'stage': stage, 'type': type(e).__name__, 'line': None, 'column': None, 'message': repr(e)}]
+
+    result['ok'] = not result['errors']
+    result['stage'] = None if result['ok'] else stage
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def check_files(paths: list[str], jobs: int | None = None, cache: TokenCache = None) -> list[dict]:
+    'checks the files in a pool of jobs processes (all cores by default), results keep the order of paths'
+    jobs = jobs or os.cpu_count() or 1
+    check = partial(check_file, cache=cache)
+    if jobs == 1 or len(paths) <= 1:
+        return [check(path) for path in paths]
+    # a few chunks per process so that slow files do not leave processes idle
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(check, paths, chunksize=chunksize))
+
+def summarize(results: list[dict], seconds: float) -> dict:
+    passed = sum(result['ok'] for result in results)
+    return {
+        'files': len(results),
+        'passed': passed,
+        'failed': len(results) - passed,
+        'seconds': seconds,
+        'files_per_second': len(results) / seconds if seconds else None,
+    }
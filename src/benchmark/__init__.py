@@ -0,0 +1,4 @@
+# Treat benchmark as a package
+from .generate import generate_source
+
+generate_source
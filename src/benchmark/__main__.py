@@ -0,0 +1,27 @@
+# Entry point for benchmark package
+import sys
+from . import adversarial, arrays, emit, lowering, memory, operators, parallel, parser, source, specialize, syntax_tree, token_cache, type_checker
+
+BENCHMARKS = {
+    'memory': memory.main,
+    'type_checker': type_checker.main,
+    'source': source.main,
+    'adversarial': adversarial.main,
+    'parallel': parallel.main,
+    'token_cache': token_cache.main,
+    'parser': parser.main,
+    'syntax_tree': syntax_tree.main,
+    'emit': emit.main,
+    'lowering': lowering.main,
+    'specialize': specialize.main,
+    'operators': operators.main,
+    'arrays': arrays.main,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise KeyError(f"Unknown benchmark {name}. It should be one of ({' | '.join(BENCHMARKS)})")
+        BENCHMARKS[name]()
+        print()
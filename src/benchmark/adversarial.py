@@ -0,0 +1,37 @@
+'''
+Lexing time of inputs that used to make the lexer quadratic, at doubling sizes.
+
+every > used to walk to the end of its line looking for the start of a comment,
+so a line of n comparisons took n^2 steps. the time should now double with the size
+'''
+import time
+
+from src.lexer import Lexer, TableLexer
+
+def _line(line: str) -> list[str]:
+    return ['fwunc mainuwu-san() [[\n', f'    a-chan = {line}~\n', ']]\n']
+
+INPUTS = {
+    'comparisons': lambda n: _line(' > '.join(['b'] * n)),
+    'negations': lambda n: _line(' - '.join(['-1'] * n)),
+    'comparison lines': lambda n: ['fwunc mainuwu-san() [[\n'] + ['    a-chan = b > c > d~\n'] * n + [']]\n'],
+}
+
+def _best(lexer: type, source: list[str], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lexer(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(sizes: tuple[int, ...] = (1000, 2000, 4000, 8000), repeat: int = 3):
+    print(f"lexing time of adversarial inputs of {' | '.join(map(str, sizes))} repetitions (best of {repeat})")
+    for lexer in [Lexer, TableLexer]:
+        for name, make in INPUTS.items():
+            times = [_best(lexer, make(n), repeat) for n in sizes]
+            # 2.0 per doubling is linear, 4.0 is quadratic
+            growth = (times[-1] / times[0]) ** (1 / (len(sizes) - 1))
+            row = ' '.join(f"{t * 1000:8.1f}" for t in times)
+            print(f"{lexer.__name__:>10} {name:>16}: {row} ms, x{growth:.2f} per doubling")
@@ -0,0 +1,52 @@
+'''
+Memory and time of runtime arrays of chan, kun and sama, kept in typed buffers or in lists of boxed elements
+'''
+import timeit
+import tracemalloc
+
+from src.compiler.executor import runtime_namespace
+
+def _make(kind, size: int, typed: bool):
+    runtime = runtime_namespace()
+    Array = runtime['Array']
+    res = Array([kind(i % 100) for i in range(size)])
+    if not typed:
+        # the list of boxed elements, like before arrays were typed
+        res.val = res.val
+    return res
+
+def _memory(kind, size: int, typed: bool) -> int:
+    'the bytes held by an array of size elements'
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    array = _make(kind, size, typed)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del array
+    return held
+
+def main(size: int = 100_000, number: int = 5):
+    runtime = runtime_namespace()
+    Int, Float, Bool = runtime['Int'], runtime['Float'], runtime['Bool']
+    for name, kind in [('chan', Int), ('kun', Float), ('sama', Bool)]:
+        print(f"{name}[] of {size} elements")
+        print(f"{'':>12}{'typed':>12}{'list':>12}")
+        print(f"{'memory':>12}" + ''.join(f"{_memory(kind, size, typed) / 1024:10.0f}kB" for typed in (True, False)))
+        arrays = {typed: _make(kind, size, typed) for typed in (True, False)}
+        others = {typed: _make(kind, size, typed) for typed in (True, False)}
+        # not in chan[] and kun[], every sama is in sama[]
+        missing = kind(-1)
+        operations = {
+            '_has': lambda a, b: a._has(missing),
+            '_count': lambda a, b: a._count(kind(1)),
+            '_index': lambda a, b: a._index(missing),
+            '_replace': lambda a, b: a._replace(kind(1), kind(1)),
+            '==': lambda a, b: a == b,
+        }
+        for op, run in operations.items():
+            row = f"{op:>12}"
+            for typed in (True, False):
+                best = min(timeit.repeat(lambda: run(arrays[typed], others[typed]), number=number, repeat=3))
+                row += f"{best / number * 1e3:10.2f}ms"
+            print(row)
+        print()
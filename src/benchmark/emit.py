@@ -0,0 +1,56 @@
+'''
+Transpiling and formatting time of a large generated program whose functions are nested deeply,
+where every block used to be copied into every block around it
+'''
+import time
+
+from src.lexer import CompileContext, Lexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+
+_MAINUWU = '''fwunc mainuwu-san() [[
+    pwint(nested0(3))~
+]]
+'''
+
+_OPENERS = [
+    'iwf (total > {d}) [[',
+    'whiwe (total < {d}) [[',
+    'fow (i{d}-chan = 0~ i{d} < 2~ i{d} + 1) [[',
+]
+
+def generate_nested_source(line_count: int, depth: int = 40) -> list[str]:
+    'generates a valid program of at least line_count lines, of functions with blocks nested depth times'
+    source = _MAINUWU.splitlines(keepends=True)
+    n = 0
+    while len(source) < line_count:
+        source.append(f'fwunc nested{n}-chan(total-chan) [[\n')
+        for d in range(depth):
+            indent = '    ' * (d + 1)
+            source.append(indent + _OPENERS[d % len(_OPENERS)].format(d=d) + '\n')
+            source.append(f'{indent}    total = total + {d}~\n')
+        source.append('    ' * (depth + 1) + 'pwint(total)~\n')
+        for d in reversed(range(depth)):
+            source.append('    ' * (d + 1) + ']]\n')
+        source.append('    wetuwn(total)~\n')
+        source.append(']]\n')
+        n += 1
+    return source
+
+def main(line_count: int = 20_000, depth: int = 100, repeat: int = 3):
+    source = generate_nested_source(line_count, depth)
+    context = CompileContext()
+    program = Parser(Lexer(source, whitespace=Whitespace.SKIP, context=context).tokens, context=context).program
+    assert not MemberAnalyzer(program, context=context).errors, "the generated source should analyze"
+    assert not TypeChecker(program, context=context).errors, "the generated source should type check"
+    print(f"emitting {len(source)} lines nested {depth} deep (best of {repeat})")
+
+    for name, emit in [('transpile', lambda: program.python_string(context=context)),
+                       ('format', program.formatted_string)]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = emit()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:>10}: {best:6.3f}s, {len(output) / 1024 / 1024:5.1f} MB")
@@ -0,0 +1,43 @@
+_CWASS = '''cwass Counter{n}(start-chan, name-senpai) [[
+    count-chan = 0~
+    fwunc inc-chan(by-chan) [[
+        count = count + by * 2 - 1~
+        wetuwn(count)~
+    ]]
+]]
+'''
+
+_FWUNC = '''>.< generated function {n}
+fwunc compute{n}-chan(a-chan, b-chan) [[
+    total-chan = 0~
+    fow (i-chan = 0~ i < a~ i + 1) [[
+        iwf (i % 2 == 0 && b > 0) [[
+            total = total + i * b~
+        ]] ewse [[
+            total = total - 1~
+        ]]
+    ]]
+    whiwe (total > 100) [[
+        total = total / 2~
+    ]]
+    ratio-kun = 1.5~
+    label-senpai = "result '| total |' of {n}"~
+    pwint(label, ratio)~
+    wetuwn(total)~
+]]
+'''
+
+_MAINUWU = '''fwunc mainuwu-san() [[
+    c-Counter0 = Counter0(1, "counter")~
+    pwint(compute0(10, 2), c.inc(1))~
+]]
+'''
+
+def generate_source(line_count: int) -> list[str]:
+    'generates a valid program of at least line_count lines, split like readlines()'
+    source = _MAINUWU.splitlines(keepends=True)
+    n = 0
+    while len(source) < line_count:
+        source += (_CWASS + _FWUNC).format(n=n).splitlines(keepends=True)
+        n += 1
+    return source
@@ -0,0 +1,33 @@
+'''
+Time to compile a large generated program for a run, from python source and from a lowered python syntax tree
+'''
+import __future__
+import ast
+import time
+
+from src.lexer import CompileContext, TableLexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.compiler import lower
+from .generate import generate_source
+
+def _compile(py_source: str | ast.Module):
+    return compile(py_source, '<uwu>', 'exec', flags=__future__.annotations.compiler_flag, dont_inherit=True)
+
+def main(line_count: int = 20_000, repeat: int = 3):
+    source = generate_source(line_count)
+    context = CompileContext()
+    program = Parser(TableLexer(source, whitespace=Whitespace.SKIP, context=context).tokens, context=context).program
+    assert not MemberAnalyzer(program, context=context).errors, "the generated source should analyze"
+    assert not TypeChecker(program, context=context).errors, "the generated source should type check"
+    print(f"compiling {len(source)} lines for a run (best of {repeat})")
+
+    for name, build in [('source', lambda: _compile(program.python_string(clear_screen=False, context=context))),
+                        ('lowered', lambda: _compile(lower(program, clear_screen=False, context=context)))]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:>8}: {best:6.3f}s")
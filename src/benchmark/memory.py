@@ -0,0 +1,78 @@
+'''
+Peak memory of holding the token stream of a large generated source.
+
+every representation is measured in its own process since peak RSS never goes down.
+the source is lexed one block at a time so that the peak is dominated by the tokens being kept
+'''
+import subprocess
+import sys
+
+from constants.path import ROOT
+from src.lexer import TableLexer, Token, TokenBuffer
+from .generate import generate_source
+
+REPRESENTATIONS = ['none', 'dict', 'slots', 'buffer']
+BLOCK_SIZE = 500
+
+class _DictToken:
+    'the previous token layout: an instance dict, tuple positions, and a lexeme per token'
+    def __init__(self, lexeme: str, token, position: tuple[int, int], end_position: tuple[int, int]):
+        self._lexeme = lexeme
+        self._token = token
+        self._position = position
+        self._end_position = end_position
+
+def _keep(representation: str, line_count: int) -> int:
+    'lexes the generated source and keeps its tokens in the given representation, returns the token count'
+    source = generate_source(line_count)
+    kept = TokenBuffer() if representation == 'buffer' else []
+    count = 0
+    for start in range(0, len(source), BLOCK_SIZE):
+        for token in TableLexer(source[start:start+BLOCK_SIZE]).tokens:
+            count += 1
+            (line, col), (end_line, end_col) = token.position, token.end_position
+            position, end_position = (line + start, col), (end_line + start, end_col)
+            match representation:
+                case 'dict':
+                    # copied so that lexemes are not shared, like the slices the lexer used to make
+                    lexeme = token.lexeme[:1] + token.lexeme[1:]
+                    kept.append(_DictToken(lexeme, token.token, position, end_position))
+                case 'slots' | 'buffer':
+                    kept.append(Token(token.lexeme, token.token, position, end_position))
+    return count
+
+def _peak_kb() -> tuple[int, str]:
+    try:
+        import resource
+    except ImportError:
+        # windows
+        import tracemalloc
+        return tracemalloc.get_traced_memory()[1] // 1024, 'traced'
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak // 1024 if sys.platform == 'darwin' else peak), 'rss'
+
+def measure(representation: str, line_count: int) -> tuple[int, int, str]:
+    'returns the token count, peak kb and the kind of peak of a fresh process keeping the tokens'
+    output = subprocess.run([sys.executable, '-m', 'src.benchmark.memory', representation, str(line_count)],
+                            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    count, peak, kind = output.split()
+    return int(count), int(peak), kind
+
+def main(line_count: int = 10_000):
+    print(f"peak memory of keeping the tokens of a {line_count} line source")
+    baseline = None
+    for representation in REPRESENTATIONS:
+        count, peak, kind = measure(representation, line_count)
+        baseline = peak if baseline is None else baseline
+        print(f"{representation:>8}: {peak:>8} KB peak {kind} ({peak - baseline:>7} KB for {count} tokens)")
+
+if __name__ == '__main__':
+    representation, line_count = sys.argv[1], int(sys.argv[2])
+    try:
+        import resource
+    except ImportError:
+        import tracemalloc
+        tracemalloc.start()
+    count = _keep(representation, line_count)
+    peak, kind = _peak_kb()
+    print(count, peak, kind)
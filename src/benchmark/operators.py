@@ -0,0 +1,47 @@
+'''
+Time per operation of the runtime number operators, for every combination of operand types programs make
+'''
+import operator
+import timeit
+
+from src.compiler.executor import runtime_namespace
+
+_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '<': operator.lt,
+    '==': operator.eq,
+}
+
+def _operands() -> dict[str, object]:
+    runtime = runtime_namespace()
+    Int, Float, Bool = runtime['Int'], runtime['Float'], runtime['Bool']
+    return {
+        'Int': Int(7),
+        'Float': Float(2.5),
+        'Bool': Bool(True),
+        # like the increments of for loops
+        'int': 1,
+    }
+
+def main(number: int = 200_000, repeat: int = 5):
+    operands = _operands()
+    pairs = [('Int', 'Int'), ('Int', 'Float'), ('Float', 'Int'), ('Float', 'Float'),
+             ('Int', 'Bool'), ('Bool', 'Int'), ('Bool', 'Bool'), ('Bool', 'Float'), ('Int', 'int')]
+    print(f"ns per operation (best of {repeat})")
+    print(f"{'':>14}" + ''.join(f"{op:>8}" for op in _OPS))
+    for left, right in pairs:
+        a, b = operands[left], operands[right]
+        row = f"{left + ' x ' + right:>14}"
+        for op in _OPS.values():
+            try:
+                op(a, b)
+            except Exception:
+                row += f"{'-':>8}"
+                continue
+            best = min(timeit.repeat(lambda: op(a, b), number=number, repeat=repeat))
+            row += f"{best / number * 1e9:8.0f}"
+        print(row)
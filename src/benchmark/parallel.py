@@ -0,0 +1,37 @@
+'''
+Lexing time of a large generated source by a sequential lexer and by the parallel lexer with more and more jobs.
+
+the speedup is bounded by the cores of the machine and by the parent, which still makes every token object
+'''
+import os
+import time
+
+from src.lexer import TableLexer, ParallelLexer, Whitespace
+from .generate import generate_source
+
+def _fields(lexer) -> tuple:
+    return [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in lexer.tokens], len(lexer.errors), lexer.line_states
+
+def _best(make, repeat: int) -> tuple[float, object]:
+    best, lexer = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lexer = make()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, lexer
+
+def main(line_count: int = 100_000, repeat: int = 3):
+    source = generate_source(line_count)
+    cores = os.cpu_count() or 1
+    print(f"lexing {len(source)} lines on {cores} cores (best of {repeat})")
+    sequential, expected = _best(lambda: TableLexer(source, whitespace=Whitespace.SKIP), repeat)
+    print(f"{'sequential':>10}: {sequential:6.2f}s")
+    jobs = 1
+    while True:
+        elapsed, lexer = _best(lambda: ParallelLexer(source, whitespace=Whitespace.SKIP, jobs=jobs), repeat)
+        assert _fields(lexer) == _fields(expected), "the parallel lexer should lex like the sequential one"
+        print(f"{jobs:>5} jobs: {elapsed:6.2f}s, x{sequential / elapsed:.2f}")
+        if jobs >= max(cores, 2):
+            break
+        jobs = min(jobs * 2, max(cores, 2))
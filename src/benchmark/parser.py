@@ -0,0 +1,60 @@
+'''
+Parser throughput on a large generated source, in tokens per second,
+and on the same source with a comment after every line, where the parser has comments to skip at every step.
+also times a reparse after a line is inserted in the middle of the source, against a parse of the whole edited source
+'''
+import time
+
+from src.lexer import CompileContext, TableLexer, Whitespace
+from src.lexer.incremental import edit_range
+from src.parser import Parser, reparse
+from .generate import generate_source
+
+def _commented(source: list[str]) -> list[str]:
+    commented = []
+    for line in source:
+        commented += [line, f"{line[:len(line) - len(line.lstrip())]}>.< comment\n"]
+    return commented
+
+def _throughput(source: list[str], repeat: int) -> tuple[int, float]:
+    'token count and best parse time'
+    context = CompileContext()
+    tokens = TableLexer(source, whitespace=Whitespace.SKIP, context=context).tokens
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser = Parser(tokens, context=context)
+        elapsed = time.perf_counter() - start
+        assert not parser.errors, "the generated source should parse"
+        best = elapsed if best is None else min(best, elapsed)
+    return len(tokens), best
+
+def _reparse(source: list[str], repeat: int) -> tuple[float, float]:
+    'best reparse and full parse times of the source with a line inserted in the middle'
+    line = len(source) // 2
+    edited = source[:line] + [source[line]] + source[line:]
+    context = CompileContext()
+    tokens = TableLexer(source, whitespace=Whitespace.SKIP, context=context).tokens
+    edited_tokens = TableLexer(edited, whitespace=Whitespace.SKIP, context=context).tokens
+    best_reparse = best_full = None
+    for _ in range(repeat):
+        previous = Parser(tokens, context=context)
+        start = time.perf_counter()
+        parser = reparse(previous, edited_tokens, *edit_range(source, edited), context=context)
+        reparse_time = time.perf_counter() - start
+        start = time.perf_counter()
+        full = Parser(edited_tokens, context=context)
+        full_time = time.perf_counter() - start
+        assert parser.program.formatted_string() == full.program.formatted_string()
+        best_reparse = reparse_time if best_reparse is None else min(best_reparse, reparse_time)
+        best_full = full_time if best_full is None else min(best_full, full_time)
+    return best_reparse, best_full
+
+def main(line_count: int = 20_000, repeat: int = 3):
+    source = generate_source(line_count)
+    print(f"parsing {len(source)} lines (best of {repeat})")
+    for name, lines in [('generated', source), ('commented', _commented(source))]:
+        count, elapsed = _throughput(lines, repeat)
+        print(f"{name:>10}: {count} tokens in {elapsed:6.2f}s, {count / elapsed / 1000:7.1f}k tokens/s")
+    reparse_time, full_time = _reparse(source, repeat)
+    print(f"{'reparse':>10}: {reparse_time:6.3f}s after inserting a line, {full_time:6.2f}s to parse it all again")
@@ -0,0 +1,64 @@
+'''
+Peak memory and time of lexing a large source file, read as a list of lines or memory mapped.
+
+every way of reading is measured in its own process since peak RSS never goes down.
+the tokens are streamed and dropped, so the peak is dominated by the source itself
+'''
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from constants.path import ROOT
+from src.lexer import TableLexer, SourceLines, Whitespace
+from .generate import generate_source
+from .memory import _peak_kb
+
+READERS = ['none', 'readlines', 'mmap']
+
+def _lex(reader: str, path: str) -> tuple[int, float]:
+    'lexes the file read the given way, returns the token count and the seconds it took'
+    start = time.perf_counter()
+    match reader:
+        case 'none':
+            return 0, 0.0
+        case 'readlines':
+            source = [line if line else "\n" for line in open(path, "r").readlines()]
+        case 'mmap':
+            source = SourceLines.from_file(path)
+    count = sum(1 for _ in TableLexer(source, whitespace=Whitespace.SKIP, lazy=True).stream())
+    return count, time.perf_counter() - start
+
+def measure(reader: str, path: str) -> tuple[int, float, int, str]:
+    'returns the token count, seconds, peak kb and the kind of peak of a fresh process lexing the file'
+    output = subprocess.run([sys.executable, '-m', 'src.benchmark.source', reader, path],
+                            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    count, seconds, peak, kind = output.split()
+    return int(count), float(seconds), int(peak), kind
+
+def main(line_count: int = 100_000):
+    with tempfile.NamedTemporaryFile('w', suffix='.uwu', delete=False) as f:
+        f.writelines(generate_source(line_count))
+        path = f.name
+    try:
+        size = os.path.getsize(path) // 1024
+        print(f"peak memory of lexing a {line_count} line ({size} KB) source")
+        baseline = None
+        for reader in READERS:
+            count, seconds, peak, kind = measure(reader, path)
+            baseline = peak if baseline is None else baseline
+            print(f"{reader:>10}: {peak:>8} KB peak {kind} ({peak - baseline:>7} KB, {count} tokens in {seconds:.2f}s)")
+    finally:
+        os.remove(path)
+
+if __name__ == '__main__':
+    reader, path = sys.argv[1], sys.argv[2]
+    try:
+        import resource
+    except ImportError:
+        import tracemalloc
+        tracemalloc.start()
+    count, seconds = _lex(reader, path)
+    peak, kind = _peak_kb()
+    print(count, seconds, peak, kind)
@@ -0,0 +1,47 @@
+'''
+Run time of a numeric program lowered with every value boxed, and with its checked locals kept native
+'''
+import io
+import time
+
+from src.lexer import CompileContext, TableLexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.compiler import Executor, lower
+
+_SOURCE = '''fwunc series-kun(n-chan) [[
+    total-kun = 0.0~
+    odd-chan = 0~
+    fow (i-chan = 1~ i < n~ i + 1) [[
+        iwf (i % 2 == 1 && i > 2) [[
+            odd = odd + 1~
+        ]]
+        total = total + 1 / i - odd * 0.5 / n~
+    ]]
+    wetuwn(total)~
+]]
+fwunc mainuwu-san() [[
+    pwint(series({n}))~
+]]
+'''
+
+def main(n: int = 200_000, repeat: int = 3):
+    source = _SOURCE.format(n=n).splitlines(keepends=True)
+    context = CompileContext()
+    program = Parser(TableLexer(source, whitespace=Whitespace.SKIP, context=context).tokens, context=context).program
+    assert not MemberAnalyzer(program, context=context).errors, "the program should analyze"
+    assert not TypeChecker(program, context=context).errors, "the program should type check"
+    print(f"running a loop of {n} iterations (best of {repeat})")
+
+    outputs = {}
+    for name, specialize in [('boxed', False), ('native', True)]:
+        executor = Executor(lower(program, clear_screen=False, context=context, specialize=specialize), stdout=io.StringIO())
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            assert executor.run() is None, "the program should run"
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        outputs[name] = executor.stdout.getvalue()
+        print(f"{name:>8}: {best:6.3f}s")
+    assert outputs['boxed'] == outputs['native'], "both should print the same"
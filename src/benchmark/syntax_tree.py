@@ -0,0 +1,40 @@
+'''
+Memory and parse time of the syntax tree of a large generated source.
+
+memory is what tracemalloc counts as still allocated after a parse of tokens that were lexed before,
+so it is the nodes of the tree and the lists and positions in them
+'''
+import time
+import tracemalloc
+
+from src.lexer import CompileContext, TableLexer, Whitespace
+from src.parser import Parser
+from .generate import generate_source
+
+def _tree_size(tokens: list, context: CompileContext) -> int:
+    'bytes allocated by a parse that are kept by the tree'
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        parser = Parser(tokens, context=context)
+        # the token list and links of the parser are not part of the tree
+        parser.tokens = parser.next_code = parser.definitions = None
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+def main(line_count: int = 20_000, repeat: int = 3):
+    source = generate_source(line_count)
+    context = CompileContext()
+    tokens = TableLexer(source, whitespace=Whitespace.SKIP, context=context).tokens
+    print(f"syntax tree of {len(source)} lines, {len(tokens)} tokens (best of {repeat})")
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Parser(tokens, context=context)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    size = _tree_size(tokens, context)
+    print(f"{'parse':>8}: {best:6.2f}s")
+    print(f"{'memory':>8}: {size / 1024 / 1024:6.1f} MB, {size / len(tokens):5.1f} bytes per token")
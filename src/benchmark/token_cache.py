@@ -0,0 +1,40 @@
+'''
+Time to lex a large generated source against the time to load its tokens from the token cache,
+and the size of a cache file against the size of the source
+'''
+import tempfile
+import time
+
+from src.lexer import TableLexer, CachedLexer, CompileContext, TokenCache, Whitespace
+from .generate import generate_source
+
+def _best(make, repeat: int) -> tuple[float, object]:
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = make()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main(line_count: int = 100_000, repeat: int = 3):
+    source = generate_source(line_count)
+    print(f"lexing {len(source)} lines (best of {repeat})")
+    lexed, expected = _best(lambda: TableLexer(source, whitespace=Whitespace.KEEP, context=CompileContext()), repeat)
+    print(f"{'lex':>10}: {lexed:6.2f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TokenCache(directory)
+        stored, _ = _best(lambda: cache.put(cache.key(source, TableLexer, Whitespace.KEEP),
+                                            expected.tokens, expected.errors, expected.line_states), 1)
+        loaded, lexer = _best(lambda: CachedLexer(source, context=CompileContext(), cache=cache), repeat)
+        assert lexer.cached, "the source should be in the cache"
+        assert [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in lexer.tokens] == \
+               [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in expected.tokens], \
+               "loaded tokens should be the lexed tokens"
+        size = sum(size for _, size in cache.entries())
+
+    print(f"{'store':>10}: {stored:6.2f}s")
+    print(f"{'load':>10}: {loaded:6.2f}s, x{lexed / loaded:.2f}")
+    print(f"{len(expected.tokens)} tokens in {size / 1024 / 1024:.1f} MB, "
+          f"the source is {sum(map(len, source)) / 1024 / 1024:.1f} MB")
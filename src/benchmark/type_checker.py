@@ -0,0 +1,63 @@
+'''
+TypeChecker time on a generated program with many class typed arrays
+'''
+import time
+
+from src.lexer import Lexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+
+_CWASSES = '''cwass Item{n}(weight-chan, name-senpai) [[
+    tags-senpai[] = {{"a", "b"}}~
+    fwunc heavier-sama(other-Item{n}) [[
+        wetuwn(weight > other.weight)~
+    ]]
+]]
+cwass Box{n}(label-senpai) [[
+    items-Item{n}[] = {{}}~
+    fwunc add-san(item-Item{n}) [[
+        items.append(item)~
+    ]]
+    fwunc count-chan() [[
+        wetuwn(items.len())~
+    ]]
+]]
+fwunc fill{n}-Item{n}[](count-chan) [[
+    res-Item{n}[] = {{Item{n}(1, "x"), Item{n}(2, "y")}}~
+    fow (i-chan = 0~ i < count~ i + 1) [[
+        res.append(Item{n}(i, "z"))~
+    ]]
+    acc-Item{n}[]~
+    acc = res~
+    grid-Item{n}[2] = {{{{Item{n}(1, "a")}}, {{Item{n}(2, "b"), Item{n}(3, "c")}}}}~
+    pwint(grid.len(), acc.has(Item{n}(1, "x")))~
+    wetuwn(acc)~
+]]
+'''
+
+_MAINUWU = '''fwunc mainuwu-san() [[
+    b-Box0 = Box0("box")~
+    items-Item0[] = fill0(3)~
+    b.add(Item0(4, "d"))~
+    pwint(b.count(), items.len())~
+]]
+'''
+
+def generate_source(class_count: int) -> list[str]:
+    'generates a valid program with class_count pairs of classes that are used as arrays'
+    source = _MAINUWU + ''.join(_CWASSES.format(n=n) for n in range(class_count))
+    return source.splitlines(keepends=True)
+
+def main(class_count: int = 200, repeat: int = 5):
+    source = generate_source(class_count)
+    program = Parser(Lexer(source, whitespace=Whitespace.SKIP).tokens).program
+    assert not MemberAnalyzer(program).errors
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        type_checker = TypeChecker(program)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    assert not type_checker.errors
+    print(f"type checking {len(source)} lines with {class_count * 2} classes: {best * 1000:.1f} ms (best of {repeat})")
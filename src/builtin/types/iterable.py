@@ -1,4 +1,5 @@
 from __future__ import annotations
+from array import array
 from .namespace import Int, Float, Bool
 
 class String:
@@ -123,8 +124,58 @@ class String:
     def valid_operands(self) -> list[type]:
         return [str, String]
 
+class Elements:
+    '''
+    The elements of an array that are all chan, kun or sama, kept unboxed in a typed array instead of a list.
+    arrays made from the same array share them, like they share a list.
+    they become a list of boxed elements when something else is put in them or when their list is needed
+    '''
+    __slots__ = ('buffer', 'kind', 'raw', 'list')
+
+    def __init__(self, buffer: array, kind: type):
+        self.buffer: array | None = buffer
+        self.kind = kind
+        # the type of the values in the buffer
+        self.raw = element_type(kind)[1]
+        self.list: list | None = None
+
+    def fits(self, item) -> bool:
+        'if item can be kept in the buffer'
+        # nan is left boxed, since a boxed nan is only equal to itself
+        return type(item) is self.kind and type(item.val) is self.raw and item.val == item.val
+    def as_list(self) -> list:
+        if self.list is None:
+            self.list = [self.kind(val) for val in self.buffer]
+            self.buffer = None
+        return self.list
+
+def element_type(kind: type) -> tuple[str, type] | None:
+    'the typecode and value type of the typed elements of kind, None if kind is not kept typed'
+    # looked up when called, since Int, Float and Bool are defined after this module
+    if kind is Int: return 'q', int
+    if kind is Float: return 'd', float
+    if kind is Bool: return 'b', bool
+    return None
+
+def typed_elements(vals: list) -> Elements | list:
+    'vals kept in a typed array if they are all chan, all kun or all sama, else vals as they are'
+    if not vals or (element := element_type(type(vals[0]))) is None:
+        return vals
+    code, raw = element
+    kind = type(vals[0])
+    for val in vals:
+        if type(val) is not kind or type(val.val) is not raw or val.val != val.val:
+            return vals
+    return Elements(array(code, [val.val for val in vals]), kind)
+
 class Array:
+    __slots__ = ('items',)
+
     def __init__(self, vals: "list|Array"):
+        if type(vals) is Array:
+            # shares the elements, like sharing the list
+            self.items = vals.items
+            return
         match vals:
             case Int()|Float()|Bool()|String()|Array(): vals = vals.val
         if vals is None:
@@ -132,15 +183,38 @@ class Array:
             return
         tmp: "list|Array" = vals
         while isinstance(tmp, Array): tmp = tmp.val
-        self.val: list = tmp
+        self.items: list | Elements = typed_elements(tmp) if type(tmp) is list else tmp
+
+    @property
+    def val(self) -> list:
+        'the list of the elements, typed elements are turned into a list for good'
+        items = self.items
+        if type(items) is Elements:
+            return items.as_list()
+        return items
+    @val.setter
+    def val(self, vals: list):
+        self.items = vals
+    def typed(self) -> Elements | None:
+        'the typed elements, None if they are in a list'
+        items = self.items
+        if type(items) is Elements and items.buffer is not None:
+            return items
+        return None
 
     ## META DUNDER METHODS
     # basic properties
     def __len__(self):
+        if (typed := self.typed()) is not None:
+            return len(typed.buffer)
         return len(self.val)
     def __str__(self):
+        if (typed := self.typed()) is not None and typed.kind is not Bool:
+            # ints and floats are written like Int and Float write them
+            return "{" + ", ".join(map(str, typed.buffer)) + "}"
         res = "{"
-        for val in self.val: res += str(val) + ", "
+        for val in self:
+            res += str(val) + ", "
         res = (res[:-2] if res[-2:] == ", " else res) + "}"
         return res
     def __repr__(self):
@@ -150,56 +224,113 @@ class Array:
     def __eq__(self, other) -> Bool:
         expect_type_is_in(other, self.valid_operands(),
                                msg=f"OwO... you can't compare with that!")
+        if (typed := self.typed()) is not None and type(other) is Array and (other_typed := other.typed()) is not None \
+                and typed.kind is other_typed.kind:
+            return Bool(typed.buffer == other_typed.buffer)
         return Bool(self.val == other)
     def __ne__(self, other) -> Bool:
         expect_type_is_in(other, self.valid_operands(),
                                msg=f"OwO... you can't compare with that!")
+        if (typed := self.typed()) is not None and type(other) is Array and (other_typed := other.typed()) is not None \
+                and typed.kind is other_typed.kind:
+            return Bool(typed.buffer != other_typed.buffer)
         return Bool(self.val != other)
 
     # converting to other types
     def __nonzero__(self):
         'determines the truth value of Array (same as list)'
-        return bool(self.val)
+        return self.__bool__()
     def __bool__(self):
         'determines the truth value of Array (same as list)'
+        if (typed := self.typed()) is not None:
+            return bool(typed.buffer)
         return bool(self.val)
 
     # subscripting
+    # typed elements are boxed when they are read, and unboxed when the same type is put in them
     def __getitem__(self, index):
+        if (typed := self.typed()) is not None and type(index) is int:
+            try:
+                val = typed.buffer[index]
+            except IndexError:
+                raise IndexError("list index out of range") from None
+            return typed.kind(val)
         return self.val[index]
     def __setitem__(self, index, item):
+        if (typed := self.typed()) is not None and type(index) is int and typed.fits(item):
+            try:
+                typed.buffer[index] = item.val
+            except IndexError:
+                raise IndexError("list assignment index out of range") from None
+            return
         self.val[index] = item
     def __contains__(self, item):
+        if (typed := self.typed()) is not None:
+            if typed.fits(item):
+                return item.val in typed.buffer
+            # compared boxed, like in the list
+            return item in list(self)
         return item in self.val
     def __iter__(self):
+        if (typed := self.typed()) is not None:
+            return map(typed.kind, typed.buffer)
         return iter(self.val)
 
     ## BUILTIN METHODS
     def _len(self) -> Int:
         return Int(self.__len__())
     def _reverse(self) -> None:
+        if (typed := self.typed()) is not None:
+            self.items = Elements(typed.buffer[::-1], typed.kind)
+            return
         self.val = self.val[::-1]
     def _append(self, item) -> None:
+        if (typed := self.typed()) is not None and typed.fits(item):
+            typed.buffer.append(item.val)
+            return
         self.val.append(item)
     def _has(self, item) -> Bool:
-        return Bool(item in self.val)
+        return Bool(self.__contains__(item))
     def _clear(self) -> None:
+        if (typed := self.typed()) is not None:
+            del typed.buffer[:]
+            return
         self.val.clear()
     def _count(self, item) -> Int:
+        if (typed := self.typed()) is not None:
+            if typed.fits(item):
+                return Int(typed.buffer.count(item.val))
+            return Int(list(self).count(item))
         return Int(self.val.count(item))
     def _extend(self, item) -> None:
+        if (typed := self.typed()) is not None and type(item) is Array and item is not self \
+                and (item_typed := item.typed()) is not None and typed.kind is item_typed.kind:
+            typed.buffer.extend(item_typed.buffer)
+            return
         self.val.extend(item)
     def _index(self, item) -> Int:
+        if (typed := self.typed()) is not None:
+            if typed.fits(item):
+                return Int(typed.buffer.index(item.val)) if item.val in typed.buffer else Int(-1)
+            elements = list(self)
+            return Int(elements.index(item)) if item in elements else Int(-1)
         if item not in self.val: return Int(-1)
         return Int(self.val.index(item))
     def _pop(self):
+        if (typed := self.typed()) is not None and len(typed.buffer) > 0:
+            return typed.kind(typed.buffer.pop())
         if len(self.val) == 0: raise PopError("OwO...Tried to pop from an empty array!!!!!")
         return self.val.pop()
     def _prepend(self, item) -> None:
+        if (typed := self.typed()) is not None and typed.fits(item):
+            typed.buffer.insert(0, item.val)
+            return
         self.val.insert(0, item)
     def _prextend(self, item) -> None:
         self.val = item + self.val
     def _dimension(self) -> Int:
+        if self.typed() is not None:
+            return Int(1)
         dimension = 0
         tmp = self.val
         while isinstance(tmp, list):
@@ -211,8 +342,12 @@ class Array:
         return Int(dimension)
     def _first(self, n) -> Array:
         idx = max(int(n), 0)
+        if (typed := self.typed()) is not None:
+            return typed_array(typed.buffer[:idx], typed.kind)
         return Array(self.val[:idx])
     def _flatten(self) -> Array:
+        if (typed := self.typed()) is not None:
+            return typed_array(typed.buffer[:], typed.kind)
         def flatten(arr: list|Array) -> list:
             flattened = []
             for item in arr:
@@ -225,10 +360,18 @@ class Array:
         return String(str(separator).join([str(val) for val in self._flatten()]))
     def _last(self, n) -> Array:
         idx = max(int(n), 0)
+        if (typed := self.typed()) is not None:
+            return typed_array(typed.buffer[-idx:], typed.kind)
         return Array(self.val[-idx:])
     def _replace(self, old, new) -> None:
+        if (typed := self.typed()) is not None and typed.fits(old) and typed.fits(new):
+            old, new = old.val, new.val
+            self.items = Elements(array(typed.buffer.typecode, [new if x == old else x for x in typed.buffer]), typed.kind)
+            return
         self.val = [new if x == old else x for x in self.val]
     def _shift(self):
+        if (typed := self.typed()) is not None and len(typed.buffer) > 0:
+            return typed.kind(typed.buffer.pop(0))
         if len(self.val) == 0: raise ShiftError("OwO...Tried to shift from an empty array!!!!!")
         return self.val.pop(0)
 
@@ -236,6 +379,12 @@ class Array:
     def valid_operands(self) -> list[type]:
         return [list, Array]
 
+def typed_array(buffer: array, kind: type) -> Array:
+    'an array of typed elements, without boxing them'
+    res = Array([])
+    res.items = Elements(buffer, kind)
+    return res
+
 class TypeError(Exception):...
 class PopError(Exception):...
 class ShiftError(Exception):...
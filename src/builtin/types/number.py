@@ -3,7 +3,16 @@ from math import sqrt
 from .namespace import *
 
 class Bool:
+    __slots__ = ('val',)
+
     def __init__(self, val):
+        # exact types are converted without matching, like the match below would
+        if type(val) is bool:
+            self.val = val
+            return
+        if type(val) is Bool:
+            self.val = val.val
+            return
         match val:
             case Int()|Float()|Bool()|String()|Array(): val = val.val
         if val is None:
@@ -23,6 +32,12 @@ class Bool:
 
     # operator overloading
     def __add__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val + other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_int(self.val + int(other.val))
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val + other.val))
         match other:
             case int() | Int(): return Int(self.val + int(other))
             case float() | Float(): return Float(self.val + float(other))
@@ -41,6 +56,12 @@ class Bool:
                 except: raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
                 return Int(res + self.val)
     def __sub__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val - other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_int(self.val - int(other.val))
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val - other.val))
         match other:
             case int() | Int(): return Int(self.val - int(other))
             case float() | Float(): return Float(self.val - float(other))
@@ -59,6 +80,12 @@ class Bool:
                 except: raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
                 return Int(res - self.val)
     def __mul__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val * other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_int(self.val * int(other.val))
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val * other.val))
         match other:
             case int() | Int(): return Int(self.val * int(other))
             case float() | Float(): return Float(self.val * float(other))
@@ -164,12 +191,20 @@ class Bool:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return type(self)(self.val >= res)
     def __eq__(self, other) -> Bool:
+        if type(other) is Bool and other.val is not None:
+            return make_bool(int(other.val) == self.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(other.val == self.val)
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return type(self)(res == self.val)
     def __ne__(self, other) -> Bool:
+        if type(other) is Bool and other.val is not None:
+            return make_bool(int(other.val) != self.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(other.val != self.val)
         try:
             res = int(float(other))
         except:
@@ -200,7 +235,16 @@ class Bool:
             raise ValueError(f"Oh no!! '{self.val}' cannot be converted to kuuuuuuuunnnnnnn!!")
 
 class Float:
+    __slots__ = ('val',)
+
     def __init__(self, val):
+        # exact types are converted without matching, like the matches below would
+        if type(val) is float and -9999999999.0 <= val <= 9999999999.0:
+            self.val = val
+            return
+        if type(val) is Float:
+            self.val = val.val
+            return
         match val:
             case Int()|Float()|Bool()|String()|Array(): val = val.val
         if val is None:
@@ -223,6 +267,10 @@ class Float:
 
     # operator overloading
     def __add__(self, other) -> Float:
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val + other.val))
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val + float(other.val)))
         try:
             res = float(other)
         except:
@@ -235,6 +283,10 @@ class Float:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return type(self)(self.cap_val(res + self.val))
     def __sub__(self, other) -> Float:
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val - other.val))
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val - float(other.val)))
         try:
             res = float(other)
         except:
@@ -247,6 +299,10 @@ class Float:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return type(self)(self.cap_val(res - self.val))
     def __mul__(self, other) -> Float:
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val * other.val))
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val * float(other.val)))
         try:
             res = float(other)
         except:
@@ -259,6 +315,10 @@ class Float:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return type(self)(self.cap_val(res * self.val))
     def __truediv__(self, other) -> Float:
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val / other.val))
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val / float(other.val)))
         try:
             res = float(other)
         except:
@@ -271,6 +331,10 @@ class Float:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return type(self)(self.cap_val(res / self.val))
     def __mod__(self, other) -> Float:
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val % other.val))
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val % float(other.val)))
         try:
             res = float(other)
         except:
@@ -295,38 +359,64 @@ class Float:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return type(self)(self.cap_val(res ** self.val))
     def __neg__(self) -> Float:
+        if self.val is not None:
+            return make_float(-self.val)
         return type(self)(-self.val)
     def __lt__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(self.val < other.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val < float(other.val))
         try:
             res = float(other)
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return Bool(self.val < res)
     def __gt__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(self.val > other.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val > float(other.val))
         try:
             res = float(other)
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return Bool(self.val > res)
     def __le__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(self.val <= other.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val <= float(other.val))
         try:
             res = float(other)
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return Bool(self.val <= res)
     def __ge__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(self.val >= other.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val >= float(other.val))
         try:
             res = float(other)
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return Bool(self.val >= res)
     def __eq__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(other.val == self.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(float(other.val) == self.val)
         try:
             res = float(other)
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to kuuuuuuuunnnnnnn!!")
         return Bool(res == self.val)
     def __ne__(self, other) -> Bool:
+        if type(other) is Float and other.val is not None:
+            return make_bool(other.val != self.val)
+        if type(other) is Int and other.val is not None:
+            return make_bool(float(other.val) != self.val)
         try:
             res = float(other)
         except:
@@ -385,7 +475,16 @@ class Float:
         return float(val)
 
 class Int:
+    __slots__ = ('val',)
+
     def __init__(self, val):
+        # exact types are converted without matching, like the match below would
+        if type(val) is int and -9999999999 <= val <= 9999999999:
+            self.val = val
+            return
+        if type(val) is Int:
+            self.val = val.val
+            return
         match val:
             case Int()|Float()|Bool()|String()|Array(): val = val.val
         if val is None:
@@ -407,6 +506,14 @@ class Int:
 
     # operator overloading
     def __add__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val + other.val))
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_float(cap_float(self.val + other.val))
+        if type(other) is int and -MAX_EXACT_INT <= other <= MAX_EXACT_INT:
+            return make_int(cap_int(self.val + other))
+        if type(other) is Bool and other.val is not None:
+            return make_int(cap_int(self.val + int(other.val)))
         try:
             res = int(float(other))
         except:
@@ -425,6 +532,14 @@ class Int:
             case Float(): return Float(float(self.cap_val(other.val + self.val)))
             case _: return type(self)(self.cap_val(res + self.val))
     def __sub__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val - other.val))
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_float(cap_float(self.val - other.val))
+        if type(other) is int and -MAX_EXACT_INT <= other <= MAX_EXACT_INT:
+            return make_int(cap_int(self.val - other))
+        if type(other) is Bool and other.val is not None:
+            return make_int(cap_int(self.val - int(other.val)))
         try:
             res = int(float(other))
         except:
@@ -443,6 +558,14 @@ class Int:
             case Float(): return Float(float(self.cap_val(other.val - self.val)))
             case _: return type(self)(self.cap_val(res - self.val))
     def __mul__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val * other.val))
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_float(cap_float(self.val * other.val))
+        if type(other) is int and -MAX_EXACT_INT <= other <= MAX_EXACT_INT:
+            return make_int(cap_int(self.val * other))
+        if type(other) is Bool and other.val is not None:
+            return make_int(cap_int(self.val * int(other.val)))
         try:
             res = int(float(other))
         except:
@@ -461,6 +584,10 @@ class Int:
             case Float(): return Float(float(self.cap_val(other.val * self.val)))
             case _: return type(self)(self.cap_val(res * self.val))
     def __truediv__(self, other) -> Float:
+        if type(other) is Int and other.val is not None:
+            return make_float(cap_float(self.val / float(other.val)))
+        if type(other) is Float and other.val is not None:
+            return make_float(cap_float(self.val / other.val))
         try:
             res = float(other)
         except:
@@ -473,6 +600,14 @@ class Int:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Float(self.cap_val(res / self.val))
     def __mod__(self, other) -> Int | Float:
+        if type(other) is Int and other.val is not None:
+            return make_int(cap_int(self.val % other.val))
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_float(cap_float(self.val % other.val))
+        if type(other) is int and -MAX_EXACT_INT <= other <= MAX_EXACT_INT:
+            return make_int(cap_int(self.val % other))
+        if type(other) is Bool and other.val is not None:
+            return make_int(cap_int(self.val % int(other.val)))
         try:
             res = int(float(other))
         except:
@@ -509,38 +644,76 @@ class Int:
             case Float(): return Float(float(self.cap_val(other.val ** self.val)))
             case _: return type(self)(self.cap_val(res ** self.val))
     def __neg__(self) -> Int:
+        if self.val is not None:
+            return make_int(-self.val)
         return type(self)(-self.val)
     def __lt__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val < other.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(self.val < int(other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_bool(self.val < int(other.val))
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Bool(self.val < res)
     def __gt__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val > other.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(self.val > int(other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_bool(self.val > int(other.val))
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Bool(self.val > res)
     def __le__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val <= other.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(self.val <= int(other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_bool(self.val <= int(other.val))
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Bool(self.val <= res)
     def __ge__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(self.val >= other.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(self.val >= int(other.val))
+        if type(other) is Bool and other.val is not None:
+            return make_bool(self.val >= int(other.val))
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Bool(self.val >= res)
     def __eq__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(other.val == self.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(int(other.val) == self.val)
+        if type(other) is Bool and other.val is not None:
+            return make_bool(int(other.val) == self.val)
         try:
             res = int(float(other))
         except:
             raise ValueError(f"Oh no!! '{other}' cannot be converted to chaaaaaaaaannnnnnnnnn!!")
         return Bool(res == self.val)
     def __ne__(self, other) -> Bool:
+        if type(other) is Int and other.val is not None:
+            return make_bool(other.val != self.val)
+        if type(other) is Float and other.val is not None and other.val == other.val:
+            return make_bool(int(other.val) != self.val)
+        if type(other) is Bool and other.val is not None:
+            return make_bool(int(other.val) != self.val)
         try:
             res = int(float(other))
         except:
@@ -593,3 +766,47 @@ class Int:
         elif val < -9999999999:
             val = -9999999999
         return val
+
+## NATIVE VALUES
+# values of chan and kun locals that the compiler keeps as python ints and floats, capped like Int and Float cap them
+def cap_int(val: int) -> int:
+    'the val of Int(val)'
+    if val > 9999999999:
+        return 9999999999
+    if val < -9999999999:
+        return -9999999999
+    return val
+def cap_float(val: float) -> float:
+    'the val of Float(val), always a float'
+    if val > 9999999999:
+        return 9999999999.0
+    if val < -9999999999:
+        return -9999999999.0
+    return float(val)
+
+## FAST CONSTRUCTORS
+# results of the operators above, which are already converted and capped, so they skip __init__
+# ints this big and smaller are the same after int(float(val)), like the operators convert them
+MAX_EXACT_INT = 2 ** 53
+def make_int(val: int) -> Int:
+    'Int(val) for an int val that is already capped, the same one every time for small vals'
+    if -5 <= val <= 256:
+        return SMALL_INTS[val + 5]
+    res = object.__new__(Int)
+    res.val = val
+    return res
+def make_float(val: float) -> Float:
+    'Float(val) for a float val that is already capped'
+    res = object.__new__(Float)
+    res.val = val
+    return res
+def make_bool(val: bool) -> Bool:
+    return TRUE if val else FALSE
+def boxed(cls: type, val) -> Int | Float | Bool:
+    res = object.__new__(cls)
+    res.val = val
+    return res
+# they are never changed, so they are shared
+SMALL_INTS = [boxed(Int, val) for val in range(-5, 257)]
+TRUE = boxed(Bool, True)
+FALSE = boxed(Bool, False)
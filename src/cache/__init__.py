@@ -0,0 +1,4 @@
+# Treat cache as a package
+from .directory_cache import DirectoryCache
+
+DirectoryCache
@@ -0,0 +1,79 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Callable
+
+class DirectoryCache:
+    '''
+    Directory of cache entries, an entry is a file or a directory named after its key.
+
+    entries are evicted least recently used first once the cache grows past its max size,
+    a hit counts as a use. subclasses give the format of an entry
+    '''
+    def __init__(self, directory: str | Path, max_size: int) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def touch(self, entry: Path) -> None:
+        'marks an entry as recently used'
+        os.utime(entry)
+
+    def write(self, key: str, fill: Callable[[Path], None]) -> None:
+        '''
+        stores the entry that fill writes at the path it is given, then evicts old entries if over the max size.
+        the entry is written next to where it goes first so that a half written entry is never read
+        '''
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self.directory / key
+        # per process so that processes writing the same entry do not write over each other
+        partial = self.directory / f"{key}.partial.{os.getpid()}"
+        self.remove(partial)
+        fill(partial)
+        try:
+            if partial.is_dir():
+                # a directory can only replace an empty one
+                self.remove(entry)
+            os.replace(partial, entry)
+        except OSError:
+            self.remove(partial)
+            # another process wrote the same entry in between, which is as good as this one
+            if not entry.exists():
+                raise
+        self.evict()
+
+    def entries(self) -> list[tuple[Path, int]]:
+        'entries and their sizes, least recently used first'
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for entry in self.directory.iterdir():
+            if '.partial' in entry.name:
+                continue
+            try:
+                stat = entry.stat()
+                size = sum(f.stat().st_size for f in entry.iterdir()) if entry.is_dir() else stat.st_size
+            except (FileNotFoundError, NotADirectoryError):
+                # evicted by another process
+                continue
+            entries.append((entry, stat.st_mtime, size))
+        entries.sort(key=lambda entry: entry[1])
+        return [(entry, size) for entry, _, size in entries]
+
+    def remove(self, entry: Path) -> None:
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total = sum(size for _, size in entries)
+        # the newest entry is kept even if it is bigger than the max size by itself
+        for entry, size in entries[:-1]:
+            if total <= self.max_size:
+                break
+            self.remove(entry)
+            total -= size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
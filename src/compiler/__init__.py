@@ -1 +1,4 @@
 from .compiler import Compiler
+from .cache import BuildCache
+from .executor import Executor, ProgramStopped
+from .lowering import lower
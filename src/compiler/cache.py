@@ -0,0 +1,59 @@
+import hashlib
+import shutil
+import sys
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+
+from constants.path import BUILD_CACHE
+from src.cache import DirectoryCache
+
+# 512 MB, a onefile executable is around 10 MB
+MAX_CACHE_SIZE = 512 * 1024 * 1024
+
+@cache
+def toolchain_version() -> str:
+    'the python and pyinstaller versions, since either changes the executable built'
+    try:
+        pyinstaller = metadata.version('pyinstaller')
+    except metadata.PackageNotFoundError:
+        pyinstaller = 'none'
+    return f"{sys.version} {sys.platform} pyinstaller {pyinstaller}"
+
+class BuildCache(DirectoryCache):
+    '''
+    Content addressed cache of built executables.
+
+    an entry is a directory named after the hash of everything that goes into the build,
+    holding the executable.
+    '''
+    def __init__(self, directory: str | Path = BUILD_CACHE, max_size: int = MAX_CACHE_SIZE) -> None:
+        super().__init__(directory, max_size)
+
+    def key(self, source: str) -> str:
+        'source should include the runtime the program is built with'
+        digest = hashlib.sha256()
+        for part in [toolchain_version(), source]:
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str, destination: str | Path) -> bool:
+        'copies the cached executable to destination, returns if it was cached'
+        entry = self.directory / key
+        executables = list(entry.iterdir()) if entry.is_dir() else []
+        if not executables:
+            return False
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(executables[0], destination)
+        self.touch(entry)
+        return True
+
+    def put(self, key: str, executable: str | Path) -> None:
+        'stores a built executable, then evicts old entries if over the max size'
+        executable = Path(executable)
+        def fill(partial: Path) -> None:
+            partial.mkdir()
+            shutil.copy2(executable, partial / executable.name)
+        self.write(key, fill)
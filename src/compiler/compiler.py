@@ -3,13 +3,17 @@ from pathlib import Path
 import tempfile
 import subprocess
 
-from constants.path import BUILTINS
+from .cache import BuildCache
+from .runtime import PROGRAM_HEADER, install, runtime_source
 
 class Compiler:
-    def __init__(self, py_source: str, filename: str) -> None:
+    def __init__(self, py_source: str, filename: str, cache: BuildCache | None = None) -> None:
         if not (res := self.validate_file(filename)): return
         self.filename = res
-        self.source = self.builtins() + py_source
+        self.source = PROGRAM_HEADER + py_source
+        # programs are written next to the runtime so that they can import it
+        self.runtime = install()
+        self.cache = cache if cache is not None else BuildCache()
 
     def validate_file(self, filename: str) -> str|None:
         # TODO: add more validations maybe?
@@ -19,7 +23,15 @@ class Compiler:
         return Path(filename).stem
 
     def compile(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        'builds the executable with pyinstaller, unless the same source was already built'
+        exe_path = Path("./dist") / f"{self.filename}.exe"
+        key = self.cache.key(runtime_source() + self.source)
+        if self.cache.get(key, exe_path):
+            return
+        # so that a failed build does not cache a stale executable
+        exe_path.unlink(missing_ok=True)
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', dir=self.runtime.parent, delete=False) as f:
             f.write(self.source)
             tmp_file_path = f.name
         subprocess.run(['pyinstaller',
@@ -28,6 +40,8 @@ class Compiler:
                         '--specpath', f'./build/{self.filename}',
                         ])
         os.remove(tmp_file_path)
+        if exe_path.exists():
+            self.cache.put(key, exe_path)
 
     def run(self):
         exe_name = f"{self.filename}.exe"
@@ -35,28 +49,8 @@ class Compiler:
         subprocess.run([exe_path])
 
     def run_python(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', dir=self.runtime.parent, delete=False) as f:
             f.write(self.source)
             tmp_file_path = f.name
         cmd = f'start cmd.exe /k python {tmp_file_path}'
         subprocess.run(cmd, shell=True)
-
-    def builtins(self) -> str:
-        contents = "from __future__ import annotations\n\n"
-        # remove any lines starting with
-        remove = [
-            "#",
-            "from .namespace",
-            "from __future__",
-            "from src.",
-        ]
-        for path in BUILTINS:
-            with open(path, 'r') as f:
-                res = f.readlines()
-                for r in remove:
-                    res = [line for line in res if (
-                        not line.strip().startswith(r)
-                        and not line.strip() == '')
-                    ]
-                contents += ''.join(res) + '\n'
-        return contents
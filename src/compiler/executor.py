@@ -0,0 +1,128 @@
+'''
+In process execution of transpiled programs.
+
+the runtime is executed once per process, and every run copies its names into a fresh namespace,
+so a run pays neither the interpreter startup nor the runtime import.
+'''
+import __future__
+import ast
+import builtins
+import ctypes
+import sys
+import threading
+import traceback
+from functools import cache
+from typing import Callable, TextIO
+
+from .runtime import RUNTIME_MODULE, runtime_source
+
+PROGRAM_FILENAME = "<uwu>"
+
+@cache
+def runtime_namespace() -> dict[str, object]:
+    'the names the runtime exports, made once per process'
+    namespace = {'__name__': RUNTIME_MODULE}
+    exec(compile(runtime_source(), f"<{RUNTIME_MODULE}>", 'exec'), namespace)
+    return {name: namespace[name] for name in namespace['__all__']}
+
+class ProgramStopped(BaseException):
+    'raised in a program that was stopped, not an Exception so that the program cannot catch it'
+
+class Executor:
+    '''
+    Runs a transpiled program in its own namespace, with the runtime already in it.
+
+    print and input are replaced only in the namespace of the program, so the output of the IDE
+    is not mixed with the output of the program, and programs can run in a thread.
+    the program should be transpiled without clearing the screen.
+    it can also be given as the python syntax tree lower makes, which is compiled without being parsed.
+    a started program can be stopped, which raises ProgramStopped in it
+    '''
+    def __init__(self, py_source: str | ast.Module, stdout: TextIO = None, stdin: TextIO = None) -> None:
+        self.code = compile(py_source, PROGRAM_FILENAME, 'exec',
+                            flags=__future__.annotations.compiler_flag, dont_inherit=True)
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stopped = threading.Event()
+        self.thread: threading.Thread | None = None
+        # set while the code of the program is executing, the only time it can be interrupted
+        self.running = threading.Lock()
+
+    def namespace(self) -> dict[str, object]:
+        program_builtins = dict(vars(builtins))
+        program_builtins['print'] = self.print
+        program_builtins['input'] = self.input
+        return {'__name__': '__main__', '__builtins__': program_builtins, **runtime_namespace()}
+
+    def print(self, *values, sep=' ', end='\n', file=None, flush=False):
+        if self.stopped.is_set():
+            raise ProgramStopped()
+        print(*values, sep=sep, end=end, file=self.stdout if file is None else file, flush=flush)
+
+    def input(self, prompt=''):
+        if self.stopped.is_set():
+            raise ProgramStopped()
+        self.stdout.write(str(prompt))
+        line = self.stdin.readline()
+        # stdin is woken with an empty line when the program is stopped
+        if self.stopped.is_set():
+            raise ProgramStopped()
+        if not line:
+            raise EOFError('EOF when reading a line')
+        return line.rstrip('\n')
+
+    def run(self) -> BaseException | None:
+        'returns the exception that stopped the program, which is also written to stdout'
+        try:
+            with self.running:
+                # stopped before it could be interrupted
+                if self.stopped.is_set():
+                    raise ProgramStopped()
+                exec(self.code, self.namespace())
+        except SystemExit as e:
+            return e if e.code not in (None, 0) else None
+        except ProgramStopped as e:
+            self.stdout.write("\nOwO... the program was stopped\n")
+            return e
+        except Exception as e:
+            if self.stopped.is_set():
+                # the stop was caught and turned into another error by the runtime
+                self.stdout.write("\nOwO... the program was stopped\n")
+                return ProgramStopped()
+            # only the frames of the program
+            tb = e.__traceback__
+            while tb is not None and tb.tb_frame.f_code.co_filename != PROGRAM_FILENAME:
+                tb = tb.tb_next
+            self.stdout.write(''.join(traceback.format_exception(type(e), e, tb)))
+            return e
+        return None
+
+    def start(self, on_done: Callable[[BaseException | None], None] = None) -> threading.Thread:
+        'runs the program in a thread, so that it can wait for input without blocking the caller'
+        def target():
+            try:
+                error = self.run()
+            except ProgramStopped as e:
+                # stopped just as the program ended
+                error = e
+            if on_done is not None:
+                on_done(error)
+        self.thread = threading.Thread(target=target, name="UwU Run", daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def stop(self):
+        '''
+        stops a started program. it stops at its next print or input, or at once if it is busy without them.
+        a program waiting for input only stops when its stdin returns, so stdin should be woken after
+        '''
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        if not self.is_running() or not self.running.locked():
+            return
+        # raised in the thread the next time it runs python code, so loops without print stop too
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self.thread.ident), ctypes.py_object(ProgramStopped))
@@ -0,0 +1,653 @@
+'''
+Lowering of syntax trees straight to python syntax trees.
+
+the tree made is the one python would parse from python_string, so a lowered program runs like a transpiled one,
+without writing python source to parse it again. nodes are located at the uwu source they come from,
+so errors of a running program point at uwu lines.
+python_string is still what is written to files, eg. for pyinstaller
+
+when specialized, chan, kun and sama locals of functions that the type checker proved are only ever given numbers
+and bools are kept as python ints, floats and bools. they are capped and converted like Int, Float and Bool do it,
+and are boxed in the runtime classes only where they leave the function or are used as something else,
+eg. passed, returned, accessed, or put in arrays and fields
+'''
+import ast
+import gc
+import warnings
+from contextlib import nullcontext
+
+from src.lexer.token import Token, TokenType, UniqueTokenType
+from src.lexer.context import CompileContext, current_context
+from src.parser.productions import *
+from src.builtin.types.number import Int, Float
+
+_BIN_OPS = {
+    TokenType.ADDITION_SIGN: ast.Add,
+    TokenType.DASH: ast.Sub,
+    TokenType.MULTIPLICATION_SIGN: ast.Mult,
+    TokenType.DIVISION_SIGN: ast.Div,
+    TokenType.MODULO_SIGN: ast.Mod,
+}
+_COMPARE_OPS = {
+    TokenType.LESS_THAN_SIGN: ast.Lt,
+    TokenType.LESS_THAN_OR_EQUAL_SIGN: ast.LtE,
+    TokenType.GREATER_THAN_SIGN: ast.Gt,
+    TokenType.GREATER_THAN_OR_EQUAL_SIGN: ast.GtE,
+    TokenType.EQUALITY_OPERATOR: ast.Eq,
+    TokenType.INEQUALITY_OPERATOR: ast.NotEq,
+}
+_BOOL_OPS = {
+    TokenType.AND_OPERATOR: ast.And,
+    TokenType.OR_OPERATOR: ast.Or,
+}
+_POSTFIX_OPS = {
+    TokenType.INCREMENT_OPERATOR: ast.Add,
+    TokenType.DECREMENT_OPERATOR: ast.Sub,
+}
+# the runtime class, python type and capping function of the dtypes that can be native
+_NATIVE = {
+    TokenType.CHAN: ('Int', int, 'cap_int'),
+    TokenType.KUN: ('Float', float, 'cap_float'),
+    TokenType.SAMA: ('Bool', bool, None),
+}
+_NUMBERS = (TokenType.CHAN, TokenType.KUN)
+
+# code every class and program gets, which does not come from the uwu source
+_REPR = '''
+def __repr__(self):
+    return f"{self.__class__.__name__[1:]}({', '.join(f'{key[1:]}={value}' for key, value in self.__dict__.items())})"
+def __str__(self):
+    return f"{self.__class__.__name__[1:]}({', '.join(f'{key[1:]}={value}' for key, value in self.__dict__.items())})"
+'''
+_CLEAR_SCREEN = '''
+import platform
+import os
+os.system('cls' if platform.system() == 'Windows' else 'clear')
+'''
+_LOCATION = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+
+def _scaffold(source: str) -> list[ast.stmt]:
+    'fixed code, unlocated so that it takes the location of where it is put'
+    statements = ast.parse(source).body
+    for statement in statements:
+        for node in ast.walk(statement):
+            for name in _LOCATION:
+                if name in node.__dict__:
+                    delattr(node, name)
+    return statements
+
+def _located(node: ast.AST, start: tuple[int, int] | None, end: tuple[int, int] | None = None) -> ast.AST:
+    'node located at 0 based (line, column) positions of the uwu source, left for its parent to locate if start is unknown'
+    if type(start) is not tuple or start[0] < 0:
+        return node
+    if type(end) is not tuple or end < start:
+        end = start
+    node.lineno, node.col_offset = start[0] + 1, start[1]
+    node.end_lineno, node.end_col_offset = end[0] + 1, end[1] + 1
+    return node
+
+def _span(value) -> tuple:
+    if isinstance(value, Token):
+        return value.position, value.end_position
+    return getattr(value, 'start_pos', None), getattr(value, 'end_pos', None)
+
+def _name(id: str) -> ast.Name:
+    return ast.Name(id=id, ctx=ast.Load())
+
+def _call(func: ast.expr | str, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=_name(func) if isinstance(func, str) else func, args=list(args), keywords=[])
+
+def _store(target: ast.expr) -> ast.expr:
+    target.ctx = ast.Store()
+    return target
+
+def _attach(base: ast.expr, node: ast.expr) -> ast.expr:
+    'node with its leftmost name accessed on base, like "base." written in front of it'
+    match node:
+        case ast.Name():
+            return ast.copy_location(ast.Attribute(value=base, attr=node.id, ctx=node.ctx), node)
+        case ast.Attribute() | ast.Subscript():
+            node.value = _attach(base, node.value)
+        case ast.Call():
+            node.func = _attach(base, node.func)
+        case _:
+            raise ValueError(f"Cannot access {ast.dump(node)}")
+    return node
+
+def _dotted(node: ast.expr) -> str:
+    'the text of a name, or of names accessed on each other'
+    match node:
+        case ast.Name():
+            return node.id
+        case ast.Attribute():
+            return f"{_dotted(node.value)}.{node.attr}"
+        case _:
+            raise ValueError(f"Not a name: {ast.dump(node)}")
+
+def _string(text: str) -> str:
+    'the value of the text of a python string literal, without its quotes'
+    with warnings.catch_warnings():
+        # eg. \| is kept as is, like when the transpiled source is compiled
+        warnings.simplefilter('ignore')
+        return ast.literal_eval(f'"{text}"')
+
+def _type_params() -> dict[str, list]:
+    # type parameters of definitions are a field since python 3.12
+    return {'type_params': []} if 'type_params' in ast.FunctionDef._fields else {}
+
+def _body(statements: list[ast.stmt]) -> list[ast.stmt]:
+    # blocks with only comments in them
+    return statements or [ast.Pass()]
+
+def _statements(block: BlockStatement):
+    'the statements in block and in the blocks nested in it'
+    for s in block.statements:
+        yield s
+        match s:
+            case IfStatement():
+                yield from _statements(s.then)
+                for e in s.else_if:
+                    yield from _statements(e.then)
+                yield from _statements(s.else_block)
+            case WhileLoop():
+                yield from _statements(s.body)
+            case ForLoop():
+                yield s.init
+                yield from _statements(s.body)
+
+class Lowering:
+    '''
+    Lowers a program to the python syntax tree of its python_string.
+    class properties are tracked in the class_properties of the current context, like python_string does
+    - specialize: keep the locals that can be native as python values
+    '''
+    def __init__(self, clear_screen: bool = True, specialize: bool = True) -> None:
+        self.clear_screen = clear_screen
+        self.specialize = specialize
+        # the dtypes of the native locals of the function being lowered, by their python names
+        self.natives: dict[str, TokenType] = {}
+        # shared by every class, since compile does not change the trees it is given
+        self.methods = _scaffold(_REPR)
+        # breaks are ellipses in the first run of the body of a do while
+        self.in_do = False
+
+    def lower_program(self, program: Program) -> ast.Module:
+        body = []
+        if program.mainuwu:
+            body.append(self.lower_function(program.mainuwu))
+        for c in program.classes:
+            body.append(self.lower_class(c))
+        for fn in program.functions:
+            body.append(self.lower_function(fn))
+        run = _scaffold(_CLEAR_SCREEN) if self.clear_screen else []
+        for g in program.globals:
+            run.append(self.lower_statement(g))
+        run.append(ast.Expr(_call('main')))
+        body.append(ast.If(test=ast.Compare(left=_name('__name__'), ops=[ast.Eq()], comparators=[ast.Constant('__main__')]),
+                           body=run, orelse=[]))
+        return ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+
+    def lower_class(self, cwass: Class) -> ast.ClassDef:
+        class_properties = current_context().class_properties
+        body = []
+        if cwass.params or cwass.properties:
+            init = []
+            for param in cwass.params:
+                id = self.lower_token(param.id, cwass=True)
+                name = _dotted(id)
+                init.append(_located(ast.AnnAssign(target=_store(_attach(_name('self'), id)),
+                                                   annotation=self.lower_token(param.dtype, cwass=True),
+                                                   value=self.lower_param_value(param, cwass=True), simple=0), *_span(param)))
+                class_properties.add(name)
+            for prop in cwass.properties:
+                statement = self.lower_declaration(prop, cwass=True)
+                statement.target = _attach(_name('self'), statement.target)
+                statement.simple = 0
+                init.append(statement)
+                class_properties.add(_dotted(self.lower_token(prop.id, cwass=True)))
+            params = [self.lower_param(p) for p in cwass.params]
+            body.append(self.function_def('__init__', [ast.arg(arg='self'), *params], init))
+        body += self.methods
+        for method in cwass.methods:
+            body.append(self.lower_function(method, cwass=True))
+        class_properties.clear()
+        return _located(ast.ClassDef(name=_dotted(self.lower_token(cwass.id, cwass=True)), bases=[], keywords=[],
+                                     body=body, decorator_list=[], **_type_params()), *_span(cwass))
+
+    def lower_function(self, fn: Function, cwass=False) -> ast.FunctionDef:
+        if self.specialize:
+            self.natives = self.native_locals(fn, cwass=cwass)
+        try:
+            params = [self.lower_param(p, cwass=cwass) for p in fn.params]
+            if cwass:
+                params.insert(0, ast.arg(arg='self'))
+            body = []
+            for param in fn.params:
+                id = self.lower_token(param.id, cwass=cwass)
+                value = self.lower_param_value(param, cwass=cwass)
+                if isinstance(id, ast.Name) and id.id in self.natives:
+                    value = ast.Attribute(value=value, attr='val', ctx=ast.Load())
+                body.append(_located(ast.AnnAssign(target=_store(id), annotation=self.annotation(id, param.dtype, cwass=cwass),
+                                                   value=value, simple=int(isinstance(id, ast.Name))), *_span(param)))
+            body += self.lower_block(fn.body, cwass=cwass)
+        finally:
+            self.natives = {}
+        name = _dotted(self.lower_token(fn.id, cwass=cwass)).rpartition('.')[2]
+        return _located(self.function_def(name, params, body), *_span(fn))
+
+    def native_locals(self, fn: Function, cwass=False) -> dict[str, TokenType]:
+        '''
+        the params and locals of fn that can be native, by their python names.
+        those are the chan, kun and sama ones that are always initialized, with a single dtype,
+        and with only native values of their dtype given to them
+        '''
+        class_properties = current_context().class_properties if cwass else ()
+        dtypes: dict[str, TokenType | UniqueTokenType] = {}
+        # the values given to each name, with the dtype they are converted to
+        given: dict[str, list[tuple[Value | Token, TokenType | UniqueTokenType | None]]] = {}
+        excluded = set()
+
+        def declare(name: str, dtype: TokenType | UniqueTokenType):
+            if dtypes.setdefault(name, dtype) is not dtype or dtype not in _NATIVE or name in class_properties:
+                excluded.add(name)
+
+        for param in fn.params:
+            declare(f"_{param.id.lexeme}", param.dtype.token)
+        for s in _statements(fn.body):
+            match s:
+                case Declaration():
+                    name = f"_{s.id.lexeme}"
+                    declare(name, s.dtype.token)
+                    if s.initialized:
+                        given.setdefault(name, []).append((s.value, s.dtype.token))
+                    else:
+                        excluded.add(name)
+                case Assignment() if isinstance(s.id, Token):
+                    given.setdefault(f"_{s.id.lexeme}", []).append((s.value, s.dtype.token))
+                case ForLoop() if isinstance(s.init.id, Token):
+                    # updates are not converted
+                    given.setdefault(f"_{s.init.id.lexeme}", []).append((s.update, None))
+
+        # a local stops being native when a value given to it is not native, which can make others not native
+        self.natives = {name: dtype for name, dtype in dtypes.items() if name not in excluded}
+        changed = True
+        while changed:
+            changed = False
+            for name, dtype in list(self.natives.items()):
+                for value, converted_to in given.get(name, []):
+                    value_dtype = self.native_type(value)
+                    if value_dtype is None or (converted_to or value_dtype) is not dtype:
+                        del self.natives[name]
+                        changed = True
+                        break
+        return self.natives
+
+    def lower_param(self, param: Declaration, cwass=False) -> ast.arg:
+        id = self.lower_token(param.id, cwass=cwass)
+        return _located(ast.arg(arg=_dotted(id).rpartition('.')[2], annotation=self.lower_token(param.dtype, cwass=cwass)),
+                        *_span(param))
+
+    def lower_param_value(self, param: Declaration, cwass=False) -> ast.expr:
+        'param converted to its dtype when it is passed'
+        id = self.lower_token(param.id, cwass=cwass)
+        if param.dtype.is_unique_type():
+            return id
+        return _call(self.lower_token(param.dtype, cwass=cwass), id)
+
+    def function_def(self, name: str, params: list[ast.arg], body: list[ast.stmt]) -> ast.FunctionDef:
+        args = ast.arguments(posonlyargs=[], args=params, vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+        return ast.FunctionDef(name=name, args=args, body=_body(body), decorator_list=[], returns=None,
+                               **_type_params())
+
+    def lower_block(self, block: BlockStatement, cwass=False) -> list[ast.stmt]:
+        statements = []
+        for s in block.statements:
+            match s:
+                case Comment():
+                    pass
+                case ForLoop():
+                    statements += self.lower_for_loop(s, cwass=cwass)
+                case WhileLoop():
+                    statements += self.lower_while_loop(s, cwass=cwass)
+                case _:
+                    statements.append(self.lower_statement(s, cwass=cwass))
+        return statements
+
+    def lower_statement(self, statement: Statement, cwass=False) -> ast.stmt:
+        match statement:
+            case Declaration():
+                res = self.lower_declaration(statement, cwass=cwass)
+            case Assignment():
+                if not statement.dtype.exists(): raise Exception(f"UNREACHABLE::no dtype for assignment: '{statement.id.flat_string()}'")
+                target = self.lower_member(statement.id, cwass=cwass)
+                res = ast.Assign(targets=[_store(target)], value=self.convert(statement.dtype, statement.value, cwass=cwass,
+                                                                              native=self.is_native(target)))
+            case Print():
+                res = ast.Expr(_call('print', *[self.lower_printed(v, cwass=cwass) for v in statement.values]))
+            case IfStatement():
+                res = self.lower_if(statement, cwass=cwass)
+            case ReturnStatement():
+                res = ast.Return(value=self.lower_value(statement.expr, cwass=cwass))
+            case Break():
+                res = ast.Break() if statement.in_loop and not self.in_do else ast.Expr(ast.Constant(...))
+            case Input() | FnCall() | ClassAccessor():
+                res = ast.Expr(self.lower_value(statement, cwass=cwass))
+            case _:
+                raise ValueError(f"Unknown statement: {statement}")
+        return _located(res, *_span(statement))
+
+    def lower_declaration(self, decl: Declaration, cwass=False) -> ast.AnnAssign:
+        target = self.lower_token(decl.id, cwass=cwass)
+        if decl.initialized:
+            value = self.convert(decl.dtype, decl.value, cwass=cwass, native=self.is_native(target))
+        else:
+            value = ast.Constant(None)
+        return _located(ast.AnnAssign(target=_store(target), annotation=self.annotation(target, decl.dtype, cwass=cwass),
+                                      value=value, simple=int(isinstance(target, ast.Name))), *_span(decl))
+
+    def annotation(self, target: ast.expr, dtype: Token, cwass=False) -> ast.expr:
+        if self.is_native(target):
+            return _name(_NATIVE[dtype.token][1].__name__)
+        return self.lower_token(dtype, cwass=cwass)
+
+    def convert(self, dtype: Token, value: Value, cwass=False, native=False) -> ast.expr:
+        '''
+        value converted to dtype when it is declared or assigned.
+        - native: the value is given to a native local, so it is not boxed
+        '''
+        if self.specialize and dtype.token in _NATIVE and (value_dtype := self.native_type(value)) is not None:
+            box = _NATIVE[dtype.token][0]
+            if native:
+                return self.lower_native(value, dtype=dtype.token)
+            if value_dtype is dtype.token:
+                # boxing caps it
+                return _call(box, self.lower_native(value, capped=False))
+            return _call(box, self.lower_native(value, dtype=dtype.token))
+        res = self.lower_value(value, cwass=cwass)
+        if dtype.token == TokenType.CHAN:
+            # convert value to floats first then to int
+            # this for strings being float strings but passed as int
+            return _call(self.lower_token(dtype, cwass=cwass), _call(TokenType.KUN.python_string(), res))
+        if dtype.is_unique_type() or dtype.is_arr_type():
+            return res
+        return _call(self.lower_token(dtype, cwass=cwass), res)
+
+    def lower_if(self, if_stmt: IfStatement | ElseIfStatement, cwass=False) -> ast.If:
+        res = ast.If(test=self.lower_condition(if_stmt.condition, cwass=cwass),
+                     body=_body(self.lower_block(if_stmt.then, cwass=cwass)), orelse=[])
+        if isinstance(if_stmt, IfStatement):
+            orelse = res.orelse
+            for e in if_stmt.else_if:
+                elif_stmt = _located(self.lower_if(e, cwass=cwass), *_span(e))
+                orelse.append(elif_stmt)
+                orelse = elif_stmt.orelse
+            if if_stmt.else_block.statements:
+                orelse += _body(self.lower_block(if_stmt.else_block, cwass=cwass))
+        return res
+
+    def lower_while_loop(self, loop: WhileLoop, cwass=False) -> list[ast.stmt]:
+        res = []
+        if loop.is_do:
+            # initial body of do while, without breaks
+            in_do, self.in_do = self.in_do, True
+            try:
+                res += self.lower_block(loop.body, cwass=cwass)
+            finally:
+                self.in_do = in_do
+        while_loop = ast.While(test=self.lower_condition(loop.condition, cwass=cwass),
+                               body=_body(self.lower_block(loop.body, cwass=cwass)), orelse=[])
+        res.append(_located(while_loop, *_span(loop)))
+        return res
+
+    def lower_for_loop(self, loop: ForLoop, cwass=False) -> list[ast.stmt]:
+        init = self.lower_statement(loop.init)
+        target = self.lower_token(loop.init.id, cwass=cwass)
+        value = self.lower_native(loop.update) if self.is_native(target) else self.lower_value(loop.update, cwass=cwass)
+        update = _located(ast.Assign(targets=[_store(target)], value=value), *_span(loop.update))
+        body = self.lower_block(loop.body, cwass=cwass) + [update]
+        while_loop = ast.While(test=self.lower_condition(loop.condition, cwass=cwass), body=body, orelse=[])
+        return [init, _located(while_loop, *_span(loop))]
+
+    def lower_value(self, value: Value | Token, cwass=False) -> ast.expr:
+        if (dtype := self.specialized_type(value)) is not None:
+            return _located(_call(_NATIVE[dtype][0], self.lower_native(value, capped=False)), *_span(value))
+        match value:
+            case Token():
+                return self.lower_token(value, cwass=cwass)
+            case PrefixExpression():
+                res = ast.UnaryOp(op=ast.USub(), operand=self.lower_value(value.right, cwass=cwass))
+            case InfixExpression():
+                op = value.op.token
+                if op in _BOOL_OPS:
+                    res = ast.BoolOp(op=_BOOL_OPS[op](), values=[self.lower_truth(value.left, cwass=cwass),
+                                                                 self.lower_truth(value.right, cwass=cwass)])
+                elif op in _COMPARE_OPS:
+                    res = ast.Compare(left=self.lower_value(value.left, cwass=cwass), ops=[_COMPARE_OPS[op]()],
+                                      comparators=[self.lower_value(value.right, cwass=cwass)])
+                else:
+                    res = ast.BinOp(left=self.lower_value(value.left, cwass=cwass), op=_BIN_OPS[op](),
+                                    right=self.lower_value(value.right, cwass=cwass))
+            case PostfixExpression():
+                res = ast.BinOp(left=self.lower_value(value.left, cwass=cwass), op=_POSTFIX_OPS[value.op.token](),
+                                right=ast.Constant(1))
+            case StringLiteral() | StringFmt() | Input():
+                res = self.lower_string(value, cwass=cwass)
+                for c in value.concats:
+                    res = ast.BinOp(left=res, op=ast.Add(), right=self.lower_value(c, cwass=cwass))
+            case ArrayLiteral():
+                res = _call('Array', ast.List(elts=[self.lower_value(e, cwass=cwass) for e in value.elements], ctx=ast.Load()))
+            case FnCall():
+                res = _call(self.lower_member(value.id, cwass=cwass), *[self.lower_value(a, cwass=cwass) for a in value.args])
+                if value.need_self:
+                    res = _attach(_name('self'), res)
+            case IndexedIdentifier():
+                res = self.lower_member(value.id, cwass=cwass)
+                for index in value.index:
+                    res = ast.Subscript(value=res, slice=self.lower_index(index, cwass=cwass), ctx=ast.Load())
+            case ClassConstructor():
+                res = _call(self.lower_member(value.id, cwass=cwass), *[self.lower_value(a, cwass=cwass) for a in value.args])
+            case ClassAccessor():
+                res = _attach(self.lower_value(value.id, cwass=cwass), self.lower_member(value.accessed, cwass=cwass))
+            case _:
+                raise ValueError(f"Unknown value: {value}")
+        return _located(res, *_span(value))
+
+    def lower_member(self, value: Value | Token, cwass=False) -> ast.expr:
+        'value that is a name or accessed on something, which is never boxed'
+        match value:
+            case Token():
+                return self.lower_token(value, cwass=cwass)
+            case ClassAccessor():
+                return _located(_attach(self.lower_member(value.id, cwass=cwass), self.lower_member(value.accessed, cwass=cwass)),
+                                *_span(value))
+        return self.lower_value(value, cwass=cwass)
+
+    def lower_condition(self, value: Value | Token, cwass=False) -> ast.expr:
+        'value only checked for truth'
+        if self.specialized_type(value) is not None:
+            return self.lower_native(value, capped=False)
+        return self.lower_value(value, cwass=cwass)
+
+    def lower_truth(self, value: Value | Token, cwass=False) -> ast.expr:
+        'the Bool of value'
+        # a boxed native value has the truth of the value
+        if self.specialized_type(value) is not None:
+            return _call('Bool', self.lower_native(value, capped=False))
+        return _call('Bool', self.lower_value(value, cwass=cwass))
+
+    def lower_printed(self, value: Value | Token, cwass=False) -> ast.expr:
+        'value converted to a string, which is the same for ints and floats as for Int and Float'
+        if self.specialized_type(value) in _NUMBERS:
+            return self.lower_native(value)
+        return self.lower_value(value, cwass=cwass)
+
+    def lower_index(self, value: Value | Token, cwass=False) -> ast.expr:
+        if self.specialized_type(value) is not None:
+            return self.lower_native(value, dtype=TokenType.CHAN)
+        return _call('int', self.lower_value(value, cwass=cwass))
+
+    def specialized_type(self, value: Value | Token) -> TokenType | None:
+        '''
+        the dtype of value if it is lowered natively when specialized.
+        literals on their own are left as they are written, since Float keeps an int when a float literal is capped
+        '''
+        if not self.specialize or isinstance(value, Token) and f"_{value.lexeme}" not in self.natives:
+            return None
+        return self.native_type(value)
+
+    def is_native(self, target: ast.expr) -> bool:
+        return isinstance(target, ast.Name) and target.id in self.natives
+
+    def native_type(self, value: Value | Token) -> TokenType | None:
+        'the dtype of value if it can be evaluated natively, None if it has to be boxed'
+        match value:
+            case Token():
+                match value.token:
+                    case TokenType.INT_LITERAL: return TokenType.CHAN
+                    case TokenType.FLOAT_LITERAL: return TokenType.KUN
+                    case TokenType.FAX | TokenType.CAP: return TokenType.SAMA
+                    case UniqueTokenType(): return self.natives.get(f"_{value.lexeme}")
+                return None
+            case PrefixExpression() | PostfixExpression():
+                dtype = self.native_type(value.right if isinstance(value, PrefixExpression) else value.left)
+                return dtype if dtype in _NUMBERS else None
+            case InfixExpression():
+                left, right = self.native_type(value.left), self.native_type(value.right)
+                if left is None or right is None:
+                    return None
+                op = value.op.token
+                if op in _BOOL_OPS:
+                    return TokenType.SAMA
+                if left not in _NUMBERS or right not in _NUMBERS:
+                    return None
+                if op in _COMPARE_OPS:
+                    return TokenType.SAMA
+                if op not in _BIN_OPS:
+                    return None
+                if op == TokenType.DIVISION_SIGN or left is TokenType.KUN or right is TokenType.KUN:
+                    return TokenType.KUN
+                return TokenType.CHAN
+        return None
+
+    def lower_native(self, value: Value | Token, capped=True, dtype: TokenType = None) -> ast.expr:
+        '''
+        the python value of value, which native_type gives the dtype of.
+        - capped: the result of arithmetic is capped, not needed when it is boxed
+        - dtype: converted to dtype, like Int(Float(value)), Float(value) or Bool(value) do
+        '''
+        value_dtype = self.native_type(value)
+        match value:
+            case Token():
+                match value.token:
+                    # folded like the runtime makes them
+                    case TokenType.INT_LITERAL: res = ast.Constant(Int(value.lexeme).val)
+                    case TokenType.FLOAT_LITERAL: res = ast.Constant(float(Float(value.lexeme).val))
+                    case TokenType.FAX: res = ast.Constant(True)
+                    case TokenType.CAP: res = ast.Constant(False)
+                    case _: res = _name(f"_{value.lexeme}")
+            case PrefixExpression():
+                res = ast.UnaryOp(op=ast.USub(), operand=self.lower_native(value.right))
+            case PostfixExpression():
+                res = ast.BinOp(left=self.lower_native(value.left), op=_POSTFIX_OPS[value.op.token](), right=ast.Constant(1))
+                if capped:
+                    res = _call(_NATIVE[value_dtype][2], res)
+            case InfixExpression():
+                op = value.op.token
+                left, right = self.native_type(value.left), self.native_type(value.right)
+                lhs, rhs = self.lower_native(value.left), self.lower_native(value.right)
+                if op in _BOOL_OPS:
+                    res = ast.BoolOp(op=_BOOL_OPS[op](), values=[self.convert_native(lhs, left, TokenType.SAMA),
+                                                                 self.convert_native(rhs, right, TokenType.SAMA)])
+                elif op in _COMPARE_OPS:
+                    # Int compares with the other value truncated
+                    if left is TokenType.CHAN:
+                        rhs = self.convert_native(rhs, right, TokenType.CHAN)
+                    res = ast.Compare(left=lhs, ops=[_COMPARE_OPS[op]()], comparators=[rhs])
+                else:
+                    if op == TokenType.DIVISION_SIGN and left is right is TokenType.CHAN:
+                        rhs = self.convert_native(rhs, right, TokenType.KUN)
+                    res = ast.BinOp(left=lhs, op=_BIN_OPS[op](), right=rhs)
+                    # a remainder is never bigger than what it is of
+                    if capped and op != TokenType.MODULO_SIGN:
+                        res = _call(_NATIVE[value_dtype][2], res)
+            case _:
+                raise ValueError(f"Not a native value: {value}")
+        res = _located(res, *_span(value))
+        if dtype is not None:
+            res = self.convert_native(res, value_dtype, dtype)
+        return res
+
+    def convert_native(self, value: ast.expr, dtype: TokenType, to: TokenType) -> ast.expr:
+        if dtype is to:
+            return value
+        convert = _NATIVE[to][1]
+        if isinstance(value, ast.Constant):
+            return ast.copy_location(ast.Constant(convert(value.value)), value)
+        return ast.copy_location(_call(convert.__name__, value), value)
+
+    def lower_string(self, value: StringLiteral | StringFmt | Input, cwass=False) -> ast.expr:
+        'the string without its concats'
+        match value:
+            case StringLiteral():
+                return self.lower_token(value.val, cwass=cwass)
+            case Input():
+                return _call('input', self.lower_value(value.expr, cwass=cwass))
+        parts = [value.start]
+        for m in value.mid_expr():
+            parts.append(m)
+        parts.append(value.end)
+        values = []
+        for part in parts:
+            if isinstance(part, Token) and part.token in (TokenType.STRING_PART_START, TokenType.STRING_PART_MID, TokenType.STRING_PART_END):
+                if text := _string(part.lexeme[1:-1]):
+                    values.append(ast.Constant(text))
+            else:
+                values.append(ast.FormattedValue(value=self.lower_printed(part, cwass=cwass), conversion=-1, format_spec=None))
+        return _call('String', _located(ast.JoinedStr(values=values), *_span(value)))
+
+    def lower_token(self, token: Token, cwass=False) -> ast.expr:
+        match token.token:
+            # for possibly class members
+            case UniqueTokenType():
+                if token.token.is_arr_type(): res = _name("Array")
+                elif cwass and f"_{token.lexeme}" in current_context().class_properties:
+                    res = ast.Attribute(value=_name('self'), attr=f"_{token.lexeme}", ctx=ast.Load())
+                else: res = _name(f"_{token.lexeme}")
+            case TokenType.INT_LITERAL:
+                res = _call('Int', ast.Constant(int(token.lexeme)))
+            case TokenType.FLOAT_LITERAL:
+                res = _call('Float', ast.Constant(float(token.lexeme)))
+            case TokenType.STRING_LITERAL:
+                # braces are doubled like in python_string, which does not make an f-string of it
+                res = _call('String', ast.Constant(_string(token.lexeme[1:-1].replace('{', '{{').replace('}', '}}'))))
+            case TokenType.FAX:
+                res = _call('Bool', ast.Constant(True))
+            case TokenType.CAP:
+                res = _call('Bool', ast.Constant(False))
+            case TokenType.NUWW:
+                res = ast.Constant(None)
+            case (TokenType.MAINUWU | TokenType.INPWT | TokenType.PWINT
+                | TokenType.CHAN | TokenType.KUN | TokenType.SAMA | TokenType.SAN | TokenType.SENPAI
+                | TokenType.CHAN_ARR | TokenType.KUN_ARR | TokenType.SAMA_ARR | TokenType.SAN_ARR | TokenType.SENPAI_ARR
+            ):
+                res = _name(token.python_string())
+            case _:
+                raise ValueError(f"Cannot lower token: {token.token}")
+        return _located(res, *_span(token))
+
+def lower(program: Program, clear_screen=True, context: CompileContext = None, specialize=True) -> ast.Module:
+    '''
+    the python syntax tree of program, as parsed from program.python_string(clear_screen=clear_screen, context=context).
+    it can be given to compile as is, eg. by Executor
+    - specialize: keep locals native where the type checker allows it, so the tree runs like python_string but is not the same.
+    the program should have passed the type checker for it
+    '''
+    # the nodes made have no cycles, so collections while making them only cost time
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        with context.activate() if context is not None else nullcontext():
+            return Lowering(clear_screen, specialize).lower_program(program)
+    finally:
+        if collecting:
+            gc.enable()
@@ -0,0 +1,49 @@
+'''
+The runtime of compiled programs.
+
+the builtin types and functions are bundled once into a single importable module,
+which generated programs import instead of having the whole runtime prepended to them.
+'''
+import os
+import py_compile
+from functools import cache
+from pathlib import Path
+
+from constants.path import BUILTINS, RUNTIME_DIR
+
+RUNTIME_MODULE = "uwu_runtime"
+PROGRAM_HEADER = f"from __future__ import annotations\nfrom {RUNTIME_MODULE} import *\n\n"
+
+# lines starting with these are left out of the bundle
+REMOVE = (
+    "#",
+    "from .namespace",
+    "from __future__",
+    "from src.",
+)
+
+@cache
+def runtime_source() -> str:
+    'the builtins joined into one module, read once per process'
+    contents = "from __future__ import annotations\n\n"
+    for path in BUILTINS:
+        with open(path, 'r') as f:
+            res = [line for line in f.readlines() if line.strip() and not line.strip().startswith(REMOVE)]
+        contents += ''.join(res) + '\n'
+    # programs star import the runtime, so everything it defines is exported like when it was prepended
+    contents += "__all__ = [name for name in globals() if not name.startswith('__')]\n"
+    return contents
+
+def install(directory: str | Path = RUNTIME_DIR) -> Path:
+    'writes the runtime module and its bytecode to directory if they are outdated, returns the module path'
+    directory = Path(directory)
+    path = directory / f"{RUNTIME_MODULE}.py"
+    source = runtime_source()
+    if path.exists() and path.read_text() == source:
+        return path
+    directory.mkdir(parents=True, exist_ok=True)
+    partial = directory / f"{RUNTIME_MODULE}.{os.getpid()}.partial"
+    partial.write_text(source)
+    os.replace(partial, path)
+    py_compile.compile(str(path), doraise=True)
+    return path
@@ -1,18 +1,18 @@
 import subprocess
-import uuid
 import threading
+from bisect import bisect_left
 
 from customtkinter import *
 from tkinter import *
 from constants.path import *
 from theme import themes
 
-from src.lexer import Lexer, Token, Error
+from src.lexer import CachedLexer, CompileContext, Lexer, TableLexer, Token, TokenCache, Error
 from src.lexer.token import UniqueTokenType
-from src.parser import Parser, ErrorSrc
+from src.lexer.incremental import edit_range, relex
+from src.parser import Parser, reparse
 from src.analyzer import MemberAnalyzer, TypeChecker
-from src.analyzer.error_handler import ErrorSrc as AnalyzerErrorSrc
-from src.compiler import Compiler
+from src.compiler import Compiler, Executor, lower
 from .util import generate_log
 
 from enum import Enum
@@ -90,11 +90,23 @@ class CodeEditor(CTkFrame):
         self.analyzer = analyzer
         self.type_checker = type_checker
         self.tokens: list[Token] = []
+        self.line_states: list[bool] = []
+        self.lexed_source: list[str] | None = None
+        # every editor compiles in its own context, so tabs do not share state
+        self.context = CompileContext()
+        # sources lexed before, so that opening a file again does not lex it again
+        self.token_cache = TokenCache()
+        self.token_tags: set[str] = set()
+        # the last parse and its source, so that compiling again only parses the definitions that were edited
+        self.parsed: tuple[Parser, list[str]] | None = None
         self.program = None
         self.transpiled_program = None
         self.lx_errors: list[Error] = []
         self.p_errors: list[Error] = []
         self.a_errors = []
+        # the program quick run in the IDE, and the console it runs in
+        self.executor: Executor | None = None
+        self.console = None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=25)
@@ -156,50 +168,64 @@ class CodeEditor(CTkFrame):
         typing_timer = self.text.after(1500, self.syntax_highlight)
 
     def syntax_highlight(self, event = None):
-        self.source_code = [v if v else v + '\n' for v in self.text.get('1.0', 'end-1c').split('\n')]
-
-        lx = self.lexer(self.source_code)
-        self.tokens = lx.tokens
-        self.lx_errors = lx.errors
-
-        for tag in self.text.tag_names():
-            if tag not in ['token_highlight', 'error_highlight']:
-                self.text.tag_delete(tag)
+        source_code = [v if v else v + '\n' for v in self.text.get('1.0', 'end-1c').split('\n')]
 
-        for i,token in enumerate(self.tokens):
+        # only re-lex and re-tag the lines that changed since the last lex
+        if self.lexed_source is None:
+            lx = CachedLexer(source_code, lexer=self.lexer, context=self.context, cache=self.token_cache)
+            self.tokens, self.lx_errors, self.line_states = lx.tokens, lx.errors, lx.line_states
+            start, stop = 0, len(source_code)
+        else:
+            edit = edit_range(self.lexed_source, source_code)
+            self.tokens, self.lx_errors, self.line_states, (start, stop) = relex(self.lexer, source_code, self.tokens,
+                                                                                 self.lx_errors, self.line_states, *edit,
+                                                                                 context=self.context)
+        self.source_code = self.lexed_source = source_code
+
+        for tag in self.token_tags:
+            self.text.tag_remove(tag, f'{start+1}.0', f'{stop+1}.0')
+
+        first = bisect_left(self.tokens, start, key=lambda t: t.position[0])
+        for i in range(first, len(self.tokens)):
+            token = self.tokens[i]
+            if token.position[0] >= stop:
+                break
             if(token.token.token == 'WHITESPACE'):
                 continue
-            
+
             row_pos,col_pos = token.position
             row_end_pos,col_end_pos = token.end_position
 
-            token_tag_name = uuid.uuid4()
             token_start_pos = f'{row_pos+1}.{col_pos}'
             token_end_pos = f'{row_end_pos+1}.{col_end_pos+1}'
-            
-            self.text.tag_add(token_tag_name, token_start_pos,token_end_pos)
-            try:
-                tok = None
-                
-                if(isinstance(token.token, UniqueTokenType)):
-                    tok = token.token.unique_type.split('_')[0]
-                    
-                    if(tok == 'IDENTIFIER' and self.tokens[i - 1].token.token == '.'):
-                        tok = 'METHOD'
-                else:
-                    tok = token.token.token
-
-                fg = EDITOR_THEME[tok]
-                self.text.tag_config(token_tag_name, foreground=fg)
-            except:
-                self.text.tag_config(token_tag_name, foreground=EDITOR_THEME['default'])
+
+            if(isinstance(token.token, UniqueTokenType)):
+                tok = token.token.unique_type.split('_')[0]
+
+                if(tok == 'IDENTIFIER' and self.tokens[i - 1].token.token == '.'):
+                    tok = 'METHOD'
+            else:
+                tok = token.token.token
+
+            self.text.tag_add(self.token_tag(tok), token_start_pos, token_end_pos)
+
+    def token_tag(self, tok: str) -> str:
+        'one tag per token kind, configured the first time it is used'
+        tag = f'token_{tok}'
+        if tag not in self.token_tags:
+            self.text.tag_config(tag, foreground=EDITOR_THEME.get(tok, EDITOR_THEME['default']))
+            self.token_tags.add(tag)
+        return tag
 
     def run_lexer(self) -> bool:
         self.source_code = [v if v else v + '\n' for v in self.text.get('1.0', 'end-1c').split('\n')]
 
-        lx = self.lexer(self.source_code)
+        self.context = CompileContext()
+        lx = self.lexer(self.source_code, context=self.context)
         self.tokens = lx.tokens
         self.lx_errors = lx.errors
+        self.line_states = lx.line_states
+        self.lexed_source = self.source_code
 
         if(len(self.lx_errors) > 0 and self.program):
             self.program = None
@@ -216,8 +242,12 @@ class CodeEditor(CTkFrame):
         if len(self.lx_errors) > 0:
             return
         
-        ErrorSrc.src = self.source_code
-        p: Parser = self.parser(self.tokens)
+        if self.parsed is None:
+            p: Parser = self.parser(self.tokens, context=self.context)
+        else:
+            previous, source = self.parsed
+            p: Parser = reparse(previous, self.tokens, *edit_range(source, self.source_code), context=self.context)
+        self.parsed = p, self.source_code
         self.program = p.program
 
         if p.errors:
@@ -232,22 +262,21 @@ class CodeEditor(CTkFrame):
         if len(self.p_errors) > 0 or not self.program:
             return
         
-        AnalyzerErrorSrc.src = self.source_code
-        ma = self.analyzer(self.program)
+        ma = self.analyzer(self.program, context=self.context)
         if ma.errors:
             self.a_errors = ma.errors
             return False
         else:
             self.a_errors = []
 
-        tc = self.type_checker(self.program)
+        tc = self.type_checker(self.program, context=self.context)
         if tc.errors:
             self.a_errors = tc.errors
         else:
             self.a_errors = []
         
         if len(self.a_errors) == 0:
-            self.transpiled_program = self.program.python_string()
+            self.transpiled_program = self.program.python_string(context=self.context)
             return True
         else: 
             self.transpiled_program = None
@@ -270,9 +299,28 @@ class CodeEditor(CTkFrame):
         compiler_status.is_compiling = False
         update_logs_callback(editor=editor, is_compiling=compiler_status.is_compiling, generated_log=log)
 
-    def quick_run(self):
-        compiler = Compiler(py_source=self.transpiled_program, filename=self.filename)
-        compiler.run_python() 
+    def quick_run(self, console, on_done=None):
+        '''
+        runs the program inside the IDE, console is its stdout and stdin.
+        on_done is called in the thread of the program when it finishes, with the error that stopped it
+        '''
+        if self.is_running():
+            return
+        console.clear()
+        self.console = console
+        console.running = self
+        self.executor = Executor(lower(self.program, clear_screen=False, context=self.context), stdout=console, stdin=console)
+        self.executor.start(on_done=on_done)
+
+    def is_running(self) -> bool:
+        return self.executor is not None and self.executor.is_running()
+
+    def stop_run(self):
+        'stops the quick run program, it finishes in its thread and calls its on_done'
+        if not self.is_running():
+            return
+        self.executor.stop()
+        self.console.cancel()
 
     def start(self, editor, compiler_status, update_logs_callback):
         compile_thread = threading.Thread(target=lambda: self.compile_and_run(editor=editor, compiler_status=compiler_status, update_logs_callback=update_logs_callback), name="UwU Compile", daemon=True)
@@ -380,7 +428,7 @@ class CodeView(CTkTabview):
         tab.grid_columnconfigure((0, 1), weight=1)
         tab.grid_rowconfigure((0, 1), weight=1)
 
-        code_editor = CodeEditor(master=tab, filename=file_name, fg_color='transparent', lexer=Lexer, parser=Parser, analyzer=MemberAnalyzer, type_checker=TypeChecker)
+        code_editor = CodeEditor(master=tab, filename=file_name, fg_color='transparent', lexer=TableLexer, parser=Parser, analyzer=MemberAnalyzer, type_checker=TypeChecker)
         code_editor.grid(row=0, column=0, rowspan=2, columnspan=2, sticky='nsew')
         self.bind_esc(editor=code_editor, file_name=file_name)
         self.code_editors[file_name] = code_editor
@@ -422,6 +470,8 @@ class CodeView(CTkTabview):
                 file_content = file.read()
                 self.code_editors[file_name].text.delete('1.0', 'end-1c')
                 self.code_editors[file_name].text.insert('1.0', file_content)
+                # the whole file is lexed (or loaded from the token cache) instead of re-lexed as an edit
+                self.code_editors[file_name].lexed_source = None
                 self.code_editors[file_name].syntax_highlight()
             self.editor.init_linenums()
 
@@ -1,3 +1,4 @@
+from queue import Empty, Queue
 from customtkinter import *
 from .logs_table import LogsCanvas
 from PIL import Image, ImageTk
@@ -83,15 +84,90 @@ class CompilerErrors(CTkScrollableFrame):
 
         self.update_logs = self.logs_table.update_logs
 
+class ProgramConsole(CTkFrame):
+    '''
+    stdout and stdin of programs run in the IDE.
+
+    programs run in their own thread, so writes are handed to the tk thread
+    and reads wait for a line entered in the input box
+    '''
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        # None wakes a read of a program that was stopped
+        self.lines: Queue[str | None] = Queue()
+        # the editor whose program is running
+        self.running: CodeEditor | None = None
+
+        self.output = CTkTextbox(master=self, fg_color='transparent', font=('JetBrains Mono', 11), text_color='#FFFFFF', state='disabled')
+        self.output.grid(row=0, column=0, columnspan=2, sticky='nsew')
+
+        self.input = CTkEntry(master=self, font=('JetBrains Mono', 11), placeholder_text='input')
+        self.input.grid(row=1, column=0, sticky='ew')
+        self.input.bind('<Return>', self.submit)
+
+        self.stop_button = CTkButton(master=self, text='Stop', width=60, font=('JetBrains Mono', 11), fg_color='#971142', command=self.stop)
+        self.stop_button.grid(row=1, column=1, padx=(8, 0))
+
+    def write(self, text: str) -> int:
+        self.after(0, self.append, text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def readline(self) -> str:
+        line = self.lines.get()
+        return '' if line is None else line
+
+    def append(self, text: str):
+        self.output.configure(state='normal')
+        self.output.insert('end', text)
+        self.output.see('end')
+        self.output.configure(state='disabled')
+
+    def submit(self, _=None):
+        line = self.input.get()
+        self.input.delete(0, 'end')
+        self.append(line + '\n')
+        self.lines.put(line + '\n')
+
+    def stop(self):
+        'stops the running program, and wakes it if it waits for input'
+        if self.running is not None:
+            self.running.stop_run()
+
+    def cancel(self):
+        'wakes the read of a program that was stopped'
+        self.lines.put(None)
+
+    def clear(self):
+        '''
+        clears the output and the input left by the previous run.
+        the previous run should be finished, so that nothing reads the lines or writes after
+        '''
+        self.output.configure(state='normal')
+        self.output.delete('1.0', 'end')
+        self.output.configure(state='disabled')
+        while True:
+            try:
+                self.lines.get_nowait()
+            except Empty:
+                break
+
 class ConsoleView(CTkTabview):
     def __init__(self, master, editor: CodeEditor, **kwargs):
         super().__init__(master, **kwargs)
 
         self.compiler_logs_tab = self.add('Compiler Logs')
         self.compiler_errors_tab = self.add('Compiler Errors')
+        self.program_console_tab = self.add('Console')
 
         self.compiler_logs_tab.grid_columnconfigure((0,1), weight=1)
         self.compiler_errors_tab.grid_columnconfigure((0,1), weight=1)
+        self.program_console_tab.grid_columnconfigure(0, weight=1)
+        self.program_console_tab.grid_rowconfigure(0, weight=1)
 
         self.compiler_logs = CompilerLogs(self.compiler_logs_tab, editor=editor, fg_color='transparent')
         self.compiler_logs.grid(row=0,column=0, rowspan=2, columnspan=2, sticky='nsew')
@@ -99,6 +175,9 @@ class ConsoleView(CTkTabview):
         self.compiler_errors = CompilerErrors(self.compiler_errors_tab, fg_color='transparent')
         self.compiler_errors.grid(row=0,column=0, rowspan=2, columnspan=2, sticky='nsew')
 
+        self.program_console = ProgramConsole(self.program_console_tab, fg_color='transparent')
+        self.program_console.grid(row=0, column=0, sticky='nsew')
+
         self.update_error_logs = self.compiler_errors.update_logs
         self.update_compiler_logs = self.compiler_logs.update_logs
         
\ No newline at end of file
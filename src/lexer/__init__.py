@@ -1,9 +1,23 @@
 # Treat lexer as a package
-from .lexer import Lexer, print_lex
+from .lexer import Lexer, TableLexer, Whitespace, print_lex
+from .parallel import ParallelLexer
+from .token_cache import TokenCache, CachedLexer
 from .token import Token
+from .token_buffer import TokenBuffer
+from .source import SourceLines
+from .context import CompileContext, current_context
 from .error_handler import Error
 
 Lexer
+TableLexer
+ParallelLexer
+TokenCache
+CachedLexer
+Whitespace
 Token
+TokenBuffer
+SourceLines
+CompileContext
+current_context
 Error
 print_lex
@@ -1,10 +1,9 @@
 # Entry point for lexer package
 from constants.path import LEXER_SOURCE
 from .lexer import *
+from .source import SourceLines
 
 if __name__ == "__main__":
-    source: list[str] = [
-        line if line else "\n" for line in open(LEXER_SOURCE, "r").readlines()
-    ]
+    source = SourceLines.from_file(LEXER_SOURCE)
     input(source)
     print_lex(source)
@@ -0,0 +1,76 @@
+'''
+State of one compilation, shared by the lexer, parser, analyzers and code generation.
+
+every thread (and asyncio task) has its own current context, so compilations in different threads never share state.
+a lexer made without a context starts a new compilation and makes it the current one,
+so the stages after it in the same thread share it without passing it around.
+each stage also takes a context, and works with it as the current one while it runs
+'''
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar('T')
+
+class CompileContext:
+    '''
+    - source: the lines shown in the messages of errors made in this compilation
+    - identifier_dict, cwass_dict: the unique type of every identifier and class name, numbered in the order they are read
+    - interned: the unique token types, one per lexeme and unique type
+    - class_properties: the properties of the class being transpiled
+    '''
+    __slots__ = ('source', 'identifier_dict', 'cwass_dict', 'interned', 'class_properties')
+
+    def __init__(self, source: Sequence[str] = None) -> None:
+        self.source: Sequence[str] = source if source is not None else [""]
+        self.identifier_dict: dict[str, str] = {}
+        self.cwass_dict: dict[str, str] = {}
+        self.interned: dict[tuple[str, str], object] = {}
+        self.class_properties: set[str] = set()
+
+    def clear(self) -> None:
+        'forgets the unique types, keeping the source'
+        self.identifier_dict.clear()
+        self.cwass_dict.clear()
+        self.interned.clear()
+
+    def make_current(self) -> "CompileContext":
+        'makes this the current context of the thread until another one is'
+        _current.set(self)
+        return self
+
+    @contextmanager
+    def activate(self) -> Iterator["CompileContext"]:
+        'makes this the current context of the thread inside the with block'
+        reset = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(reset)
+
+    def iterate(self, items: Iterator[T], chunk: int = 64) -> Iterator[T]:
+        'pulls items a chunk at a time with this as the current context, for generators that are consumed elsewhere'
+        while True:
+            with self.activate():
+                pulled = list(islice(items, chunk))
+            yield from pulled
+            if len(pulled) < chunk:
+                return
+
+_current: ContextVar[CompileContext] = ContextVar('compile_context')
+
+def current_context() -> CompileContext:
+    'the current context of the thread, a new one if it has none yet'
+    try:
+        return _current.get()
+    except LookupError:
+        return CompileContext().make_current()
+
+class ErrorSource:
+    'base of errors, which remember the source of the compilation they were made in to show it in their message'
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self.src = current_context().source
+        return self
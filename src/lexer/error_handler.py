@@ -1,4 +1,5 @@
 from .token import TokenType
+from .context import ErrorSource
 from enum import Enum
 
 class Error(Enum):
@@ -55,7 +56,7 @@ class Warn(Enum):
     UNCLOSED_MULTI_LINE_COMMENT = ("UNCLOSED MULTI LINE COMMENT",
                                    "All code after the opening indicator >//< will be treated as a comment")
     
-class GenericError:
+class GenericError(ErrorSource):
     def __init__(self, error_type: Error, position: tuple[int,int], end_position: tuple[int,int] = None, context: str = None):
         self._error_type = error_type
         self._position = position
@@ -77,9 +78,9 @@ class GenericError:
         # Error preview
         error_range = 1 if self.end_position is None else self.end_position[1] - self.position[1] + 1
         index_str = str(self.position[0] + 1)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.position[0]]) + len(index_str) + 3)}\n"
+        border = f"\t{'_' * (len(self.src[self.position[0]]) + len(index_str) + 3)}\n"
         log += border
-        log += f"\t{index_str} | {ErrorSrc.src[self.position[0]]}\n"
+        log += f"\t{index_str} | {self.src[self.position[0]]}\n"
         log += f"\t{' ' * len(index_str)} | {' '*self.position[1]}{'^'*error_range}\n"
         log += border
         return log
@@ -105,7 +106,7 @@ class GenericError:
         return self._context
 
 
-class DelimError:
+class DelimError(ErrorSource):
     def __init__(self, token_type: TokenType, position: tuple[int], temp_id: str, actual_delim: str,
                  fatal: bool = False):
         self.token_type = token_type
@@ -116,6 +117,11 @@ class DelimError:
         self.error_type = f"UNDELIMITED {self.token_type.token.replace('_', ' ')}" if not fatal else 'FATAL'
         self.expected_delims = token_type.expected_delims
 
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        # a set unpickled in another process can be in another order, the message lists them in the order of the token type
+        self.expected_delims = self.token_type.expected_delims
+
     def __str__(self):
         log = ""
 
@@ -130,15 +136,15 @@ class DelimError:
 
         # Error preview
         index_str = str(self.position[0] + 1)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.position[0]]) + len(index_str) + 3)}\n"
+        border = f"\t{'_' * (len(self.src[self.position[0]]) + len(index_str) + 3)}\n"
         log += border
-        log += f"\t{index_str} | {ErrorSrc.src[self.position[0]]}\n"
+        log += f"\t{index_str} | {self.src[self.position[0]]}\n"
         log += f"\t{' ' * len(index_str)} | {' ' * self.position[1]}{'^'}\n"
         log += border
 
         return log
 
-class IntFloatWarning:
+class IntFloatWarning(ErrorSource):
     def __init__(self, warn_type: Warn, corrected_value: str, temp_num: str, position: tuple[int,int], end_position: tuple[int,int], context: str = None):
         self._warn_type = warn_type
         self._corrected_value = corrected_value
@@ -165,9 +171,9 @@ class IntFloatWarning:
         # Error preview
         error_range = 1 if self.end_position is None else self.end_position[1] - self.position[1] + 1
         index_str = str(self.position[0] + 1)
-        border = f"\t{'_'*(len(ErrorSrc.src[self.position[0]]) + len(index_str) + 3)}\n"
+        border = f"\t{'_'*(len(self.src[self.position[0]]) + len(index_str) + 3)}\n"
         log += border
-        log += f"\t{index_str} | {ErrorSrc.src[self.position[0]]}\n"
+        log += f"\t{index_str} | {self.src[self.position[0]]}\n"
         log += f"\t{' ' * len(index_str)} | {' ' * self.position[1]}{'^' * error_range}\n"
         log += border
 
@@ -205,7 +211,7 @@ class IntFloatWarning:
         return self._context
     
 
-class GenericWarning:
+class GenericWarning(ErrorSource):
     def __init__(self, warn_type: Error, position: tuple[int,int], end_position: tuple[int,int] = None, context: str = None):
         self._warn_type = warn_type
         self._position = position
@@ -225,9 +231,9 @@ class GenericWarning:
         # Error preview
         error_range = 1 if self.end_position is None else self.end_position[1] - self.position[1] + 1
         index_str = str(self.position[0] + 1)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.position[0]]) + len(index_str) + 3)}\n"
+        border = f"\t{'_' * (len(self.src[self.position[0]]) + len(index_str) + 3)}\n"
         log += border
-        log += f"\t{index_str} | {ErrorSrc.src[self.position[0]]}\n"
+        log += f"\t{index_str} | {self.src[self.position[0]]}\n"
         log += f"\t{' ' * len(index_str)} | {' ' * self.position[1]}{'^' * error_range}\n"
         log += border
 
@@ -253,6 +259,3 @@ class GenericWarning:
     def context(self):
         return self._context
 
-
-class ErrorSrc:
-    src = [""]
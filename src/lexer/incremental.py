@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from copy import copy
+
+from .lexer import Lexer
+from .token import Token, UniqueTokenType
+from .context import CompileContext, current_context
+
+def edit_range(old_source: list[str], new_source: list[str]) -> tuple[int, int, int]:
+    '''
+    returns the (start, old_stop, new_stop) line range that differs between two sources
+    - old_source[start:old_stop] was replaced with new_source[start:new_stop]
+    '''
+    start = 0
+    shortest = min(len(old_source), len(new_source))
+    while start < shortest and old_source[start] == new_source[start]:
+        start += 1
+
+    old_stop, new_stop = len(old_source), len(new_source)
+    while old_stop > start and new_stop > start and old_source[old_stop-1] == new_source[new_stop-1]:
+        old_stop -= 1
+        new_stop -= 1
+    return start, old_stop, new_stop
+
+def relex(lexer: type[Lexer], source_code: list[str], tokens: list[Token], errors: list,
+          line_states: list[bool], start: int, old_stop: int, new_stop: int,
+          context: CompileContext = None) -> tuple[list[Token], list, list[bool], tuple[int, int]]:
+    '''
+    re-lexes only the edited lines of a source, reusing the tokens, errors and line states of the previous lex
+    - lines [start:old_stop] of the previous source were replaced with source_code[start:new_stop]
+
+    lexing restarts from the first line at or before the edit that the lexer read from its first character,
+    and stops at the first line after the edit where the new and old line states line up again.
+    tokens and errors after that line are reused with their positions shifted.
+    context is the compilation of the previous lex (the current one by default), which is given the new source
+
+    returns
+    1. tokens
+    2. errors
+    3. line states
+    4. the re-lexed line range
+    '''
+    line_delta = new_stop - old_stop
+    context = context if context is not None else current_context()
+    context.source = source_code
+
+    # lines before the edit may behave differently at EOF
+    restart = start - 1 if old_stop == len(line_states) and start > 0 else start
+    restart = min(restart, len(line_states) - 1)
+    while restart > 0 and line_states[restart]:
+        restart -= 1
+
+    stop = new_stop
+    while True:
+        # lex until the line after stop so that the lines before it do not treat it as the end of file
+        window = lexer(source_code[restart:stop+1], context=CompileContext())
+        if stop >= len(source_code):
+            break
+        if not window.line_states[stop-restart] and not line_states[stop-line_delta]:
+            break
+        stop = min(len(source_code), stop + max(stop - restart, 1))
+
+    relexed_tokens = [_shift_token(t, restart) for t in window.tokens if t.position[0] < stop - restart]
+    relexed_errors = [_shift_error(e, restart, source_code) for e in window.errors if e.position[0] < stop - restart]
+
+    # tokens are appended in the order they are read, so their lines are sorted
+    old_stop = stop - line_delta
+    prefix_end = bisect_left(tokens, restart, key=_line)
+    suffix_start = bisect_left(tokens, old_stop, lo=prefix_end, key=_line)
+    new_tokens = tokens[:prefix_end] + relexed_tokens + [_shift_token(t, line_delta) for t in tokens[suffix_start:]]
+
+    new_errors = [_shift_error(e, 0, source_code) for e in errors if e.position[0] < restart]
+    new_errors += relexed_errors
+    new_errors += [_shift_error(e, line_delta, source_code) for e in errors if e.position[0] >= old_stop]
+
+    new_line_states = line_states[:restart] + window.line_states[:stop-restart] + line_states[old_stop:]
+
+    # the window was numbered on its own, so give it back the numbering of the whole source
+    replaced = _unique_tokens(tokens[prefix_end:suffix_start])
+    relexed = _unique_tokens(relexed_tokens)
+    if [t.lexeme for t in replaced] == [t.lexeme for t in relexed]:
+        # same identifiers in the same order, so the previous numbering still holds
+        for old_token, new_token in zip(replaced, relexed):
+            new_token.token = old_token.token
+    else:
+        _renumber_unique_types(new_tokens, context)
+    return new_tokens, new_errors, new_line_states, (restart, stop)
+
+def _line(token: Token) -> int:
+    return token.position[0]
+
+def _shift_token(token: Token, line_delta: int) -> Token:
+    if not line_delta:
+        return token
+    (line, col), (end_line, end_col) = token.position, token.end_position
+    return Token(token.lexeme, token.token, (line + line_delta, col), (end_line + line_delta, end_col))
+
+def _shift_error(error, line_delta: int, source: list[str]):
+    'errors show the source they were made in, so they are also given the new source'
+    if not line_delta and error.src is source:
+        return error
+    error = copy(error)
+    error.src = source
+    for attr in ['_position', '_end_position', 'position']:
+        position = vars(error).get(attr)
+        if isinstance(position, tuple):
+            setattr(error, attr, (position[0] + line_delta, position[1]))
+    return error
+
+def _unique_tokens(tokens: list[Token]) -> list[Token]:
+    return [t for t in tokens if isinstance(t.token, UniqueTokenType)]
+
+def _renumber_unique_types(tokens: list[Token], context: CompileContext):
+    'gives identifiers and class names the unique types a full lex would have given them'
+    context.clear()
+    for token in tokens:
+        unique_type = token.token
+        if isinstance(unique_type, UniqueTokenType):
+            kind = UniqueTokenType.CWASS if unique_type.delim_id == 'cwass' else UniqueTokenType.ID
+            if UniqueTokenType.register(token.lexeme, kind, context) != unique_type.unique_type:
+                token.token = UniqueTokenType(token.lexeme, kind, context)
@@ -1,28 +1,68 @@
+from bisect import bisect_left
+from enum import Enum
+from typing import Iterator
+
 from constants.constants import DELIMS, ATOMS
 from .token import Token, TokenType, UniqueTokenType
-from .error_handler import Error, DelimError, GenericError, ErrorSrc
+from .error_handler import Error, DelimError, GenericError
+from .context import CompileContext
+from .source import SourceLines
 
-from .lexer_components.move_cursor import advance_cursor
+from .lexer_components.move_cursor import Cursor
 from .lexer_components import peek
+from .lexer_components import transition_table as table
+
+class Whitespace(Enum):
+    'what the lexer does with spaces, tabs and newlines'
+    KEEP = 'keep'           # one token per whitespace character, for the highlighter and lexer table
+    COALESCE = 'coalesce'   # one token per run of whitespace characters
+    SKIP = 'skip'           # no tokens, for consumers that only parse
+
+# lazy lexers forget the tokens of previous lines once they hold more than this
+STREAM_BUFFER_SIZE = 256
 
 class Lexer():
     'description'
 
-    def __init__(self, source_code: list[str]):
+    def __init__(self, source_code: list[str] | SourceLines | str | bytes, whitespace: Whitespace = Whitespace.KEEP, lazy: bool = False,
+                 context: CompileContext = None):
+        '''
+        source_code is a list of lines, or the text of a source (which is kept as SourceLines instead of being split)
+
+        without a context, the lexer starts a new compilation that becomes the current context of the thread,
+        so the parser and analyzers after it share it
+        '''
+        if not isinstance(source_code, (list, SourceLines)):
+            source_code = SourceLines(source_code)
         self._lines = source_code
-        ErrorSrc.src = source_code
-        UniqueTokenType.clear()
+        self._whitespace = whitespace
+        if context is None:
+            context = CompileContext(source_code).make_current()
+        else:
+            context.source = source_code
+        self.context = context
 
-        self._position = [0,0]
+        self._cursor = Cursor(source_code)
         self._at_EOF = False
-        self._current_char = self._lines[self._position[0]][self._position[1]]
+        self._current_char = self._cursor.char
 
         self._nest_level = 0
 
         self._tokens: list[Token] = []
         self._logs: list[GenericError | DelimError] = []
 
-        self._get_tokens()
+        # whether each line starts in the middle of a token (eg. inside a multi line comment)
+        self._line_states: list[bool] = [True] * len(self._lines)
+        self._line_at_start = {start: line for line, start in enumerate(self._cursor.line_starts)}
+
+        # lazy lexers only lex when their stream is iterated
+        self._lazy = lazy
+        self._streamed = False
+        self._emitted = 0
+        if not lazy:
+            # only lazy lexers yield
+            with context.activate():
+                for _ in self._get_tokens(): pass
 
     @property
     def tokens(self) -> list[Token]:
@@ -32,42 +72,94 @@ class Lexer():
     def errors(self):
         return self._logs
 
+    @property
+    def line_states(self) -> list[bool]:
+        'true for every line the lexer did not start reading from its first character'
+        return self._line_states
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self._cursor.position
+
+    def stream(self) -> Iterator[Token]:
+        '''
+        yields the tokens of a lazy lexer as they are lexed.
+        only the tokens of the line being lexed are kept, so tokens stays empty-ish,
+        errors and line states are complete once the stream is exhausted
+        '''
+        if not self._lazy:
+            raise ValueError("only lazy lexers can be streamed, use tokens instead")
+        if self._streamed:
+            raise ValueError("a lexer can only be streamed once")
+        self._streamed = True
+        # the stream may be pulled while another compilation is the current one
+        return self.context.iterate(self._get_tokens())
+
+    def _flush(self) -> Iterator[Token]:
+        'yields the tokens lexed since the last flush, then forgets the ones before the current line'
+        tokens = self._tokens
+        while self._emitted < len(tokens):
+            self._emitted += 1
+            yield tokens[self._emitted - 1]
+        # looking back at previous tokens only matters for tokens of the current line
+        if len(tokens) > STREAM_BUFFER_SIZE:
+            keep = bisect_left(tokens, self._cursor.line, key=_token_line)
+            del tokens[:keep]
+            self._emitted -= keep
+
     def advance(self, increment: int = 1):
-       self._at_EOF, self._current_char = advance_cursor(self.context, increment = increment)
+       self._at_EOF, self._current_char = self._cursor.advance(increment)
+
+    def _mark_line_state(self):
+        'the current line was read from its first character if the cursor is at its start'
+        line = self._line_at_start.get(self._cursor.offset)
+        if line is not None:
+            self._line_states[line] = False
 
     # methods that interact with outside modules
-    @property
-    def context(self):
-        'to be passed to outside modules'
-        return self._lines, self._position, self._current_char, self._tokens, self._logs
+    def _sync_cursor(self):
+        'outside modules move the cursor directly'
+        self._at_EOF = self._cursor.at_EOF
+        self._current_char = self._cursor.char
     def peek_reserved(self, reserved: str, token_type: TokenType) -> bool:
-        cursor_advanced, self._at_EOF, self._current_char = peek.reserved(reserved, token_type, self.context)
+        cursor_advanced = peek.reserved(reserved, token_type, self._cursor, self._tokens, self._logs)
+        self._sync_cursor()
         return cursor_advanced
     def peek_comments(self, multiline: bool = False) -> bool:
-        cursor_advanced, self._at_EOF, self._current_char = peek.comments(self.context, multiline=multiline)
+        cursor_advanced = peek.comments(self._cursor, self._tokens, self._logs, multiline=multiline)
+        self._sync_cursor()
         return cursor_advanced
     def peek_ident(self, cwass: bool = False) -> bool:
-        self._at_EOF, self._current_char  = peek.identifier(self.context, cwass=cwass)
+        peek.identifier(self._cursor, self._tokens, self._logs, cwass=cwass)
+        self._sync_cursor()
     def peek_int_float(self, negative: bool = False, start_pos: tuple[int, int] = None):
-        self._at_EOF, self._current_char = peek.int_float(self.context, negative=negative, start_pos=start_pos)
+        peek.int_float(self._cursor, self._tokens, self._logs, negative=negative, start_pos=start_pos)
+        self._sync_cursor()
     def peek_string(self):
-        self._at_EOF, self._current_char = peek.string(self.context)
-
-    def _get_tokens(self):
+        peek.string(self._cursor, self._tokens, self._logs)
+        self._sync_cursor()
+
+    def _get_tokens(self) -> Iterator[Token]:
+        '''
+        lexes the whole source, yielding the new tokens before every lexeme when lazy.
+        a generator either way, which only runs when iterated
+        '''
         cursor_advanced = False
-        valid_starting_chars = {*ATOMS['alphanum'], *ATOMS['general_operator'],
-                                '|', '!', '&', '{', '}', '[', ']', '(', ')', ',', '.', '~', '"'}
-        
+        valid_starting_chars = table.VALID_STARTING_CHARS
+
         while not self._at_EOF:
-            if self._current_char in ['\n', ' ', '\t']:
-                self._tokens.append(Token(self._current_char, TokenType.WHITESPACE, tuple(self._position), tuple(self._position)))
-                self.advance()
+            if self._lazy and self._emitted < len(self._tokens):
+                yield from self._flush()
+            self._mark_line_state()
+
+            if self._current_char in table.WHITESPACE_CHARS:
+                self._lex_whitespace()
                 if self._at_EOF:
                     break
                 continue
 
             if self._current_char not in valid_starting_chars:
-                self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, tuple(self._position)))
+                self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, self.position))
                 self.advance()
                 if self._at_EOF:
                     break
@@ -228,70 +320,15 @@ class Lexer():
                     continue
 
             if self._current_char == '-':
-                line, column = tuple(self._position)
-                after_slice = self._lines[line][column+1:]
-                before_slice = self._lines[line][:column]
-
-                if len(after_slice) < 1:
-                    starting_position = ending_position = tuple(self._position)
-                    self._tokens.append(Token('-', TokenType.DASH, starting_position, ending_position))
-                    self.advance()
-                    continue
-
-                # Check if - is negative
-                valid_ops = [TokenType.ASSIGNMENT_OPERATOR, 
-                             TokenType.ADDITION_SIGN, TokenType.DASH, TokenType.MULTIPLICATION_SIGN, TokenType.DIVISION_SIGN, TokenType.MODULO_SIGN,
-                             TokenType.GREATER_THAN_SIGN, TokenType.LESS_THAN_SIGN ,TokenType.GREATER_THAN_OR_EQUAL_SIGN ,TokenType.LESS_THAN_OR_EQUAL_SIGN,
-                             TokenType.EQUALITY_OPERATOR, TokenType.INEQUALITY_OPERATOR, 
-                             TokenType.AND_OPERATOR, TokenType.OR_OPERATOR,
-                             TokenType.STRING_PART_START, TokenType.STRING_PART_MID]
-                operator_before = self._check_prev_token(valid_ops)
-                line_copy = self._lines[line]
-                if line_copy.lstrip()[0] == '-' or operator_before:
-                    inc = 0
-                    break_outer = False
-                    continue_outer = False
-                    for char in after_slice:
-                        inc += 1
-                        if char in [' ', '\t', '\n']:
-                            continue
-                        elif char not in ATOMS['number']:
-                            # to prevent reading numbers in a string, identifier or function name
-                            break
-                        if char in ATOMS['number']:
-                            self.advance(inc)
-                            self.peek_int_float(negative=True, start_pos=(self._position[0], self._position[1]-inc))
-                            if self._at_EOF:
-                                break_outer = True
-                            continue_outer = True
-                            break
-                    if break_outer:
-                        break
-                    if continue_outer:
-                        continue
-
-                # Differentiate between arithmetic and unary
-                if len(after_slice) > 0:
-                    # If next char is a dash, check if it is delimited by unary expected delims
-                    if self._lines[line][column+1] == '-':
-                        if len(after_slice) > 1:
-                            if self._lines[line][column+2] in DELIMS['unary']:
-                                starting_position = tuple(self._position)
-                                ending_position = tuple([self._position[0], self._position[1]+1])
-                                self._tokens.append(Token('--', TokenType.DECREMENT_OPERATOR, starting_position, ending_position))
-                                self.advance(2)
-                                continue
-                    starting_position = ending_position = tuple(self._position)
-                    self._tokens.append(Token('-', TokenType.DASH, starting_position, ending_position))
-                    self.advance()
-                    continue
+                self._lex_dash()
+                continue
 
             if self._current_char == '!':
                 cursor_advanced = self.peek_reserved('!=', TokenType.INEQUALITY_OPERATOR)
                 if cursor_advanced:
                     continue
 
-                self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, tuple(self._position),
+                self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, self.position,
                                                context=f"Symbol {self._current_char} is invalid. Did you mean '!='?"))
                 self.advance()
                 continue
@@ -404,6 +441,82 @@ class Lexer():
                 if cursor_advanced:
                     continue
 
+        if self._lazy:
+            yield from self._flush()
+
+    def _lex_whitespace(self):
+        'appends the whitespace token/s at the cursor depending on the whitespace option'
+        if self._whitespace == Whitespace.KEEP:
+            position = self.position
+            self._tokens.append(Token(self._current_char, TokenType.WHITESPACE, position, position))
+            self.advance()
+            return
+
+        cursor = self._cursor
+        source, start = cursor.source, cursor.offset
+        end = start + 1
+        while end < cursor.length and source[end] in table.WHITESPACE_CHARS:
+            # lines starting inside the run are still read from their first character
+            line = self._line_at_start.get(end)
+            if line is not None:
+                self._line_states[line] = False
+            end += 1
+
+        if self._whitespace == Whitespace.COALESCE:
+            starting_position = cursor.position
+            self.advance(end - start - 1)
+            self._tokens.append(Token(source[start:end], TokenType.WHITESPACE, starting_position, cursor.position))
+            self.advance()
+        else:
+            self.advance(end - start)
+
+    def _lex_dash(self):
+        'lexes a dash as a negative number, a decrement operator, or a dash'
+        cursor = self._cursor
+        source, offset = cursor.source, cursor.offset
+        line, column = cursor.position
+        line_end = cursor.line_end(line)
+
+        if offset+1 >= line_end:
+            starting_position = ending_position = (line, column)
+            self._tokens.append(Token('-', TokenType.DASH, starting_position, ending_position))
+            self.advance()
+            return
+
+        # Check if - is negative
+        valid_ops = [TokenType.ASSIGNMENT_OPERATOR, 
+                     TokenType.ADDITION_SIGN, TokenType.DASH, TokenType.MULTIPLICATION_SIGN, TokenType.DIVISION_SIGN, TokenType.MODULO_SIGN,
+                     TokenType.GREATER_THAN_SIGN, TokenType.LESS_THAN_SIGN ,TokenType.GREATER_THAN_OR_EQUAL_SIGN ,TokenType.LESS_THAN_OR_EQUAL_SIGN,
+                     TokenType.EQUALITY_OPERATOR, TokenType.INEQUALITY_OPERATOR, 
+                     TokenType.AND_OPERATOR, TokenType.OR_OPERATOR,
+                     TokenType.STRING_PART_START, TokenType.STRING_PART_MID]
+        operator_before = self._check_prev_token(valid_ops)
+        if operator_before or self._lines[line].lstrip()[0] == '-':
+            for i in range(offset+1, line_end):
+                char = source[i]
+                if char in [' ', '\t', '\n']:
+                    continue
+                elif char not in ATOMS['number']:
+                    # to prevent reading numbers in a string, identifier or function name
+                    break
+                self.advance(i-offset)
+                self.peek_int_float(negative=True, start_pos=(line, column))
+                return
+
+        # Differentiate between arithmetic and unary
+        # If next char is a dash, check if it is delimited by unary expected delims
+        if source[offset+1] == '-':
+            if offset+2 < line_end:
+                if source[offset+2] in DELIMS['unary']:
+                    starting_position = (line, column)
+                    ending_position = (line, column+1)
+                    self._tokens.append(Token('--', TokenType.DECREMENT_OPERATOR, starting_position, ending_position))
+                    self.advance(2)
+                    return
+        starting_position = ending_position = (line, column)
+        self._tokens.append(Token('-', TokenType.DASH, starting_position, ending_position))
+        self.advance()
+
     def _check_prev_token(self, to_check: TokenType | list[TokenType], prev_count: int = 1, in_order=False):
         """
         Checks prev token if it has the token type/s passed. Must be on the same line
@@ -429,6 +542,7 @@ class Lexer():
             start = prev_count
             prev_count += 1
 
+        current_line = self._cursor.line
         to_check_index = 0
         i = start
         while i < prev_count:
@@ -439,7 +553,7 @@ class Lexer():
                     i += 1
                     continue
 
-                in_same_line = prev_token.position[0] == self._position[0]
+                in_same_line = prev_token.position[0] == current_line
                 if in_same_line:
                     if to_check[to_check_index] == TokenType.GEN_CWASS_NAME and prev_token.token.token.startswith('CWASS'):
                         present_flag = True
@@ -448,7 +562,7 @@ class Lexer():
                         present_flag = True
                         i += 1
                     else:
-                        if prev_token.token in to_check and prev_token.position[0] == self._position[0]:
+                        if prev_token.token in to_check and prev_token.position[0] == current_line:
                             present_flag = True
                             i += 1
                         else:
@@ -464,6 +578,102 @@ class Lexer():
         for error in self.errors:
             print(error)
 
+class TableLexer(Lexer):
+    '''
+    Table driven scanner. Produces the same tokens and errors as Lexer,
+    but dispatches on the character class of the current character and finds
+    reserved lexemes with a single walk of the keyword trie instead of peeking every candidate
+    '''
+
+    def _get_tokens(self) -> Iterator[Token]:
+        while not self._at_EOF:
+            if self._lazy and self._emitted < len(self._tokens):
+                yield from self._flush()
+            self._mark_line_state()
+
+            char_class = table.CHAR_CLASSES.get(self._current_char, table.INVALID)
+
+            if char_class == table.WHITESPACE:
+                self._lex_whitespace()
+                continue
+
+            if char_class == table.INVALID:
+                self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, self.position))
+                self.advance()
+                continue
+
+            cursor = self._cursor
+            token_type = table.longest_reserved(cursor.source, cursor.offset, cursor.line_end())
+
+            if token_type is not None:
+                # comments take precedence over >, but not over >=
+                if token_type == TokenType.GREATER_THAN_SIGN:
+                    if self.peek_comments() or self.peek_comments(multiline=True):
+                        continue
+                self._scan_reserved(token_type)
+                continue
+
+            match char_class:
+                case table.IDENTIFIER:
+                    self._scan_identifier()
+                case table.CWASS_NAME:
+                    self._scan_identifier(cwass=True)
+                case table.NUMBER:
+                    self.peek_int_float()
+                case table.STRING:
+                    self.peek_string()
+                case table.DASH:
+                    self._lex_dash()
+                case table.BANG:
+                    self._logs.append(GenericError(Error.UNEXPECTED_SYMBOL, self.position,
+                                                   context=f"Symbol {self._current_char} is invalid. Did you mean '!='?"))
+                    self.advance()
+
+        if self._lazy:
+            yield from self._flush()
+
+    def _scan_reserved(self, token_type: TokenType):
+        'appends the reserved lexeme if properly delimited, otherwise lets peek.reserved handle the error/identifier'
+        cursor = self._cursor
+        lexeme = token_type.token
+        end = cursor.offset + len(lexeme)
+        delim = cursor.source[end] if end < cursor.line_end() else '\n'
+        if delim in token_type.expected_delims:
+            line, column = cursor.position
+            self._tokens.append(Token(lexeme, token_type, (line, column), (line, column+len(lexeme)-1)))
+            self.advance(len(lexeme))
+        else:
+            self.peek_reserved(lexeme, token_type)
+
+    def _scan_identifier(self, cwass: bool = False):
+        'same as peek.identifier, but reads the whole lexeme in one pass over the line'
+        if cwass:
+            expected_delims = DELIMS['cwass']
+            unique_token = UniqueTokenType.CWASS
+            delim_error_token = TokenType.GEN_CWASS_NAME
+        else:
+            expected_delims = DELIMS['id']
+            unique_token = UniqueTokenType.ID
+            delim_error_token = TokenType.GEN_IDENTIFIER
+
+        cursor = self._cursor
+        source, start = cursor.source, cursor.offset
+        line_end = cursor.line_end()
+        end = start + 1
+        while end < line_end and source[end] not in expected_delims and source[end].isalnum():
+            end += 1
+
+        lexeme = source[start:end]
+        line, column = cursor.position
+        if end == line_end or source[end] in expected_delims:
+            self._tokens.append(Token(lexeme, UniqueTokenType(lexeme, unique_token), (line, column), (line, column+len(lexeme)-1)))
+        else:
+            self._logs.append(DelimError(delim_error_token, (line, column+len(lexeme)), lexeme, source[end]))
+        self.advance(end - start)
+
+def _token_line(token: Token) -> int:
+    return token.position[0]
+
 def print_lex(source_code: list[str]) -> Lexer:
     max_digit_length = len(str(len(source_code)))
     max_width = max(len(line) for line in source_code) + max_digit_length + 3
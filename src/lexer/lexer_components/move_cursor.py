@@ -1,66 +1,98 @@
-def advance_cursor(context: tuple[list[str], list[int], str], increment: int = 1) -> tuple[bool, str]:
-    if len(context) == 5:
-        lines, position, current_char, _, _ = context
-    elif len(context) == 3:
-        lines, position, current_char = context
-    else:
-        raise ValueError('wrong context')
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 
-    # initial check if EOF already
-    temp_position = position[1]
-    temp_position += increment
-    end_of_file = temp_position > len(lines[len(lines)-1])-1 and position[0] == len(lines)-1
-    if end_of_file:
-        position[1] += increment
-        current_char = None
-        return True, current_char
-    
-    # increment cursor
-    # go to next line first char if out of bounds in current line (index 'length+1')
-    position[1] += increment
-    current_line_length = len(lines[position[0]])
-    while position[1] >= current_line_length:
-        position[1] -= current_line_length
-        position[0] += 1
-        current_line_length = len(lines[position[0]])
-    
-    # check if EOF after incrementing
-    # if not EOF, read current character since we're sure we are not out of bounds otherwise due to previous check
-    end_of_file = position[0] >= len(lines)
+from ..source import SourceLines
 
-    current_char = lines[position[0]][position[1]] if not end_of_file else None
-    return end_of_file, current_char
+class Cursor:
+    '''
+    Cursor over the joined lines of a source.
 
-def reverse_cursor(context: tuple[list[str], list[int], str], increment: int = 1) -> tuple[bool, str]:
-    if len(context) == 5:
-        lines, position, current_char, _, _ = context
-    elif len(context) == 3:
-        lines, position, current_char = context
-    else:
-        raise ValueError('wrong context')
+    The position is a single offset into the source, so moving is one integer increment.
+    (line, column) pairs are only computed when needed, by bisecting the precomputed line starts.
+    the last line found is remembered, since the cursor mostly moves within a line
+    '''
+    __slots__ = ('source', 'length', 'line_starts', 'offset', '_line', '_line_start', '_line_end', '_occurrences')
 
-    # initial check if BOF already
-    temp_position = position[1]
-    temp_position -= increment
-    beginning_of_file = temp_position < 0 and position[0] == 0
-    if beginning_of_file:
-        position[1] -= increment
-        current_char = None
-        return True, current_char
-    
-    # decrement cursor
-    # go to previous line last char if out of bounds in current line (index '-1')
-    position[1] -= increment
-    while position[1] < 0:
-        position[0] -= 1
-        current_line_length = len(lines[position[0]])
-        position[1] += current_line_length
+    def __init__(self, lines: list[str] | SourceLines):
+        if isinstance(lines, SourceLines) and lines:
+            # already joined, and its line index is the same
+            self.source = lines.text
+            self.line_starts = lines.line_starts
+        else:
+            self.source = ''.join(lines)
+            self.line_starts = list(accumulate((len(line) for line in lines[:-1]), initial=0))
+        self.length = len(self.source)
+        self.offset = 0
+        # offsets [_line_start, _line_end) are in _line
+        self._line = self._line_start = self._line_end = 0
+        # offsets of every occurrence of a pattern in the source, indexed the first time it is searched
+        self._occurrences: dict[str, array] = {}
 
-    # assign current char since we're sure we are not out of bounds
-    current_char = lines[position[0]][position[1]]
+    @property
+    def char(self) -> str | None:
+        'current character, None when out of bounds'
+        return self.source[self.offset] if 0 <= self.offset < self.length else None
 
-    # check if BOF after decrementing, return true if so
-    beginning_of_file = position == [0,0]
+    @property
+    def at_EOF(self) -> bool:
+        return self.offset >= self.length
 
-    current_char = lines[position[0]][position[1]] if not beginning_of_file else None
-    return beginning_of_file, current_char
\ No newline at end of file
+    @property
+    def line(self) -> int:
+        if self._line_start <= self.offset < self._line_end:
+            return self._line
+        if self.offset < 0:
+            return 0
+        line = self._line = bisect_right(self.line_starts, self.offset) - 1
+        self._line_start = self.line_starts[line]
+        self._line_end = self.line_starts[line+1] if line+1 < len(self.line_starts) else self.length
+        return line
+
+    @property
+    def position(self) -> tuple[int, int]:
+        line = self.line
+        return line, self.offset - self.line_starts[line]
+
+    def line_start(self, line: int = None) -> int:
+        'offset of the first character of the line, defaults to the current line'
+        line = self.line if line is None else line
+        return self.line_starts[max(line, 0)] if line < len(self.line_starts) else self.length
+
+    def line_end(self, line: int = None) -> int:
+        'offset after the last character of the line, defaults to the current line'
+        line = self.line if line is None else line
+        return self.line_starts[line+1] if 0 <= line+1 < len(self.line_starts) else self.length
+
+    def occurrences(self, pattern: str) -> array:
+        'sorted offsets of every occurrence of pattern, overlapping ones included'
+        found = self._occurrences.get(pattern)
+        if found is None:
+            found = self._occurrences[pattern] = array('q')
+            offset = self.source.find(pattern)
+            while offset != -1:
+                found.append(offset)
+                offset = self.source.find(pattern, offset + 1)
+        return found
+
+    def find(self, pattern: str, start: int, end: int) -> int:
+        'offset of the first occurrence of pattern within [start, end), -1 if there is none'
+        found = self.occurrences(pattern)
+        i = bisect_left(found, start)
+        if i < len(found) and found[i] + len(pattern) <= end:
+            return found[i]
+        return -1
+
+    def advance(self, increment: int = 1) -> tuple[bool, str]:
+        'returns if end of file and the current character'
+        self.offset += increment
+        if self.offset >= self.length:
+            return True, None
+        return False, self.source[self.offset]
+
+    def reverse(self, increment: int = 1) -> tuple[bool, str]:
+        'returns if beginning of file and the current character'
+        self.offset -= increment
+        if self.offset <= 0:
+            return True, None
+        return False, self.source[self.offset]
@@ -1,19 +1,15 @@
 from .verify_delim import verify_delim
-from .move_cursor import advance_cursor, reverse_cursor
+from .move_cursor import Cursor
 from .seek import seek
 
 from constants.constants import *
 from ..token import *
 from ..error_handler import *
 
-def reserved(to_check: str, token_type: TokenType, 
-             context: tuple[list[str], list[int], str, list[Token], list[DelimError]],
-             before: bool = False, ignore_space: bool = False) -> tuple[bool,bool,str]:
+def reserved(to_check: str, token_type: TokenType, cursor: Cursor, tokens: list[Token], logs: list[DelimError],
+             before: bool = False, ignore_space: bool = False) -> bool:
     '''
-    returns
-    1. if cursor moved (token was appended to either tokens or logs)
-    2. if end of file 
-    3. current character
+    returns if cursor moved (token was appended to either tokens or logs)
 
     Main process
 
@@ -31,19 +27,20 @@ def reserved(to_check: str, token_type: TokenType,
             - this is useful for checking if a keyword is present directly before/after the current character which may be separated by whitespace/s
 
     '''
-    lines, position, current_char, tokens, logs = context
-
+    source = cursor.source
     length = len(to_check)
-    line, column = position
+    offset = cursor.offset
+    line, column = cursor.position
+    line_start, line_end = offset - column, cursor.line_end(line)
 
     if before:
         # if length = 5; [0,1,2,3,4] start at index 4 and end in -1 to include 0
-        start = (length-1, column)
-        end = (-1, column-length)
+        start = (length-1, offset)
+        end = (-1, offset-length)
         increment = -1
     else:
-        start = (0, column)
-        end = (length, column+length)
+        start = (0, offset)
+        end = (length, offset+length)
         increment = 1
 
     is_equal = True
@@ -52,80 +49,67 @@ def reserved(to_check: str, token_type: TokenType,
         j = start[1]
         if before:
             while (i > end[0]) and (j > end[1]):
-                if lines[line][j] == " ":
+                if source[j] == " ":
                     continue
-                if to_check[i] != lines[line][j]:
+                if to_check[i] != source[j]:
                     is_equal = False
                     break
                 i -= 1
                 j -= 1
         else:
             while (i < end[0]) and (j < end[1]):
-                if lines[line][j] == " ":
+                if source[j] == " ":
                     continue
-                if to_check[i] != lines[line][j]:
+                if to_check[i] != source[j]:
                     is_equal = False
                     break
                 i += 1
                 j += 1
     else:
         for i,j in zip(range(start[0], end[0], increment), range(start[1], end[1], increment)):
-            if j >= len(lines[line]) or to_check[i] != lines[line][j]:
+            if j >= line_end or j < line_start or to_check[i] != source[j]:
                 is_equal = False
                 break
     
-    is_end_of_file = False
-    cursor_advanced = False
-    if is_equal:
-        if before:
-            starting_position = (line, end[1]+1)
-            ending_position = (line, column)
-        
-        else:
-            starting_position = (line, column)
-            ending_position = (line, end[1]-1)
-
-            is_end_of_file, current_char = advance_cursor(context, end[1]-column-1)
-            context = lines, position, current_char, tokens, logs
-            
-        lexeme = to_check
-        next_char_is_correct_delim, delim = verify_delim(context, token_type.expected_delims)
-        if next_char_is_correct_delim:
-            tokens.append(Token(lexeme, token_type, starting_position, ending_position))
-        else:
-            is_end_of_file, current_char = advance_cursor(context)
-            context = lines, position, current_char, tokens, logs
-
-            # preemptively check if the lexeme or current character is not valid to be in a fwunc/cwass/identifier name
-            in_new_line = position[0] != line
-            if not any(char in ATOMS['alphanum'] for char in lexeme) or not current_char in ATOMS['alphanum'] or in_new_line:
-                _, current_char = reverse_cursor(context)
-                context = lines, position, current_char, tokens, logs
-
-                line, col = ending_position
-                logs.append(DelimError(token_type, (line, col + 1), lexeme, delim))
-            else:
-                # check if identifier
-                is_end_of_file, current_char = identifier(context, from_keyword=to_check)
-                context = lines, position, current_char, tokens, logs
-
-                return True, is_end_of_file, current_char
-
-        is_end_of_file, current_char = advance_cursor(context)
-        cursor_advanced = True
+    if not is_equal:
+        return False
 
+    if before:
+        starting_position = (line, column-length+1)
+        ending_position = (line, column)
     else:
-        cursor_advanced = False
+        starting_position = (line, column)
+        ending_position = (line, column+length-1)
+        cursor.advance(length-1)
+
+    lexeme = to_check
+    next_char_is_correct_delim, delim = verify_delim(cursor, token_type.expected_delims)
+    if next_char_is_correct_delim:
+        tokens.append(Token(lexeme, token_type, starting_position, ending_position))
+    else:
+        _, current_char = cursor.advance()
+
+        # preemptively check if the lexeme or current character is not valid to be in a fwunc/cwass/identifier name
+        in_new_line = cursor.offset >= line_end and not cursor.at_EOF
+        if not any(char in ATOMS['alphanum'] for char in lexeme) or not current_char in ATOMS['alphanum'] or in_new_line:
+            cursor.reverse()
 
-    return cursor_advanced, is_end_of_file, current_char
+            line, col = ending_position
+            logs.append(DelimError(token_type, (line, col + 1), lexeme, delim))
+        else:
+            # check if identifier
+            identifier(cursor, tokens, logs, from_keyword=to_check)
+            return True
 
+    cursor.advance()
+    return True
 
-def identifier(context: tuple[list[str], list[int], str, list[Token], list[DelimError]],
-               from_keyword: str = None, cwass: bool = False) -> tuple[bool, str]:
-    lines, position, current_char, tokens, logs = context
 
+def identifier(cursor: Cursor, tokens: list[Token], logs: list[DelimError],
+               from_keyword: str = None, cwass: bool = False):
     temp_id = from_keyword if from_keyword else ''
-    current_line = position[0]
+    current_char = cursor.char
+    line_end = cursor.line_end()
 
     if cwass:
         expected_delims = DELIMS['cwass']
@@ -138,144 +122,123 @@ def identifier(context: tuple[list[str], list[int], str, list[Token], list[Delim
 
     while True:
         temp_id += current_char
-        is_end_of_file, current_char = advance_cursor(context)
-        context = lines, position, current_char, tokens, logs
+        is_end_of_file, current_char = cursor.advance()
 
-        in_next_line = position[0] != current_line
+        in_next_line = cursor.offset >= line_end
         if is_end_of_file or in_next_line or current_char in expected_delims:
-            _, current_char = reverse_cursor(context)
-            context = lines, position, current_char, tokens, logs
+            cursor.reverse()
 
-            starting_position = (position[0], position[1]-len(temp_id)+1)
-            ending_position = (position[0], position[1])
+            line, column = cursor.position
+            starting_position = (line, column-len(temp_id)+1)
+            ending_position = (line, column)
             tokens.append(Token(temp_id, UniqueTokenType(temp_id, unique_token),
                                             starting_position, ending_position))
             break
 
         elif not current_char.isalnum():
             special_char = current_char
+            cursor.reverse()
 
-            _, current_char = reverse_cursor(context)
-            context = lines, position, current_char, tokens, logs
-
-            line, col = position
+            line, col = cursor.position
             logs.append(DelimError(delim_error_token, (line, col + 1), temp_id, special_char))
             break
     
-    context = lines, position, current_char
-    is_end_of_file, current_char = advance_cursor(context)
-    return is_end_of_file, current_char
+    cursor.advance()
 
 
-def comments(context: tuple[list[str], list[int], str, list[Token], list[DelimError]],
-             multiline: bool = False) -> tuple[bool, bool, str]:
+def comments(cursor: Cursor, tokens: list[Token], logs: list[DelimError], multiline: bool = False) -> bool:
     'returns true if found comments/error about comments, false otherwise'
     to_seek = r'>//<' if multiline else '>.<'
-    comment_indicator_exists = seek(context, to_seek, include_current=True)
-
-    lines, position, current_char, tokens, logs = context
-    current_line = position[0]
-    cursor_advanced = False
-    is_end_of_file = True
-
-    if comment_indicator_exists:
-        if multiline:
-            starting_position = tuple(position)
-            is_end_of_file, current_char = advance_cursor(context, len(to_seek)-1)
-            context = lines, position, current_char, tokens, logs
-            temp_comment = to_seek
-
-            closing_comment_indicator_exists = seek(context, to_seek, multi_line_count='EOF')
-            if closing_comment_indicator_exists:
-                # keep appending until found >//< in order
-                while True:
-                    current_line = position[0]
-                    is_end_of_file, current_char = advance_cursor(context)
-                    context = lines, position, current_char, tokens, logs
-
-                    if position[0] > current_line:
-                        temp_comment += '\n'
-                    temp_comment += current_char
-
-                    if current_char == '/' and lines[position[0]][position[1]+1] == '/' and lines[position[0]][position[1]+2] == '<':
-                        is_end_of_file, current_char = advance_cursor(context, 2)
-                        context = lines, position, current_char, tokens, logs
-                        temp_comment += '/<'
-
-                        ending_position = tuple(position)
-                        tokens.append(Token(temp_comment, TokenType.MULTI_LINE_COMMENT, starting_position, ending_position))
-                        
-                        is_end_of_file, current_char = advance_cursor(context)
-                        context = lines, position, current_char, tokens, logs
-                        break
+    comment_indicator_exists = seek(cursor, to_seek, include_current=True)
+    if not comment_indicator_exists:
+        return False
 
-            else:
-                # comment out the rest of the code if there is no closing indicator is
-                while not is_end_of_file:
-                    current_line = position[0]
-                    is_end_of_file, current_char = advance_cursor(context)
-                    context = lines, position, current_char, tokens, logs
-
-                    if position[0] > current_line:
-                        temp_comment += '\n'
-                    if not is_end_of_file and current_char != '\n':
-                        temp_comment += current_char
-
-                    if is_end_of_file:
-                        ending_position = tuple(position)
-                        logs.append(GenericWarning(Warn.UNCLOSED_MULTI_LINE_COMMENT, starting_position))
-                        tokens.append(Token(temp_comment, TokenType.MULTI_LINE_COMMENT, starting_position, ending_position))
+    source = cursor.source
+    next_line = cursor.line_end()
 
-        else:
-            temp_comment = to_seek
-            starting_position = tuple(position)
-            is_end_of_file, current_char = advance_cursor(context, len(to_seek)-1)
-            context = lines, position, current_char, tokens, logs
+    if multiline:
+        starting_position = cursor.position
+        is_end_of_file, current_char = cursor.advance(len(to_seek)-1)
+        temp_comment = to_seek
 
+        closing_comment_indicator_exists = seek(cursor, to_seek, multi_line_count='EOF')
+        if closing_comment_indicator_exists:
+            # keep appending until found >//< in order
             while True:
-                is_end_of_file, current_char = advance_cursor(context)
-                context = lines, position, current_char, tokens, logs
+                is_end_of_file, current_char = cursor.advance()
+
+                if cursor.offset >= next_line:
+                    temp_comment += '\n'
+                    next_line = cursor.line_end()
+                temp_comment += current_char
+
+                offset = cursor.offset
+                if current_char == '/' and offset+2 < next_line and source[offset+1] == '/' and source[offset+2] == '<':
+                    cursor.advance(2)
+                    temp_comment += '/<'
+
+                    ending_position = cursor.position
+                    tokens.append(Token(temp_comment, TokenType.MULTI_LINE_COMMENT, starting_position, ending_position))
+                    
+                    cursor.advance()
+                    break
 
-                in_next_line = position[0] > current_line
-                if not is_end_of_file and not in_next_line and current_char != '\n':
+        else:
+            # comment out the rest of the code if there is no closing indicator is
+            while not is_end_of_file:
+                is_end_of_file, current_char = cursor.advance()
+
+                if not is_end_of_file and cursor.offset >= next_line:
+                    temp_comment += '\n'
+                    next_line = cursor.line_end()
+                if not is_end_of_file and current_char != '\n':
                     temp_comment += current_char
 
-                if is_end_of_file or in_next_line:
-                    ending_position = tuple(position)
-                    tokens.append(Token(temp_comment, TokenType.SINGLE_LINE_COMMENT, starting_position, ending_position))
-                    break
-
+                if is_end_of_file:
+                    ending_position = cursor.position
+                    logs.append(GenericWarning(Warn.UNCLOSED_MULTI_LINE_COMMENT, starting_position))
+                    tokens.append(Token(temp_comment, TokenType.MULTI_LINE_COMMENT, starting_position, ending_position))
 
-        cursor_advanced = True
     else:
-        cursor_advanced = False
+        temp_comment = to_seek
+        starting_position = cursor.position
+        cursor.advance(len(to_seek)-1)
+
+        while True:
+            is_end_of_file, current_char = cursor.advance()
 
-    return cursor_advanced, is_end_of_file, current_char
+            in_next_line = cursor.offset >= next_line
+            if not is_end_of_file and not in_next_line and current_char != '\n':
+                temp_comment += current_char
 
+            if is_end_of_file or in_next_line:
+                ending_position = cursor.position
+                tokens.append(Token(temp_comment, TokenType.SINGLE_LINE_COMMENT, starting_position, ending_position))
+                break
+
+    return True
 
 
-def int_float(context: tuple[list[str], list[int], str, list[Token], list[DelimError]],
-              negative=False, start_pos: tuple[int, int] = None) -> tuple[bool, str]:
-    lines, position, current_char, tokens, logs = context
 
+def int_float(cursor: Cursor, tokens: list[Token], logs: list[DelimError],
+              negative=False, start_pos: tuple[int, int] = None):
+    current_char = cursor.char
     temp_num = "-"+current_char if negative else current_char
-    current_line = position[0]
-    break_outside_loop = False
+    line_end = cursor.line_end()
 
     while True:
-        is_end_of_file, current_char = advance_cursor(context)
-        context = lines, position, current_char, tokens, logs
+        is_end_of_file, current_char = cursor.advance()
 
-        in_next_line = position[0] != current_line
+        in_next_line = cursor.offset >= line_end
 
         # preemptively break when a delimiter is found for integers
         if current_char in DELIMS['int_float'] or in_next_line or is_end_of_file:
-            _, current_char = reverse_cursor(context)
-            context = lines, position, current_char, tokens, logs
+            cursor.reverse()
+            position = cursor.position
 
             corrected_value = temp_num
             starting_position = (position[0], position[1] - len(temp_num) + 1) if start_pos is None else start_pos
-            ending_position = (position[0], position[1])
+            ending_position = position
 
             tokens.append(Token(corrected_value, TokenType.INT_LITERAL, starting_position, ending_position))
             break
@@ -284,29 +247,25 @@ def int_float(context: tuple[list[str], list[int], str, list[Token], list[DelimE
         elif current_char == '.':
             temp_num += current_char
             while True:
-                is_end_of_file, current_char = advance_cursor(context)
-                context = lines, position, current_char, tokens, logs
+                is_end_of_file, current_char = cursor.advance()
 
-                in_next_line = position[0] != current_line
+                in_next_line = cursor.offset >= line_end
 
                 # preemptively break when a delimiter is found for floats
                 if current_char in DELIMS['int_float'] or in_next_line or is_end_of_file:
-                    _, current_char = reverse_cursor(context)
-                    context = lines, position, current_char, tokens, logs
+                    cursor.reverse()
+                    position = cursor.position
 
                     corrected_value = temp_num
-                    starting_position = tuple([position[0], position[1] - len(temp_num) + 1]) if start_pos is None else start_pos
-                    ending_position = tuple(position)
+                    starting_position = (position[0], position[1] - len(temp_num) + 1) if start_pos is None else start_pos
+                    ending_position = position
 
                     # has no numbers after decimal point
                     if temp_num[-1:] == '.':
                         corrected_value = temp_num + '0'
-                        starting_position = tuple([position[0], position[1] - len(temp_num) + 1]) if start_pos is None else start_pos
-                        ending_position = tuple(position)
                         logs.append(
                             GenericError(Error.MISSING_TRAILING_ZERO_FLOAT, starting_position, ending_position,
                                             context=f"consider replacing '{temp_num}' with '{corrected_value}'"))
-                        break_outside_loop = True
                         break
 
                     tokens.append(
@@ -315,11 +274,10 @@ def int_float(context: tuple[list[str], list[int], str, list[Token], list[DelimE
 
                 elif not current_char.isdigit():
                     invalid_delim = current_char
-                    _, current_char = reverse_cursor(context)
-                    context = lines, position, current_char, tokens, logs
+                    cursor.reverse()
 
                     logs.append(
-                        DelimError(TokenType.FLOAT_LITERAL, tuple(position), temp_num, invalid_delim))
+                        DelimError(TokenType.FLOAT_LITERAL, cursor.position, temp_num, invalid_delim))
                     break
 
                 temp_num += current_char
@@ -327,19 +285,17 @@ def int_float(context: tuple[list[str], list[int], str, list[Token], list[DelimE
 
         elif not current_char.isdigit():
             invalid_delim = current_char
-            _, current_char = reverse_cursor(context)
-            context = lines, position, current_char, tokens, logs
+            cursor.reverse()
 
-            logs.append(DelimError(TokenType.INT_LITERAL, tuple(position), temp_num, invalid_delim))
+            logs.append(DelimError(TokenType.INT_LITERAL, cursor.position, temp_num, invalid_delim))
             break
 
         temp_num += current_char
 
-    is_end_of_file, current_char = advance_cursor(context)
-    return is_end_of_file, current_char
+    cursor.advance()
 
-def string(context: tuple[list[str], list[int], str, list[Token], list[DelimError]]) -> tuple[bool, str]:
-    lines, position, current_char, tokens, logs = context
+def string(cursor: Cursor, tokens: list[Token], logs: list[DelimError]):
+    current_char = cursor.char
 
     if current_char == '"':
         token_types = (TokenType.STRING_PART_START, TokenType.STRING_LITERAL)
@@ -347,29 +303,27 @@ def string(context: tuple[list[str], list[int], str, list[Token], list[DelimErro
         token_types = (TokenType.STRING_PART_MID, TokenType.STRING_PART_END)
     
     temp_string = ''
-    current_line = position[0]
+    line_end = cursor.line_end()
 
     while True:
         temp_string += current_char
-        is_end_of_file, current_char = advance_cursor(context)
-        context = lines, position, current_char, tokens, logs
+        is_end_of_file, current_char = cursor.advance()
 
-        in_next_line = position[0] != current_line
+        in_next_line = not is_end_of_file and cursor.offset >= line_end
 
         if is_end_of_file or in_next_line:
             if in_next_line:
-                _, current_char = reverse_cursor(context)
-                context = lines, position, current_char, tokens, logs
+                cursor.reverse()
 
-            starting_position = (position[0], position[1]-len(temp_string) + 1 + temp_string.count('|'))
-            ending_position = (position[0], position[1])
+            line, column = cursor.position
+            starting_position = (line, column-len(temp_string) + 1 + temp_string.count('|'))
+            ending_position = (line, column)
             logs.append(GenericError(Error.UNCLOSED_STRING, starting_position, ending_position,
                                             context = f"'{temp_string}' is unclosed"))
             break
 
         elif current_char == '\\':
-            is_end_of_file, current_char = advance_cursor(context)
-            context = lines, position, current_char, tokens, logs
+            is_end_of_file, current_char = cursor.advance()
 
             if is_end_of_file:
                 break
@@ -389,15 +343,15 @@ def string(context: tuple[list[str], list[int], str, list[Token], list[DelimErro
             temp_string = '"' + temp_string[1:-1] + '"'
             temp_string_length = len(temp_string) + temp_string.count('|')
 
-            starting_position = (position[0], position[1]-temp_string_length+1)
-            ending_position = (position[0], position[1])
+            line, column = cursor.position
+            starting_position = (line, column-temp_string_length+1)
+            ending_position = (line, column)
 
-            next_char_is_correct_delim, delim = verify_delim(context, delims)
+            next_char_is_correct_delim, delim = verify_delim(cursor, delims)
             if next_char_is_correct_delim:
                 tokens.append(Token(temp_string, token_type, starting_position, ending_position))
             else:
                 logs.append(DelimError(token_type, (ending_position[0], ending_position[1] + 1), temp_string, delim))
             break
     
-    is_end_of_file, current_char = advance_cursor(context)
-    return is_end_of_file, current_char
+    cursor.advance()
@@ -1,11 +1,10 @@
-from .move_cursor import advance_cursor, reverse_cursor
+from .move_cursor import Cursor
 
 from constants.constants import *
 from ..token import *
 from ..error_handler import *
 
-def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]],
-          to_seek: str|list[str], before: bool = False, multi_line_count: int|str = 0,
+def seek(cursor: Cursor, to_seek: str|list[str], before: bool = False, multi_line_count: int|str = 0,
           ignore_space = True, max_space_count: int = None, alphanum_only: bool = False,
           include_current: bool = False) -> bool:
     '''
@@ -15,23 +14,36 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
 
     can go until end|beginning of file if "EOF|BOF" is passed as multi_line_count
     '''
-    lines, position, current_char, tokens, logs = context
+    current_char = cursor.char
 
     if isinstance(to_seek, str):
         to_seek = [to_seek]
         
-    line = position[0]
+    line = cursor.line
     if before and isinstance(multi_line_count, int):
         multi_line = line - multi_line_count
     elif not before and isinstance(multi_line_count, int):
         multi_line = line + multi_line_count
 
     if multi_line_count == "EOF":
-        multi_line = len(lines) - 1
+        multi_line = len(cursor.line_starts) - 1
     elif multi_line_count == "BOF":
         multi_line = 0
     is_max_multi_line = None
 
+    # the cursor went past multi_line once it is outside these offsets
+    multi_line_start = cursor.line_start(multi_line)
+    multi_line_end = cursor.line_end(multi_line)
+
+    # a single pattern searched forward through spaces and anything else is a lookup in the index of its occurrences,
+    # instead of a walk to the end of the range for every call.
+    # the walk resumes at the character that broke a partial match, so it only finds the same occurrences
+    # when the first character of the pattern is not repeated in it
+    if (len(to_seek) == 1 and not before and ignore_space and max_space_count is None and not alphanum_only
+            and to_seek[0] and to_seek[0][0] not in to_seek[0][1:]):
+        start = cursor.offset if include_current else cursor.offset + 1
+        return start < cursor.length and cursor.find(to_seek[0], start, multi_line_end) != -1
+
     space_count = 0
 
     cursor_advance_reverse_count = 0
@@ -41,11 +53,9 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
     for i in range(len(found)):
         if not include_current:
             if before:
-                file_out_of_bounds, current_char = reverse_cursor(context)
-                context = lines, position, current_char, tokens, logs
+                file_out_of_bounds, current_char = cursor.reverse()
             else:
-                file_out_of_bounds, current_char = advance_cursor(context)
-                context = lines, position, current_char, tokens, logs
+                file_out_of_bounds, current_char = cursor.advance()
             cursor_advance_reverse_count += 1
 
         while not found[i]:
@@ -56,15 +66,14 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
             
             # limit number of times reversing can go to newlines with multi_line_count
             if is_max_multi_line is None:
-                is_max_multi_line = multi_line > position[0] if before else multi_line < position[0]
+                is_max_multi_line = cursor.offset < multi_line_start if before else cursor.offset >= multi_line_end
 
             if is_max_multi_line:
                 cursor_advance_reverse_count -= 1
                 if before:
-                    _, current_char = advance_cursor(context)
-                    context = lines, position, current_char, tokens, logs
+                    _, current_char = cursor.advance()
                 else:
-                    _, current_char = reverse_cursor(context)
+                    _, current_char = cursor.reverse()
                 break
             
             if current_char == to_seek[i][preempt_start_char_index]:
@@ -82,24 +91,20 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
 
                 for preempt in preempt_iter:
                     if before:
-                        file_out_of_bounds, current_char = reverse_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        file_out_of_bounds, current_char = cursor.reverse()
                     else:
-                        file_out_of_bounds, current_char = advance_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        file_out_of_bounds, current_char = cursor.advance()
                     cursor_advance_reverse_count += 1
 
-                    is_max_multi_line = multi_line > position[0] if before else multi_line < position[0]
+                    is_max_multi_line = cursor.offset < multi_line_start if before else cursor.offset >= multi_line_end
                     # limit number of times reversing can go to newlines with multi_line_count
                     if is_max_multi_line or file_out_of_bounds:
                         preempt_success = False
                         cursor_advance_reverse_count -= 1
                         if before:
-                            _, current_char = advance_cursor(context)
-                            context = lines, position, current_char, tokens, logs
+                            _, current_char = cursor.advance()
                         else:
-                            _, current_char = reverse_cursor(context)
-                            context = lines, position, current_char, tokens, logs
+                            _, current_char = cursor.reverse()
                         break
 
                     # don't check for last character (not included in to_seek)
@@ -122,23 +127,19 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
 
                     cursor_advance_reverse_count += 1
                     if before:
-                        file_out_of_bounds, current_char = reverse_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        file_out_of_bounds, current_char = cursor.reverse()
                     else:
-                        file_out_of_bounds, current_char = advance_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        file_out_of_bounds, current_char = cursor.advance()
                     if file_out_of_bounds:
                         break
 
-                    is_max_multi_line = multi_line > position[0] if before else multi_line < position[0]
+                    is_max_multi_line = cursor.offset < multi_line_start if before else cursor.offset >= multi_line_end
                     if is_max_multi_line:
                         cursor_advance_reverse_count -= 1
                         if before:
-                            _, current_char = advance_cursor(context)
-                            context = lines, position, current_char, tokens, logs
+                            _, current_char = cursor.advance()
                         else:
-                            _, current_char = reverse_cursor(context)
-                            context = lines, position, current_char, tokens, logs
+                            _, current_char = cursor.reverse()
                         break
                 else:
                     break
@@ -148,28 +149,24 @@ def seek(context: tuple[list[str], list[int], str, list[Token], list[DelimError]
 
             else:
                 if before:
-                    file_out_of_bounds, current_char = reverse_cursor(context)
-                    context = lines, position, current_char, tokens, logs
+                    file_out_of_bounds, current_char = cursor.reverse()
                 else:
-                    file_out_of_bounds, current_char = advance_cursor(context)
-                    context = lines, position, current_char, tokens, logs
+                    file_out_of_bounds, current_char = cursor.advance()
                 cursor_advance_reverse_count += 1
                 # check again after reversing
                 if file_out_of_bounds:
                     break
                 
-                is_max_multi_line = multi_line > position[0] if before else multi_line < position[0]
+                is_max_multi_line = cursor.offset < multi_line_start if before else cursor.offset >= multi_line_end
                 if is_max_multi_line:
                     cursor_advance_reverse_count -= 1
                     if before:
-                        _, current_char = advance_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        _, current_char = cursor.advance()
                     else:
-                        _, current_char = reverse_cursor(context)
-                        context = lines, position, current_char, tokens, logs
+                        _, current_char = cursor.reverse()
                     break
     if before:
-        current_char = advance_cursor(context, cursor_advance_reverse_count)
+        cursor.advance(cursor_advance_reverse_count)
     else:
-        current_char = reverse_cursor(context, cursor_advance_reverse_count)
+        cursor.reverse(cursor_advance_reverse_count)
     return all(found)
\ No newline at end of file
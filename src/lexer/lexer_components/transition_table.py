@@ -0,0 +1,64 @@
+from constants.constants import ATOMS
+from ..token import TokenType
+
+# characters a lexeme can start with, anything else is an unexpected symbol
+VALID_STARTING_CHARS = frozenset({*ATOMS['alphanum'], *ATOMS['general_operator'],
+                                  '|', '!', '&', '{', '}', '[', ']', '(', ')', ',', '.', '~', '"'})
+
+WHITESPACE_CHARS = frozenset({'\n', ' ', '\t'})
+
+# character classes
+INVALID = 0
+WHITESPACE = 1
+IDENTIFIER = 2
+CWASS_NAME = 3
+NUMBER = 4
+STRING = 5
+DASH = 6
+BANG = 7
+SYMBOL = 8
+
+def _compile_char_classes() -> dict[str, int]:
+    char_classes = {char: SYMBOL for char in VALID_STARTING_CHARS}
+    char_classes.update({char: IDENTIFIER for char in ATOMS['alpha_small']})
+    char_classes.update({char: CWASS_NAME for char in ATOMS['alpha_big']})
+    char_classes.update({char: NUMBER for char in ATOMS['number']})
+    char_classes.update({char: WHITESPACE for char in WHITESPACE_CHARS})
+    char_classes.update({'"': STRING, '|': STRING, '-': DASH, '!': BANG})
+    return char_classes
+
+def _compile_keyword_trie() -> dict:
+    '''
+    every reserved lexeme that is matched as is. placeholder token types (all uppercase),
+    array types, type checker only types and dashes (which need the previous tokens) are left out
+    '''
+    trie = {}
+    for token_type in TokenType:
+        lexeme = token_type.token
+        if (lexeme.isupper() or lexeme.endswith('[]') or token_type.delim_id == 'all'
+                or lexeme[0] not in VALID_STARTING_CHARS or lexeme[0] == '-'):
+            continue
+        node = trie
+        for char in lexeme:
+            node = node.setdefault(char, {})
+        node[None] = token_type
+    return trie
+
+CHAR_CLASSES = _compile_char_classes()
+KEYWORD_TRIE = _compile_keyword_trie()
+
+def longest_reserved(source: str, offset: int, line_end: int) -> TokenType | None:
+    '''
+    walks the keyword trie from the given offset up to the end of its line and returns the longest reserved lexeme found.
+    no two reserved lexemes of the same starting character overlap unless one is the prefix of the other,
+    so this is the same lexeme the first successful peek of the keyword cascade would find
+    '''
+    node = KEYWORD_TRIE
+    match = None
+    while offset < line_end:
+        node = node.get(source[offset])
+        if node is None:
+            break
+        match = node.get(None, match)
+        offset += 1
+    return match
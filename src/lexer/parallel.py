@@ -0,0 +1,154 @@
+'''
+Lexing of large sources in a process pool.
+
+the source is split into chunks of lines, at lines that a cheap scan says are outside of multi line comments
+(the only tokens that span lines). every chunk is lexed on its own along with the line after it,
+so its last lines are not lexed as the end of the file, like a re-lex of edited lines.
+a boundary is only trusted if the lexer of the chunk before it reached it from its first character,
+otherwise the two chunks are lexed again as one (and the rest of the source if that fails too),
+so the result is the same as a sequential lex.
+
+tokens come back from the pool as plain arrays, and get their unique types in the parent in source order,
+so identifiers are numbered like a sequential lex numbers them
+'''
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+from .lexer import Lexer, TableLexer, Whitespace
+from .token import Token, pack_position
+from .source import SourceLines
+from .context import CompileContext
+from .incremental import _shift_error
+from .token_cache import encode_tokens, decode_tokens
+
+# lines per chunk, smaller sources are lexed sequentially
+MIN_CHUNK_LINES = 2000
+# chunks per process, so that a slow chunk does not leave the other processes idle
+CHUNKS_PER_JOB = 4
+
+WHITESPACE = ('', ' ', '\t', '\n')
+
+def chunk_boundaries(lines: Sequence[str], chunk_count: int) -> list[int]:
+    '''
+    first lines of the chunks after the first, about evenly spaced.
+    a line is only a boundary if an even number of >//< comes before it,
+    and if it does not start with whitespace, which could be part of a run of whitespace from the line before
+    '''
+    if chunk_count <= 1:
+        return []
+    size = len(lines) / chunk_count
+    boundaries = []
+    opened = 0
+    target = size
+    for i, line in enumerate(lines):
+        if i >= target and opened % 2 == 0 and line[:1] not in WHITESPACE:
+            boundaries.append(i)
+            target = i + size
+        opened += line.count('>//<')
+    return boundaries
+
+def _lex_chunk(lexer: type[Lexer], lines: list[str], first_line: int, stop: int, whitespace: Whitespace) -> tuple:
+    '''
+    lexes lines, keeping the tokens, errors and line states of the lines before stop.
+    positions are moved to first_line, and unique types are sent as ids since they are numbered by the parent
+    '''
+    lexed = lexer(lines, whitespace=whitespace, context=CompileContext())
+    last = pack_position((stop, 0))
+    kept = lexed.tokens
+    for i, token in enumerate(kept):
+        if token._position >= last:
+            kept = kept[:i]
+            break
+    # eg. a run of whitespace
+    crossed = bool(kept) and kept[-1]._end_position >= last
+    # the source is given back to errors by the parent, instead of being sent along with them
+    errors = [_shift_error(e, first_line, None) for e in lexed.errors if e.position[0] < stop]
+    # whether the lexer reached stop from its first character, without a token going past it
+    reached_stop = stop >= len(lines) or not (lexed.line_states[stop] or crossed)
+    return *encode_tokens(kept, first_line), errors, lexed.line_states[:stop], reached_stop
+
+class ParallelLexer:
+    '''
+    Lexes a source in chunks over a pool of jobs processes (all cores by default).
+    has the tokens, errors, line states and context of a sequential lex of the source by the given lexer
+    '''
+    def __init__(self, source_code: list[str] | SourceLines | str | bytes, whitespace: Whitespace = Whitespace.KEEP,
+                 lexer: type[Lexer] = TableLexer, jobs: int = None, context: CompileContext = None):
+        if not isinstance(source_code, (list, SourceLines)):
+            source_code = SourceLines(source_code)
+        if context is None:
+            context = CompileContext(source_code).make_current()
+        else:
+            context.source = source_code
+        self.context = context
+        self._lexer = lexer
+        self._whitespace = whitespace
+        self._lines = source_code
+        self._tokens: list[Token] = []
+        self._logs = []
+        self._line_states: list[bool] = []
+
+        jobs = jobs or os.cpu_count() or 1
+        chunk_count = min(jobs * CHUNKS_PER_JOB, len(source_code) // MIN_CHUNK_LINES) if jobs > 1 else 1
+        starts = [0] + chunk_boundaries(source_code, chunk_count) + [len(source_code)]
+        chunks = list(zip(starts, starts[1:]))
+
+        if len(chunks) == 1:
+            lexed = lexer(source_code, whitespace=whitespace, context=context)
+            self._tokens, self._logs, self._line_states = lexed.tokens, lexed.errors, lexed.line_states
+            return
+        with ProcessPoolExecutor(min(jobs, len(chunks))) as pool:
+            futures = [pool.submit(_lex_chunk, lexer, source_code[start:stop+1], start, stop - start, whitespace)
+                       for start, stop in chunks]
+            self._merge(chunks, (future.result() for future in futures))
+
+    @property
+    def tokens(self) -> list[Token]:
+        return self._tokens
+
+    @property
+    def errors(self):
+        return self._logs
+
+    @property
+    def line_states(self) -> list[bool]:
+        return self._line_states
+
+    def _lex_range(self, chunk: tuple[int, int]) -> tuple:
+        start, stop = chunk
+        return _lex_chunk(self._lexer, self._lines[start:stop+1], start, stop - start, self._whitespace)
+
+    def _merge(self, chunks: list[tuple[int, int]], results):
+        '''
+        adds the results of the chunks in order.
+        a chunk whose boundary with the next one is not safe is lexed again along with the next one,
+        and if that is still not safe, with the rest of the source so that no line is lexed more than three times
+        '''
+        start = None
+        retried = False
+        for (chunk_start, stop), result in zip(chunks, results):
+            if start is None:
+                start = chunk_start
+            elif not retried:
+                # the previous chunk did not reach this one from a line start
+                result = self._lex_range((start, stop))
+                retried = True
+            else:
+                self._add(*self._lex_range((start, len(self._lines)))[:-1])
+                return
+            *lexed, reached_stop = result
+            if not reached_stop:
+                continue
+            self._add(*lexed)
+            start = None
+            retried = False
+
+    def _add(self, lexemes: list[str], types: array, positions: array, end_positions: array,
+             errors: list, line_states: list[bool]):
+        self._tokens += decode_tokens(lexemes, types, positions, end_positions, self.context)
+        for error in errors:
+            error.src = self._lines
+        self._logs.extend(errors)
+        self._line_states.extend(line_states)
@@ -0,0 +1,65 @@
+import mmap
+from array import array
+from collections.abc import Sequence
+from os import PathLike
+
+class SourceLines(Sequence):
+    '''
+    The lines of a source kept as the one string they come from,
+    indexed like the list readlines() would give.
+
+    lines are only sliced out when indexed, and the line index (an int array of line starts)
+    is built the first time it is needed, so a source costs its text and 8 bytes per line
+    '''
+    __slots__ = ('text', '_line_starts')
+
+    def __init__(self, source: str | bytes | bytearray | memoryview | mmap.mmap):
+        if not isinstance(source, str):
+            source = str(source, 'utf-8')
+        if '\r' in source:
+            # universal newlines, like reading in text mode
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
+        self.text = source
+        self._line_starts: array | None = None
+
+    @classmethod
+    def from_file(cls, path: str | PathLike) -> "SourceLines":
+        'decodes the file straight from a memory map, without reading it into bytes first'
+        with open(path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return cls(mapped)
+            except ValueError:
+                # empty files cannot be mapped
+                return cls('')
+
+    @property
+    def line_starts(self) -> array:
+        'offsets of the first character of every line'
+        if self._line_starts is None:
+            text = self.text
+            starts = array('q', [0] if text else [])
+            last = len(text) - 1
+            newline = text.find('\n')
+            while -1 < newline < last:
+                starts.append(newline + 1)
+                newline = text.find('\n', newline + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def __len__(self) -> int:
+        return len(self.line_starts)
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        starts = self.line_starts
+        if index < 0:
+            index += len(starts)
+        if not 0 <= index < len(starts):
+            raise IndexError('line index out of range')
+        end = starts[index+1] if index + 1 < len(starts) else len(self.text)
+        return self.text[starts[index]:end]
+
+    def __repr__(self) -> str:
+        return f"SourceLines({len(self)} lines)"
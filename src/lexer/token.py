@@ -1,7 +1,20 @@
 import re
+from sys import intern
 from constants.constants import DELIMS
 from enum import Enum
-from copy import deepcopy
+
+from .context import CompileContext, current_context
+
+# (line, column) positions are packed into one int, line in the high bits and column in the low bits
+_COLUMN_BITS = 32
+_COLUMN_OFFSET = 1 << (_COLUMN_BITS - 1)
+
+def pack_position(position: tuple[int, int]) -> int:
+    return (position[0] << _COLUMN_BITS) + position[1]
+
+def unpack_position(packed: int) -> tuple[int, int]:
+    line, column = divmod(packed + _COLUMN_OFFSET, 1 << _COLUMN_BITS)
+    return line, column - _COLUMN_OFFSET
 
 class TokenType(Enum):
     def __init__(self, token: str, delim_id: str):
@@ -215,6 +228,12 @@ class TokenType(Enum):
     # for `flatten()` type checking
     ONE_D_ARRAY = ("one_d_arr", "all")
 
+# dense ids of token kinds: every token type, then identifiers and class names, which have unique types
+for _kind, _token_type in enumerate(TokenType):
+    _token_type.kind = _kind
+IDENTIFIER_KIND = len(TokenType)
+CWASS_KIND = IDENTIFIER_KIND + 1
+KIND_COUNT = CWASS_KIND + 1
 
 class UniqueTokenType:
     """
@@ -222,27 +241,60 @@ class UniqueTokenType:
     Will have a unique token_type for every new lexeme read.
     """
 
-    identifier_dict = {}
-    cwass_dict = {}
+    __slots__ = ('_token', '_type', '_delim_id', '_expected_delims', '_arr', '_unit', 'kind')
 
     # Unique Token Types
     ID = "ID"
     CWASS = "CWASS"
 
-    def __init__(self, lexeme: str = '', token: str = 'ID'):
+    def __new__(cls, lexeme: str = '', token: str = 'ID', context: CompileContext = None):
+        'descriptors are immutable and shared, one per lexeme and unique type in the context (the current one by default)'
+        context = context if context is not None else current_context()
+        unique_type = cls.register(lexeme, token, context)
+        interned = context.interned.get((lexeme, unique_type))
+        if interned is not None:
+            return interned
+        if token == cls.ID:
+            delim_id = "id"
+        elif token == cls.CWASS:
+            delim_id = "cwass"
+        interned = context.interned[(lexeme, unique_type)] = cls._make(lexeme, unique_type, delim_id)
+        return interned
+
+    @classmethod
+    def _make(cls, lexeme: str, unique_type: str, delim_id: str) -> "UniqueTokenType":
+        'makes a descriptor without registering or interning it'
+        self = object.__new__(cls)
         self._token = lexeme
-        if token == self.ID:
-            self._type = self.identifier_dict.setdefault(lexeme, f"IDENTIFIER_{len(self.identifier_dict) + 1}")
-            self._delim_id = "id"
-        elif token == self.CWASS:
-            self._type = self.cwass_dict.setdefault(lexeme, f"CWASS_{len(self.cwass_dict) + 1}")
-            self._delim_id = "cwass"
-        self._expected_delims = DELIMS[self._delim_id]
+        self._type = unique_type
+        self._delim_id = delim_id
+        self._expected_delims = DELIMS[delim_id]
+        self.kind = IDENTIFIER_KIND if unique_type.startswith("IDENTIFIER") else CWASS_KIND
+        # array and unit forms, made once when first asked for
+        self._arr = None
+        self._unit = None
+        return self
+
+    # immutable, so copies are the descriptor itself
+    def __copy__(self):
+        return self
+    def __deepcopy__(self, memo):
+        return self
+    def __reduce__(self):
+        return UniqueTokenType._make, (self._token, self._type, self._delim_id)
 
     @classmethod
-    def clear(cls):
-        cls.identifier_dict.clear()
-        cls.cwass_dict.clear()
+    def register(cls, lexeme: str, token: str = 'ID', context: CompileContext = None) -> str:
+        'returns the unique type of the lexeme, numbering it if it is new'
+        context = context if context is not None else current_context()
+        if token == cls.ID:
+            return context.identifier_dict.setdefault(lexeme, f"IDENTIFIER_{len(context.identifier_dict) + 1}")
+        elif token == cls.CWASS:
+            return context.cwass_dict.setdefault(lexeme, f"CWASS_{len(context.cwass_dict) + 1}")
+
+    @classmethod
+    def clear(cls, context: CompileContext = None):
+        (context if context is not None else current_context()).clear()
 
     @property
     def token(self):
@@ -280,13 +332,16 @@ class UniqueTokenType:
         return self.token
 
     def to_arr_type(self):
-        tmp = deepcopy(self)
-        tmp._token += "[]" if not tmp._token.endswith("[]") else ""
-        return tmp
+        if self._token.endswith("[]"): return self
+        if self._arr is None:
+            self._arr = self._make(self._token + "[]", self._type, self._delim_id)
+            if "[]" not in self._token: self._arr._unit = self
+        return self._arr
     def to_unit_type(self):
-        tmp = deepcopy(self)
-        tmp._token = tmp._token.replace("[]", "")
-        return tmp
+        if "[]" not in self._token: return self
+        if self._unit is None:
+            self._unit = self._make(self._token.replace("[]", ""), self._type, self._delim_id)
+        return self._unit
     def is_arr_type(self):
         return self.token.find("[") != -1
     def is_unique_type(self):
@@ -296,16 +351,21 @@ class UniqueTokenType:
     def is_arrayable(self):
         return True
 
-# for keeping track of class properties
-class_properties: set[str] = set()
 class Token:
-    'A class for representing tokens in a lexer'
+    '''
+    A class for representing tokens in a lexer
+
+    lexemes are interned and positions are stored packed as ints,
+    since a source produces a token for every whitespace
+    '''
+    # start_pos and end_pos are set by the parser when a token is used as a statement/expression
+    __slots__ = ('_lexeme', '_token', '_position', '_end_position', 'start_pos', 'end_pos')
 
     def __init__(self, lexeme: str = "", token: TokenType | UniqueTokenType = TokenType.EOF, position: tuple[int, int] = (0, 0), end_position: tuple[int, int] = (0, 0)):
-        self._lexeme = lexeme
+        self._lexeme = intern(lexeme)
         self._token = token
-        self._position = position
-        self._end_position = end_position
+        self._position = (position[0] << _COLUMN_BITS) + position[1]
+        self._end_position = self._position if end_position is position else (end_position[0] << _COLUMN_BITS) + end_position[1]
 
     def __repr__(self):
         return self._lexeme
@@ -329,10 +389,9 @@ class Token:
         match self.token:
             # for possibly class members
             case UniqueTokenType():
-                global class_properties
                 res = ""
                 if self.token.is_arr_type(): return "Array"
-                if cwass and f"_{self.lexeme}" in class_properties:
+                if cwass and f"_{self.lexeme}" in current_context().class_properties:
                     res = "self."
                 res += f"_{self.lexeme}"
                 return res
@@ -466,10 +525,18 @@ class Token:
         matched = matched[1].split("]") if len(matched) > 1 else []
         return int(matched[0] if matched[0] else 1) if len(matched) > 1 else 0
 
+    def _copy(self) -> "Token":
+        'shallow copy, token types are immutable so they are shared'
+        ret = Token.__new__(Token)
+        for attr in Token.__slots__:
+            if hasattr(self, attr):
+                setattr(ret, attr, getattr(self, attr))
+        return ret
+
     def to_unit_type(self, times = 1) -> "Token":
         'returns a copy'
         if not self.is_arrayable(): return self
-        ret = deepcopy(self)
+        ret = self._copy()
         matched = ret.lexeme.split("[")
         matched = matched[1].split("]") if len(matched) > 1 else []
         dimension = int(matched[0] if matched[0] else 1) if len(matched) > 1 else 0
@@ -486,7 +553,7 @@ class Token:
     def to_arr_type(self, times = 1) -> "Token":
         'returns a copy'
         if not self.is_arrayable(): return self
-        ret = deepcopy(self)
+        ret = self._copy()
         matched = ret.lexeme.split("[")
         matched = matched[1].split("]") if len(matched) > 1 else []
         dimension = int(matched[0] if matched[0] else 1) if len(matched) > 1 else 0
@@ -528,19 +595,19 @@ class Token:
 
     @property
     def position(self) -> tuple[int, int]:
-        return self._position
+        return unpack_position(self._position)
 
     @position.setter
     def position(self, position: tuple[int, int]):
-        self._position = position
+        self._position = pack_position(position)
 
     @property
     def end_position(self) -> tuple[int, int]:
-        return self._end_position
+        return unpack_position(self._end_position)
 
     @end_position.setter
     def end_position(self, end_position: tuple[int, int]):
-        self._end_position = end_position
+        self._end_position = pack_position(end_position)
 
     @staticmethod
     def arr_type(token_type: TokenType|UniqueTokenType, dimension: int = 1) -> "Token":
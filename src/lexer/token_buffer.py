@@ -0,0 +1,62 @@
+from array import array
+from sys import intern
+from typing import Iterable, Iterator
+
+from .token import Token, TokenType, UniqueTokenType, unpack_position
+
+class TokenBuffer:
+    '''
+    Struct of arrays storage for a token stream.
+
+    lexemes and token types are kept in parallel lists while positions are kept packed in int arrays,
+    so a stored token costs a few machine words instead of an object.
+    Token views are only created when indexed or iterated, and changing a view does not change the buffer
+    '''
+    __slots__ = ('_lexemes', '_types', '_positions', '_end_positions')
+
+    def __init__(self, tokens: Iterable[Token] = ()):
+        self._lexemes: list[str] = []
+        self._types: list[TokenType | UniqueTokenType] = []
+        self._positions = array('q')
+        self._end_positions = array('q')
+        self.extend(tokens)
+
+    def append(self, token: Token):
+        self._lexemes.append(intern(token.lexeme))
+        self._types.append(token.token)
+        # already packed
+        self._positions.append(token._position)
+        self._end_positions.append(token._end_position)
+
+    def extend(self, tokens: Iterable[Token]):
+        for token in tokens:
+            self.append(token)
+
+    def __len__(self) -> int:
+        return len(self._lexemes)
+
+    def __getitem__(self, index: int | slice) -> Token | list[Token]:
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('token buffer index out of range')
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[Token]:
+        for i in range(len(self)):
+            yield self._view(i)
+
+    def _view(self, index: int) -> Token:
+        return Token(self._lexemes[index], self._types[index],
+                     unpack_position(self._positions[index]), unpack_position(self._end_positions[index]))
+
+    def lexeme(self, index: int) -> str:
+        return self._lexemes[index]
+
+    def token_type(self, index: int) -> TokenType | UniqueTokenType:
+        return self._types[index]
+
+    def position(self, index: int) -> tuple[int, int]:
+        return unpack_position(self._positions[index])
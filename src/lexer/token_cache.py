@@ -0,0 +1,226 @@
+'''
+On disk cache of lexed sources, in a compact binary format.
+
+a cache file holds, after a header of counts:
+- a string table: the length of every distinct lexeme, then all of them as one utf-8 string
+- per token: the index of its lexeme, the id of its token type, and its packed start and end positions
+- a byte per line for the line states
+- the errors, pickled without their source
+
+files are named after the hash of the source, the lexer, the whitespace mode and the version of the lexer
+(the hash of its own source files), so a changed lexer never loads tokens it did not make.
+unique types are made again in token order when loading, so they are numbered like a lex numbers them
+'''
+import hashlib
+import pickle
+import struct
+from array import array
+from functools import cache
+from pathlib import Path
+from sys import intern
+
+from constants import constants
+from constants.path import TOKEN_CACHE
+from src.cache import DirectoryCache
+from .lexer import Lexer, TableLexer, Whitespace
+from .token import Token, TokenType, UniqueTokenType, pack_position
+from .source import SourceLines
+from .context import CompileContext
+from .incremental import _shift_error
+
+# bumped when the layout of cache files changes
+FORMAT_VERSION = 1
+MAGIC = b'UWUT'
+# magic, format version, lexeme count, size of the lexemes in bytes, token count, line count
+_HEADER = struct.Struct('<4sHIIII')
+_LINE_LENGTH = struct.Struct('<Q')
+# 64 MB, a 100k line source takes around 10 MB
+MAX_CACHE_SIZE = 64 * 1024 * 1024
+
+TOKEN_TYPES = list(TokenType)
+_TOKEN_TYPE_IDS = {token_type: i for i, token_type in enumerate(TOKEN_TYPES)}
+# token type ids of unique types, which are made again from their lexeme
+_ID, _CWASS = -1, -2
+
+def encode_tokens(tokens: list[Token], line_delta: int = 0) -> tuple[list[str], array, array, array]:
+    'the lexemes, token type ids and packed positions (moved down by line_delta lines) of tokens'
+    shift = pack_position((line_delta, 0))
+    lexemes, types, positions, end_positions = [], array('b'), array('q'), array('q')
+    for token in tokens:
+        lexemes.append(token.lexeme)
+        token_type = token.token
+        if isinstance(token_type, UniqueTokenType):
+            types.append(_CWASS if token_type.delim_id == 'cwass' else _ID)
+        else:
+            types.append(_TOKEN_TYPE_IDS[token_type])
+        positions.append(token._position + shift)
+        end_positions.append(token._end_position + shift)
+    return lexemes, types, positions, end_positions
+
+def decode_tokens(lexemes: list[str], types: array, positions: array, end_positions: array,
+                  context: CompileContext) -> list[Token]:
+    'tokens from what encode_tokens gives, with unique types numbered in the context in token order'
+    unique_types: dict[tuple[str, int], UniqueTokenType] = {}
+    new = object.__new__
+    tokens = []
+    append = tokens.append
+    for lexeme, type_id, position, end_position in zip(lexemes, types, positions, end_positions):
+        if type_id >= 0:
+            token_type = TOKEN_TYPES[type_id]
+        else:
+            # the same lexeme always gets the unique type it got first
+            token_type = unique_types.get((lexeme, type_id))
+            if token_type is None:
+                kind = UniqueTokenType.CWASS if type_id == _CWASS else UniqueTokenType.ID
+                token_type = unique_types[lexeme, type_id] = UniqueTokenType(lexeme, kind, context)
+        # made without __init__, since the positions are already packed
+        token = new(Token)
+        token._lexeme = intern(lexeme)
+        token._token = token_type
+        token._position = position
+        token._end_position = end_position
+        append(token)
+    return tokens
+
+def dump_tokens(tokens: list[Token], errors: list, line_states: list[bool]) -> bytes:
+    lexemes, types, positions, end_positions = encode_tokens(tokens)
+    table: dict[str, int] = {}
+    indexes = array('I', [table.setdefault(lexeme, len(table)) for lexeme in lexemes])
+    lengths = array('I', map(len, table))
+    text = ''.join(table).encode('utf-8', 'surrogatepass')
+    return b''.join([
+        _HEADER.pack(MAGIC, FORMAT_VERSION, len(table), len(text), len(tokens), len(line_states)),
+        lengths.tobytes(), text,
+        indexes.tobytes(), types.tobytes(), positions.tobytes(), end_positions.tobytes(),
+        bytes(line_states),
+        pickle.dumps([_shift_error(e, 0, None) for e in errors], pickle.HIGHEST_PROTOCOL),
+    ])
+
+def load_tokens(data: bytes, source: list[str] | SourceLines, context: CompileContext) -> tuple[list[Token], list, list[bool]]:
+    'the tokens, errors and line states dumped by dump_tokens, errors are given source. raises ValueError if data is not a cache file'
+    if len(data) < _HEADER.size:
+        raise ValueError('truncated token cache')
+    magic, version, lexeme_count, text_size, token_count, line_count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError('not a token cache of this version')
+    data = memoryview(data)
+    offset = _HEADER.size
+
+    def read(typecode: str, count: int) -> array:
+        nonlocal offset
+        values = array(typecode)
+        size = values.itemsize * count
+        if offset + size > len(data):
+            raise ValueError('truncated token cache')
+        values.frombytes(data[offset:offset + size])
+        offset += size
+        return values
+
+    lengths = read('I', lexeme_count)
+    text = str(read('B', text_size), 'utf-8', 'surrogatepass')
+    table, start = [], 0
+    for length in lengths:
+        table.append(text[start:start + length])
+        start += length
+    lexemes = [table[i] for i in read('I', token_count)]
+    types = read('b', token_count)
+    positions = read('q', token_count)
+    end_positions = read('q', token_count)
+    line_states = list(map(bool, read('B', line_count)))
+    try:
+        errors = pickle.loads(data[offset:])
+    except Exception as e:
+        raise ValueError('broken errors in token cache') from e
+
+    tokens = decode_tokens(lexemes, types, positions, end_positions, context)
+    for error in errors:
+        error.src = source
+    return tokens, errors, line_states
+
+def _tables() -> str:
+    'the delimiter and atom tables the lexer is made from, sorted since the order of a set changes between runs'
+    return repr([(name, sorted(table[name])) for table in [constants.DELIMS, constants.ATOMS] for name in sorted(table)])
+
+@cache
+def lexer_version() -> str:
+    'the hash of the source files of the lexer and of the tables it is made from, so that a change to either misses the cache'
+    digest = hashlib.sha256(str(FORMAT_VERSION).encode())
+    for path in sorted(Path(__file__).parent.rglob('*.py')):
+        digest.update(path.read_bytes())
+    digest.update(_tables().encode())
+    return digest.hexdigest()
+
+class TokenCache(DirectoryCache):
+    '''
+    Directory of lexed sources, a file per source.
+    '''
+    def __init__(self, directory: str | Path = TOKEN_CACHE, max_size: int = MAX_CACHE_SIZE) -> None:
+        super().__init__(directory, max_size)
+
+    def key(self, source: list[str] | SourceLines, lexer: type[Lexer], whitespace: Whitespace) -> str:
+        digest = hashlib.sha256()
+        for part in [lexer_version(), lexer.__name__, whitespace.name]:
+            digest.update(part.encode())
+            digest.update(b'\0')
+        # lines are length prefixed, since lines without a newline at their end would join into other sources
+        for line in source:
+            line = line.encode('utf-8', 'surrogatepass')
+            digest.update(_LINE_LENGTH.pack(len(line)))
+            digest.update(line)
+        return digest.hexdigest()
+
+    def get(self, key: str, source: list[str] | SourceLines, context: CompileContext) -> tuple[list[Token], list, list[bool]] | None:
+        'the tokens, errors and line states of a cached lex, None if it is not cached or its file is broken'
+        path = self.directory / key
+        try:
+            data = path.read_bytes()
+            lexed = load_tokens(data, source, context)
+            self.touch(path)
+        except (OSError, ValueError):
+            return None
+        return lexed
+
+    def put(self, key: str, tokens: list[Token], errors: list, line_states: list[bool]) -> None:
+        'stores a lex, then evicts old files if over the max size'
+        self.write(key, lambda partial: partial.write_bytes(dump_tokens(tokens, errors, line_states)))
+
+class CachedLexer:
+    '''
+    Loads the tokens, errors and line states of a source from the cache, lexing it with lexer only if it is not cached.
+    has the results of the lex like the lexer would, and whether they were cached
+    '''
+    def __init__(self, source_code: list[str] | SourceLines | str | bytes, whitespace: Whitespace = Whitespace.KEEP,
+                 lexer: type[Lexer] = TableLexer, context: CompileContext = None, cache: TokenCache = None):
+        if not isinstance(source_code, (list, SourceLines)):
+            source_code = SourceLines(source_code)
+        if context is None:
+            context = CompileContext(source_code).make_current()
+        else:
+            context.source = source_code
+        self.context = context
+        cache = cache if cache is not None else TokenCache()
+
+        key = cache.key(source_code, lexer, whitespace)
+        lexed = cache.get(key, source_code, context)
+        self.cached = lexed is not None
+        if lexed is None:
+            lx = lexer(source_code, whitespace=whitespace, context=context)
+            lexed = lx.tokens, lx.errors, lx.line_states
+            try:
+                cache.put(key, *lexed)
+            except OSError:
+                # a cache that cannot be written is only slower
+                pass
+        self._tokens, self._logs, self._line_states = lexed
+
+    @property
+    def tokens(self) -> list[Token]:
+        return self._tokens
+
+    @property
+    def errors(self):
+        return self._logs
+
+    @property
+    def line_states(self) -> list[bool]:
+        return self._line_states
@@ -1,5 +1,6 @@
 # Treat parser as a package
 from .parser import Parser
+from .incremental import reparse
 from .productions import *
 from .error_handler import *
 from .production_types import *
@@ -1,12 +1,9 @@
 from constants.path import PARSER_SOURCE
 from .parser import *
-from ..lexer import Lexer
-from .error_handler import ErrorSrc
+from ..lexer import Lexer, SourceLines, Whitespace
 
 if __name__ == "__main__":
-    source: list[str] = [
-        line if line else "\n" for line in open(PARSER_SOURCE, "r").readlines()
-    ]
+    source = SourceLines.from_file(PARSER_SOURCE)
     max_digit_length = len(str(len(source)))
     max_width = max(len(line) for line in source) + max_digit_length + 3
     print("\nsample text file")
@@ -17,13 +14,12 @@ if __name__ == "__main__":
     print("-" * max_width)
     print("end of file\n")
 
-    l = Lexer(source)
+    l = Lexer(source, whitespace=Whitespace.SKIP)
     if l.errors:
         for err in l.errors:
             print(err)
         exit(1)
 
-    ErrorSrc.src = source
     p = Parser(l.tokens)
     print()
 
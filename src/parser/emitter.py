@@ -0,0 +1,31 @@
+'''
+Writer of transpiled and formatted output.
+
+nodes with blocks write their lines into one emitter instead of returning strings,
+so a nested block is written once, instead of being copied again into every block around it
+'''
+from typing import Callable
+
+INDENT = "    "
+
+class Emitter:
+    'chunks of output, joined once at the end'
+    __slots__ = ('chunks',)
+
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+
+    def write(self, *texts: str):
+        self.chunks.extend(texts)
+
+    def indent(self, indent: int):
+        self.chunks.append(INDENT * indent)
+
+    def getvalue(self) -> str:
+        return ''.join(self.chunks)
+
+def emit(write: Callable[..., None], *args, **kwargs) -> str:
+    'the output of a write method as a string'
+    out = Emitter()
+    write(out, *args, **kwargs)
+    return out.getvalue()
@@ -1,8 +1,6 @@
-class ErrorSrc:
-    src = [""]
+from src.lexer.context import ErrorSource
 
-
-class Error:
+class Error(ErrorSource):
     def __init__(self, error_type: str, message: str, position: tuple[int, int], end_position: tuple[int, int] = None):
         self.error_type = error_type
         self.message = message
@@ -22,9 +20,9 @@ class Error:
         # Error preview
         error_range = 1 if self.end_position is None else self.end_position[1] - self.position[1] + 1
         index_str = str(self.position[0] + 1)
-        border = f"\t{'_' * (len(ErrorSrc.src[self.position[0]]) + len(index_str) + 3)}\n"
+        border = f"\t{'_' * (len(self.src[self.position[0]]) + len(index_str) + 3)}\n"
         log += border
-        log += f"\t{index_str} | {ErrorSrc.src[self.position[0]]}\n"
+        log += f"\t{index_str} | {self.src[self.position[0]]}\n"
         log += f"\t{' ' * len(index_str)} | {' ' * self.position[1]}{'^' * error_range}\n"
         log += border
 
@@ -0,0 +1,195 @@
+'''
+Incremental parsing of edited sources.
+
+a parse keeps the range of tokens every top level definition was parsed from.
+after an edit, a definition is reused if its tokens, and the token the parser peeked after it,
+are among the tokens before or after the edit that did not change (same lexeme, kind and position, shifted by the
+lines the edit added or removed). reused nodes are moved in place: the tokens in them are replaced with the tokens
+they match in the new source, and their positions are shifted. the definitions the edit touches are parsed again,
+so the program is the same as a parse of the whole source
+'''
+from copy import copy
+from functools import cache
+
+from src.lexer.token import Token, pack_position
+from src.lexer.context import CompileContext
+from .parser import Parser, Definition
+from .productions import Comment
+from .production_types import Production
+
+class ReusableDefinitions:
+    '''
+    The definitions of a previous parse, taken by the parser of the edited source.
+    - lines [start:old_stop] of the previous source were replaced with [start:new_stop]
+    the previous parse should not be used after, since the nodes taken from it are moved to the new source
+    '''
+    def __init__(self, previous: Parser, start: int, old_stop: int, new_stop: int) -> None:
+        self.old_tokens = previous.tokens
+        self.next_code = previous.next_code
+        self.definitions = {definition.start: definition for definition in previous.definitions}
+        self.start = start
+        self.old_stop = old_stop
+        self.line_delta = new_stop - old_stop
+        # the number of unchanged tokens before and after the edit, matched on the first take
+        self.prefix: int | None = None
+        self.suffix: int | None = None
+        self.reused: list[Definition] = []
+
+    def match(self, tokens: list[Token]):
+        'counts the unchanged tokens before and after the edit'
+        old = self.old_tokens
+        shortest = min(len(old), len(tokens))
+
+        edit_start = pack_position((self.start, 0))
+        prefix = 0
+        while prefix < shortest:
+            a, b = old[prefix], tokens[prefix]
+            if (a._end_position >= edit_start or a._lexeme != b._lexeme or a._token.kind != b._token.kind
+                    or a._position != b._position or a._end_position != b._end_position):
+                break
+            prefix += 1
+
+        edit_stop = pack_position((self.old_stop, 0))
+        shift = pack_position((self.line_delta, 0))
+        suffix = 0
+        while suffix < shortest - prefix:
+            a, b = old[-1 - suffix], tokens[-1 - suffix]
+            if (a._position < edit_stop or a._lexeme != b._lexeme or a._token.kind != b._token.kind
+                    or a._position + shift != b._position or a._end_position + shift != b._end_position):
+                break
+            suffix += 1
+        self.prefix, self.suffix = prefix, suffix
+
+    def take(self, parser: Parser, state: tuple[bool, int]) -> tuple[str | None, Production | Comment | None] | None:
+        '''
+        the kind and node of the previous definition at the current token of the parser, None if it has to be parsed again.
+        a taken definition is moved to the new source, its errors are added to the parser and the parser advances past it
+        '''
+        if self.prefix is None:
+            self.match(parser.tokens)
+        pos = parser.pos
+        offset = len(parser.tokens) - len(self.old_tokens)
+        if pos < self.prefix:
+            offset, line_delta = 0, 0
+        elif pos >= len(parser.tokens) - self.suffix:
+            line_delta = self.line_delta
+        else:
+            return None
+        definition = self.definitions.get(pos - offset)
+        if definition is None or definition.state != state:
+            return None
+        # the last token the parser could have looked at
+        lookahead = min(self.next_code[definition.stop], len(self.old_tokens) - 1)
+        if pos < self.prefix and lookahead >= self.prefix:
+            return None
+
+        self.move(definition, parser, offset, line_delta, lookahead)
+        self.reused.append(definition)
+        parser.pos = definition.stop + offset
+        return definition.kind, definition.node
+
+    def move(self, definition: Definition, parser: Parser, offset: int, line_delta: int, lookahead: int):
+        old, new = self.old_tokens, parser.tokens
+        indexes = range(definition.start, lookahead + 1)
+        if definition.node is not None and (line_delta or any(old[i] is not new[i + offset] for i in indexes)):
+            mover = _Mover({id(old[i]): new[i + offset] for i in indexes}, line_delta)
+            mover.node(definition.node)
+        for error in definition.errors:
+            error = copy(error)
+            error.src = parser.context.source
+            if line_delta:
+                error.position = _shift(error.position, line_delta)
+                if error.end_position is not None:
+                    error.end_position = _shift(error.end_position, line_delta)
+            parser.errors.append(error)
+
+def _shift(position: tuple[int, int], line_delta: int) -> tuple[int, int]:
+    return position[0] + line_delta, position[1]
+
+def _is_position(value) -> bool:
+    return type(value) is tuple and len(value) == 2 and type(value[0]) is int and type(value[1]) is int
+
+class _Mover:
+    '''
+    moves a syntax tree in place to the new source.
+    tokens of the previous source are replaced with the tokens they match,
+    and tokens made by the parser (eg. empty string parts) are copied with their positions shifted
+    '''
+    def __init__(self, tokens: dict[int, Token], line_delta: int) -> None:
+        # by the id of the previous token. the previous tokens are kept so that their ids are not reused
+        self.tokens = tokens
+        self.kept: list[Token] = []
+        self.line_delta = line_delta
+        self.seen: set[int] = set()
+
+    def token(self, token: Token) -> Token:
+        moved = self.tokens.get(id(token))
+        if moved is token:
+            return token
+        if moved is None:
+            if not self.line_delta or not token.exists():
+                return token
+            moved = copy(token)
+            shift = pack_position((self.line_delta, 0))
+            moved._position += shift
+            moved._end_position += shift
+        # set by the parser on tokens used as expressions
+        for name in ('start_pos', 'end_pos'):
+            value = getattr(token, name, None)
+            if value is not None:
+                setattr(moved, name, _shift(value, self.line_delta) if _is_position(value) else value)
+        self.kept.append(token)
+        self.tokens[id(token)] = self.tokens[id(moved)] = moved
+        return moved
+
+    def value(self, value):
+        kind = type(value)
+        if kind is Token:
+            return self.token(value)
+        if kind is list:
+            value[:] = [self.value(item) for item in value]
+        elif kind is tuple:
+            if self.line_delta and _is_position(value):
+                return _shift(value, self.line_delta)
+        elif _is_node(kind):
+            self.node(value)
+        return value
+
+    def node(self, node: Production | Comment):
+        if id(node) in self.seen:
+            return
+        self.seen.add(id(node))
+        for field in _fields(type(node)):
+            try:
+                value = field.__get__(node)
+            except AttributeError:
+                # a lazy default that was never made
+                continue
+            kind = type(value)
+            # most fields are tokens, or values that are never moved
+            if kind is Token:
+                field.__set__(node, self.token(value))
+            elif kind not in _UNMOVED:
+                field.__set__(node, self.value(value))
+
+_UNMOVED = frozenset([type(None), bool, int, float, str])
+
+@cache
+def _fields(kind: type) -> tuple:
+    'the slots of a node class, which read a field without making its lazy default'
+    return tuple(vars(cls)[name] for cls in kind.__mro__ for name in vars(cls).get('__slots__', ()))
+
+@cache
+def _is_node(kind: type) -> bool:
+    return issubclass(kind, (Production, Comment))
+
+def reparse(parser: Parser, tokens: list[Token], start: int, old_stop: int, new_stop: int,
+            context: CompileContext = None) -> Parser:
+    '''
+    parses the tokens of an edited source, reusing the top level definitions of the previous parse the edit did not touch
+    - lines [start:old_stop] of the source of parser were replaced with [start:new_stop] (eg. the range of edit_range)
+    - context is the compilation the tokens were lexed in, the one of parser by default
+    the previous parse should not be used after
+    '''
+    reuse = ReusableDefinitions(parser, start, old_stop, new_stop)
+    return type(parser)(tokens, parser.stop_at_first_error, context if context is not None else parser.context, reuse=reuse)
@@ -25,9 +25,12 @@ Overview:
     - while and do while statements
     - for statements
 '''
-from typing import Callable, Literal, Sequence
+from array import array
+from itertools import islice
+from typing import Callable, Iterator, Literal, Sequence
 from .error_handler import Error
-from src.lexer.token import Token, TokenType, UniqueTokenType
+from src.lexer.token import Token, TokenType, UniqueTokenType, IDENTIFIER_KIND, CWASS_KIND, KIND_COUNT
+from src.lexer.context import CompileContext, current_context
 from src.parser.productions import *
 
 '''
@@ -68,43 +71,124 @@ precedence_map = {
     TokenType.MODULO_SIGN: PRODUCT,
 }
 
+# precedences indexed by token kind
+PRECEDENCES = [LOWEST] * KIND_COUNT
+for token_type, precedence in precedence_map.items():
+    PRECEDENCES[token_type.kind] = precedence
+
+# tokens pulled at a time from a token stream
+STREAM_LOOKAHEAD = 64
+COMMENTS = (TokenType.SINGLE_LINE_COMMENT, TokenType.MULTI_LINE_COMMENT)
+
+# "IDENTIFIER" and "CWASS_ID" stand for any identifier and class name where token types are expected.
+# other strings are no kind, which has no parsing functions
+_STRING_KINDS = {"IDENTIFIER": IDENTIFIER_KIND, "CWASS_ID": CWASS_KIND}
+NO_KIND = KIND_COUNT
+
+def token_kind(token_type: str | TokenType | UniqueTokenType) -> int:
+    return _STRING_KINDS.get(token_type, NO_KIND) if isinstance(token_type, str) else token_type.kind
+
+def token_kinds(token_types: Sequence[str | TokenType] | frozenset[int]) -> frozenset[int]:
+    'the kinds of token types, for membership checks. kinds are given back as is'
+    if isinstance(token_types, frozenset):
+        return token_types
+    return frozenset(map(token_kind, token_types))
+
+STATEMENT_END = token_kinds([TokenType.TERMINATOR, TokenType.EOF])
+BLOCK_END = token_kinds([TokenType.DOUBLE_CLOSE_BRACKET, TokenType.EOF])
+STRING_END = token_kinds([TokenType.STRING_LITERAL, TokenType.STRING_PART_END])
+STRING_FMT_END = token_kinds([TokenType.STRING_PART_END, TokenType.TERMINATOR, TokenType.EOF])
+ARGS_END = token_kinds([TokenType.CLOSE_PAREN, TokenType.TERMINATOR, TokenType.EOF])
+ARRAY_END = token_kinds([TokenType.CLOSE_BRACE, TokenType.TERMINATOR, TokenType.EOF])
+POSTFIX_OPERATORS = token_kinds([TokenType.INCREMENT_OPERATOR, TokenType.DECREMENT_OPERATOR])
+ACCESSORS = token_kinds([TokenType.OPEN_PAREN, TokenType.DOT_OP, TokenType.OPEN_BRACE])
+
+class Definition:
+    '''
+    A top level definition as it was parsed.
+    - start, stop: the indexes of its first token and of the token after it
+    - kind: 'mainuwu', 'function', 'class', 'global', 'comment', or None for a token that starts no definition
+    - node: None if it has errors
+    - errors: the errors made while parsing it
+    - state: whether mainuwu was not defined yet, and the loop level, before it
+    '''
+    __slots__ = ('start', 'stop', 'kind', 'node', 'errors', 'state')
+
+    def __init__(self, start: int, stop: int, kind: str | None, node: Production | Comment | None,
+                 errors: list[Error], state: tuple[bool, int]) -> None:
+        self.start = start
+        self.stop = stop
+        self.kind = kind
+        self.node = node
+        self.errors = errors
+        self.state = state
+
 class Parser:
-    def __init__(self, tokens: list[Token]):
-        self.tokens = [token for token in tokens if token.token not in [TokenType.WHITESPACE]]
+    # dispatch tables, built once per class by register_init.
+    # the parsing functions (unbound) of every token kind, and the token types in the order they were registered
+    prefix_parse_fns: list[Callable | None]
+    prefix_special_parse_fns: list[Callable | None]
+    infix_parse_fns: list[Callable | None]
+    infix_special_parse_fns: list[Callable | None]
+    postfix_parse_fns: list[Callable | None]
+    in_block_parse_fns: list[Callable | None]
+    expected_prefix: list[str | TokenType]
+    expected_prefix_special: list[str | TokenType]
+    expected_infix: list[str | TokenType]
+    expected_infix_special: list[str | TokenType]
+    expected_postfix: list[str | TokenType]
+    expected_in_block: list[str | TokenType]
+    expected_prefix_kinds: frozenset[int]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.register_init()
+
+    def __init__(self, tokens: list[Token] | Iterator[Token], stop_at_first_error: bool = False, context: CompileContext = None,
+                 reuse: "ReusableDefinitions" = None):
+        '''
+        tokens can also be an iterator, eg. the stream of a lazy lexer,
+        which is then pulled as the parser goes instead of being copied first.
+        stop_at_first_error stops parsing after the top level definition with the first error.
+        context is the compilation the tokens were lexed in, the current one by default.
+        reuse has the definitions of a previous parse that can be taken as they are (see reparse)
+        '''
+        self.context = context if context is not None else current_context()
+        self.reuse = reuse
+        self.definitions: list[Definition] = []
+        self.streaming = not isinstance(tokens, list)
+        if self.streaming:
+            # filled a few tokens at a time as the parser advances
+            self.stream = (token for token in tokens if token.token != TokenType.WHITESPACE)
+            self.tokens: list[Token] = []
+        else:
+            self.tokens = [token for token in tokens if token.token not in [TokenType.WHITESPACE]]
+        # the index of the next token that is not a comment, for every token
+        self.next_code = array('q')
         self.errors: list[Error] = []
+        self.stop_at_first_error = stop_at_first_error
+
+        # errors show the source of the context
+        with self.context.activate():
+            # to keep track of tokens
+            self.pos = 0
+            if self.streaming:
+                self.fill()
+
+            if not self.tokens:
+                self.missing_mainuwu_error(Token("EOF", TokenType.EOF, (0, 0), (0, 0)))
+                self.program = None
+                return
 
-        # to associate prefix and infix parsing functions for certain token types
-        # key : val == TokenType : ParsingFunction
-        self.prefix_parse_fns: dict = {}
-        self.prefix_special_parse_fns: dict = {}
-        self.infix_parse_fns: dict = {}
-        self.infix_special_parse_fns: dict = {}
-        self.postfix_parse_fns: dict = {}
-        self.in_block_parse_fns: dict = {}
-        # to keep track of expected tokens
-        self.expected_prefix = []
-        self.expected_prefix_special = []
-        self.expected_infix = []
-        self.expected_infix_special = []
-        self.expected_postfix = []
-        self.expected_in_block = []
-
-        self.register_init()
-
-        if not self.tokens:
-            self.missing_mainuwu_error(Token("EOF", TokenType.EOF, (0, 0), (0, 0)))
-            self.program = None
-            return
-
-        # to keep track of tokens
-        self.pos = 0
-
-        # to keep track of whether inside loops
-        self.loop_level = 0
+            # to keep track of whether inside loops
+            self.loop_level = 0
 
-        eof_pos = (self.tokens[-1].end_position[0], self.tokens[-1].end_position[1] + 1)
-        self.tokens.append(Token("EOF", TokenType.EOF, eof_pos, eof_pos))
-        self.program = self.parse_program()
+            # streams add their own EOF
+            if not self.streaming:
+                eof_pos = (self.tokens[-1].end_position[0], self.tokens[-1].end_position[1] + 1)
+                self.tokens.append(Token("EOF", TokenType.EOF, eof_pos, eof_pos))
+                self.link(0)
+            self.program = self.parse_program()
 
     @property
     def curr_tok(self):
@@ -113,10 +197,7 @@ class Parser:
     @property
     def peek_tok(self):
         # Skip comments
-        pos = self.pos
-        while self.is_comment(self.tokens[pos+1]):
-            pos += 1
-        return self.tokens[pos + 1]
+        return self.tokens[self.next_code[self.pos]]
 
     @property
     def true_peek_tok(self):
@@ -131,16 +212,58 @@ class Parser:
             if self.curr_tok.token == TokenType.EOF:
                 return
 
+            peek = self.next_code[self.pos]
             # Skip comments
-            while skip_comments and self.is_comment(self.tokens[self.pos+1]):
-                self.pos += 1
-            if self.peek_tok.token == TokenType.EOF:
+            if skip_comments:
+                self.pos = peek - 1
+            if self.tokens[peek].token == TokenType.EOF:
                 self.pos += 1
                 return
 
             self.pos += 1
+            if self.streaming and self.pos + 1 >= len(self.tokens):
+                self.fill()
 
-    def register_init(self):
+    def fill(self):
+        '''
+        pulls the next tokens of the stream. the last token pulled is never a comment,
+        so peeking past comments stays in the pulled tokens. adds the EOF token once the stream is exhausted
+        '''
+        tokens = self.tokens
+        if tokens and tokens[-1].token == TokenType.EOF:
+            return
+        count = len(tokens)
+        tokens.extend(islice(self.stream, STREAM_LOOKAHEAD))
+        exhausted = len(tokens) - count < STREAM_LOOKAHEAD
+        while not exhausted and self.is_comment(tokens[-1]):
+            token = next(self.stream, None)
+            if token is None:
+                exhausted = True
+            else:
+                tokens.append(token)
+        if exhausted and tokens:
+            eof_pos = (tokens[-1].end_position[0], tokens[-1].end_position[1] + 1)
+            tokens.append(Token("EOF", TokenType.EOF, eof_pos, eof_pos))
+        # the last token before was not a comment, so only it and the new tokens have new links
+        self.link(max(count - 1, 0))
+
+    def link(self, start: int):
+        '''
+        links every token from start on to the next token that is not a comment,
+        so that peeking past comments is one lookup. the last token is linked past the end
+        '''
+        tokens = self.tokens
+        links = array('q', bytes(8 * (len(tokens) - start)))
+        next_code = len(tokens)
+        for i in range(len(tokens) - 1, start - 1, -1):
+            links[i - start] = next_code
+            if tokens[i].token not in COMMENTS:
+                next_code = i
+        del self.next_code[start:]
+        self.next_code.extend(links)
+
+    @classmethod
+    def register_init(cls):
         '''
         Register token types to parsing functions here
         - prefix parsing functions are used to parse expressions that come after a
@@ -158,125 +281,163 @@ class Parser:
             postfix operator.
 
         - in block parsing functions are used to parse tokens inside a block statement
+
+        the functions are looked up on the class, so subclasses can override them.
+        tables are indexed by token kind, so that dispatching a token is one lookup
         '''
+        # to associate parsing functions to token kinds
+        cls.prefix_parse_fns, cls.prefix_special_parse_fns, cls.infix_parse_fns, cls.infix_special_parse_fns, \
+            cls.postfix_parse_fns, cls.in_block_parse_fns = ([None] * (KIND_COUNT + 1) for _ in range(6))
+        # to keep track of expected tokens
+        cls.expected_prefix, cls.expected_prefix_special, cls.expected_infix, cls.expected_infix_special, \
+            cls.expected_postfix, cls.expected_in_block = ([] for _ in range(6))
+
         # prefixes to possible expressions
-        self.register_prefix(TokenType.DASH, self.parse_prefix_expression)
-        self.register_prefix(TokenType.OPEN_PAREN, self.parse_grouped_expressions)
+        cls.register_prefix(TokenType.DASH, cls.parse_prefix_expression)
+        cls.register_prefix(TokenType.OPEN_PAREN, cls.parse_grouped_expressions)
 
-        self.register_prefix_special(TokenType.OPEN_PAREN, self.parse_grouped_expressions)
-        self.register_prefix_special(TokenType.OPEN_BRACE, self.parse_array)
-        self.register_prefix_special(TokenType.STRING_PART_START, self.parse_gen_string)
+        cls.register_prefix_special(TokenType.OPEN_PAREN, cls.parse_grouped_expressions)
+        cls.register_prefix_special(TokenType.OPEN_BRACE, cls.parse_array)
+        cls.register_prefix_special(TokenType.STRING_PART_START, cls.parse_gen_string)
 
         # literals (just returns curr_tok)
-        self.register_prefix("IDENTIFIER", self.parse_ident)
-        self.register_prefix(TokenType.INT_LITERAL, self.parse_literal)
-        self.register_prefix(TokenType.FLOAT_LITERAL, self.parse_literal)
-        self.register_prefix(TokenType.FAX, self.parse_literal)
-        self.register_prefix(TokenType.CAP, self.parse_literal)
-
-        self.register_prefix_special("IDENTIFIER", self.parse_ident)
-        self.register_prefix_special(TokenType.INT_LITERAL, self.parse_literal)
-        self.register_prefix_special(TokenType.STRING_LITERAL, self.parse_gen_string)
-        self.register_prefix_special(TokenType.FLOAT_LITERAL, self.parse_literal)
-        self.register_prefix_special(TokenType.FAX, self.parse_literal)
-        self.register_prefix_special(TokenType.CAP, self.parse_literal)
-        self.register_prefix_special(TokenType.NUWW, self.parse_literal)
-        self.register_prefix_special(TokenType.INPWT, self.parse_gen_string)
+        cls.register_prefix("IDENTIFIER", cls.parse_ident)
+        cls.register_prefix(TokenType.INT_LITERAL, cls.parse_literal)
+        cls.register_prefix(TokenType.FLOAT_LITERAL, cls.parse_literal)
+        cls.register_prefix(TokenType.FAX, cls.parse_literal)
+        cls.register_prefix(TokenType.CAP, cls.parse_literal)
+
+        cls.register_prefix_special("IDENTIFIER", cls.parse_ident)
+        cls.register_prefix_special(TokenType.INT_LITERAL, cls.parse_literal)
+        cls.register_prefix_special(TokenType.STRING_LITERAL, cls.parse_gen_string)
+        cls.register_prefix_special(TokenType.FLOAT_LITERAL, cls.parse_literal)
+        cls.register_prefix_special(TokenType.FAX, cls.parse_literal)
+        cls.register_prefix_special(TokenType.CAP, cls.parse_literal)
+        cls.register_prefix_special(TokenType.NUWW, cls.parse_literal)
+        cls.register_prefix_special(TokenType.INPWT, cls.parse_gen_string)
 
         # infixes
-        self.register_infix(TokenType.EQUALITY_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix(TokenType.INEQUALITY_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix(TokenType.AND_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix(TokenType.OR_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix(TokenType.LESS_THAN_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.LESS_THAN_OR_EQUAL_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.GREATER_THAN_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.GREATER_THAN_OR_EQUAL_SIGN, self.parse_infix_expression)
-
-        self.register_infix_special(TokenType.EQUALITY_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix_special(TokenType.INEQUALITY_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix_special(TokenType.AND_OPERATOR, self.parse_infix_special_expression)
-        self.register_infix_special(TokenType.OR_OPERATOR, self.parse_infix_special_expression)
-
-        # self.register_infix(TokenType.CONCATENATION_OPERATOR, self.parse_infix_expression)
-        self.register_infix(TokenType.ADDITION_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.DASH, self.parse_infix_expression)
-        self.register_infix(TokenType.MULTIPLICATION_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.DIVISION_SIGN, self.parse_infix_expression)
-        self.register_infix(TokenType.MODULO_SIGN, self.parse_infix_expression)
+        cls.register_infix(TokenType.EQUALITY_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix(TokenType.INEQUALITY_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix(TokenType.AND_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix(TokenType.OR_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix(TokenType.LESS_THAN_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.LESS_THAN_OR_EQUAL_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.GREATER_THAN_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.GREATER_THAN_OR_EQUAL_SIGN, cls.parse_infix_expression)
+
+        cls.register_infix_special(TokenType.EQUALITY_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix_special(TokenType.INEQUALITY_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix_special(TokenType.AND_OPERATOR, cls.parse_infix_special_expression)
+        cls.register_infix_special(TokenType.OR_OPERATOR, cls.parse_infix_special_expression)
+
+        # cls.register_infix(TokenType.CONCATENATION_OPERATOR, cls.parse_infix_expression)
+        cls.register_infix(TokenType.ADDITION_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.DASH, cls.parse_infix_expression)
+        cls.register_infix(TokenType.MULTIPLICATION_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.DIVISION_SIGN, cls.parse_infix_expression)
+        cls.register_infix(TokenType.MODULO_SIGN, cls.parse_infix_expression)
 
         # postfixes
-        self.register_postfix("IDENTIFIER", self.parse_postfix_expression)
-        self.register_postfix(TokenType.INT_LITERAL, self.parse_postfix_expression)
-        self.register_postfix(TokenType.FLOAT_LITERAL, self.parse_postfix_expression)
-        self.register_postfix(TokenType.CLOSE_PAREN, self.parse_postfix_expression)
-        # self.register_postfix(TokenType.CLOSE_BRACKET, self.parse_postfix_expression)
+        cls.register_postfix("IDENTIFIER", cls.parse_postfix_expression)
+        cls.register_postfix(TokenType.INT_LITERAL, cls.parse_postfix_expression)
+        cls.register_postfix(TokenType.FLOAT_LITERAL, cls.parse_postfix_expression)
+        cls.register_postfix(TokenType.CLOSE_PAREN, cls.parse_postfix_expression)
+        # cls.register_postfix(TokenType.CLOSE_BRACKET, cls.parse_postfix_expression)
 
         # in blocks
-        self.register_in_block("IDENTIFIER", self.parse_ident_statement)
-        self.register_in_block(TokenType.IWF, self.parse_if_statement)
-        self.register_in_block(TokenType.WETUWN, self.parse_return_statement)
-        self.register_in_block(TokenType.WHIWE, self.parse_while_statement)
-        self.register_in_block(TokenType.DO_WHIWE, self.parse_while_statement)
-        self.register_in_block(TokenType.FOW, self.parse_for_statement)
-        self.register_in_block(TokenType.PWINT, self.parse_print)
-        self.register_in_block(TokenType.BWEAK, self.parse_break)
-        self.register_in_block(TokenType.INPWT, self.parse_input_stmt)
-        self.register_in_block(TokenType.SINGLE_LINE_COMMENT, self.parse_comment)
-        self.register_in_block(TokenType.MULTI_LINE_COMMENT, self.parse_comment)
+        cls.register_in_block("IDENTIFIER", cls.parse_ident_statement)
+        cls.register_in_block(TokenType.IWF, cls.parse_if_statement)
+        cls.register_in_block(TokenType.WETUWN, cls.parse_return_statement)
+        cls.register_in_block(TokenType.WHIWE, cls.parse_while_statement)
+        cls.register_in_block(TokenType.DO_WHIWE, cls.parse_while_statement)
+        cls.register_in_block(TokenType.FOW, cls.parse_for_statement)
+        cls.register_in_block(TokenType.PWINT, cls.parse_print)
+        cls.register_in_block(TokenType.BWEAK, cls.parse_break)
+        cls.register_in_block(TokenType.INPWT, cls.parse_input_stmt)
+        cls.register_in_block(TokenType.SINGLE_LINE_COMMENT, cls.parse_comment)
+        cls.register_in_block(TokenType.MULTI_LINE_COMMENT, cls.parse_comment)
+
+        cls.expected_prefix_kinds = token_kinds(cls.expected_prefix)
 
     def parse_program(self) -> Program:
         '''
-        parse the entire program
+        parse the entire program.
+        every top level definition is kept in self.definitions along with its tokens and errors,
+        and is taken from self.reuse instead of parsed if the previous parse has it unchanged
         '''
         p = Program()
         while not self.curr_tok_is(TokenType.EOF):
-            match self.curr_tok.token:
-                case TokenType.FWUNC:
-                    if self.peek_tok_is(TokenType.MAINUWU):
-                        if p.mainuwu is not None:
-                            self.multiple_mainuwu_error(self.peek_tok)
-                            self.advance(2)
-                        else:
-                            if res := self.parse_function(main=True):
-                                p.mainuwu = res
-                                p.definition_order.append(res)
-                    else:
-                        if res := self.parse_function():
-                            p.functions.append(res)
-                            p.definition_order.append(res)
-                case TokenType.CWASS:
-                    if res := self.parse_class():
-                        p.classes.append(res)
-                        p.definition_order.append(res)
-                case TokenType.GWOBAW:
-                    gwobaw_pos = self.curr_tok.position
-                    if res := self.parse_declaration():
-                        res.is_global = True
-                        res.start_pos = gwobaw_pos
-                        self.advance(skip_comments=False)
-                        p.globals.append(res)
-
-                        # Group global declarations
-                        last_def = None if not p.definition_order else p.definition_order[-1]
-                        if isinstance(last_def, list):
-                            last_def.append(res)
-                        else:
-                            p.definition_order.append([res])
-
-                case TokenType.SINGLE_LINE_COMMENT | TokenType.MULTI_LINE_COMMENT:
-                    res = Comment(self.curr_tok)
-                    p.definition_order.append(res)
-                    self.advance(skip_comments=False)
-                case _:
-                    self.expected_error([TokenType.FWUNC, TokenType.CWASS, TokenType.GWOBAW], curr=True)
-                    self.advance()
+            if self.stop_at_first_error and self.errors:
+                return p
+            start, error_count = self.pos, len(self.errors)
+            # all that a definition depends on besides its tokens
+            state = (p.mainuwu is None, self.loop_level)
+            reused = self.reuse.take(self, state) if self.reuse is not None else None
+            kind, res = reused if reused is not None else self.parse_definition(p)
+            self.add_definition(p, kind, res)
+            self.definitions.append(Definition(start, self.pos, kind, res, self.errors[error_count:], state))
 
         if p.mainuwu is None:
             self.missing_mainuwu_error(self.curr_tok)
 
         return p
 
+    def parse_definition(self, p: Program) -> tuple[str | None, Production | Comment | None]:
+        'parse one top level definition, returns its kind and node (None if it has errors)'
+        match self.curr_tok.token:
+            case TokenType.FWUNC:
+                if self.peek_tok_is(TokenType.MAINUWU):
+                    if p.mainuwu is not None:
+                        self.multiple_mainuwu_error(self.peek_tok)
+                        self.advance(2)
+                        return 'mainuwu', None
+                    return 'mainuwu', self.parse_function(main=True)
+                return 'function', self.parse_function()
+            case TokenType.CWASS:
+                return 'class', self.parse_class()
+            case TokenType.GWOBAW:
+                gwobaw_pos = self.curr_tok.position
+                if res := self.parse_declaration():
+                    res.is_global = True
+                    res.start_pos = gwobaw_pos
+                    self.advance(skip_comments=False)
+                return 'global', res
+            case TokenType.SINGLE_LINE_COMMENT | TokenType.MULTI_LINE_COMMENT:
+                res = Comment(self.curr_tok)
+                self.advance(skip_comments=False)
+                return 'comment', res
+            case _:
+                self.expected_error([TokenType.FWUNC, TokenType.CWASS, TokenType.GWOBAW], curr=True)
+                self.advance()
+                return None, None
+
+    def add_definition(self, p: Program, kind: str | None, res: Production | Comment | None):
+        'adds a parsed top level definition to the program'
+        if not res:
+            return
+        match kind:
+            case 'mainuwu':
+                p.mainuwu = res
+                p.definition_order.append(res)
+            case 'function':
+                p.functions.append(res)
+                p.definition_order.append(res)
+            case 'class':
+                p.classes.append(res)
+                p.definition_order.append(res)
+            case 'global':
+                p.globals.append(res)
+
+                # Group global declarations
+                last_def = None if not p.definition_order else p.definition_order[-1]
+                if isinstance(last_def, list):
+                    last_def.append(res)
+                else:
+                    p.definition_order.append([res])
+            case 'comment':
+                p.definition_order.append(res)
+
     def parse_declaration(self, ident = None, for_loop_init = False) -> Declaration | None:
         '''
         parse declarations of variables/constants, whether global or local.
@@ -391,9 +552,9 @@ class Parser:
         before_terminator = self.curr_tok.position
         if not self.expect_peek(TokenType.TERMINATOR):
             added = self.error_context(d.value)
-            if not self.curr_tok_is_in(self.expected_prefix) or isinstance(d.value, Input):
-                added = self.expected_infix_special
-                if self.curr_tok_is_in([TokenType.STRING_LITERAL, TokenType.STRING_PART_END]) or isinstance(d.value, Input):
+            if not self.curr_tok_is_in(self.expected_prefix_kinds) or isinstance(d.value, Input):
+                added = list(self.expected_infix_special)
+                if self.curr_tok_is_in(STRING_END) or isinstance(d.value, Input):
                     added += [TokenType.CONCATENATION_OPERATOR]
             self.expected_error([TokenType.TERMINATOR, *added])
             self.advance(2)
@@ -530,7 +691,7 @@ class Parser:
             self.advance()
             return None
         self.advance()
-        stop_conditions = [TokenType.DOUBLE_CLOSE_BRACKET, TokenType.EOF]
+        stop_conditions = BLOCK_END
         while not self.curr_tok_is_in(stop_conditions):
             if self.curr_tok_is(TokenType.FWUNC):
                 if (res := self.parse_function()) is None:
@@ -550,7 +711,7 @@ class Parser:
                     c.definition_order.append([res])
 
                 self.advance(skip_comments=False)
-            elif self.curr_tok_is_in([TokenType.SINGLE_LINE_COMMENT, TokenType.MULTI_LINE_COMMENT]):
+            elif self.is_comment(self.curr_tok):
                 res = Comment(self.curr_tok)
                 c.definition_order.append(res)
                 self.advance(skip_comments=False)
@@ -754,15 +915,14 @@ class Parser:
 
         bs.start_pos = self.curr_tok.position
 
-        stop_condition = [TokenType.DOUBLE_CLOSE_BRACKET, TokenType.EOF]
-        while not self.peek_tok_is_in(stop_condition, peek_comments=True):
+        while not self.peek_tok_is_in(BLOCK_END, peek_comments=True):
             self.advance(skip_comments=False)
-            parser = self.get_in_block_parse_fn(self.curr_tok.token)
+            parser = self.in_block_parse_fns[self.curr_tok.token.kind]
             if parser is None:
                 self.no_in_block_parse_fn_error(self.curr_tok.token)
                 self.advance()
                 return None
-            if (statement := parser()) is None:
+            if (statement := parser(self)) is None:
                 return None
             bs.statements.append(statement)
 
@@ -862,9 +1022,9 @@ class Parser:
             added = self.error_context(a.value)
             if isinstance(a.value, ClassConstructor):
                 added = []
-            elif not self.curr_tok_is_in(self.expected_prefix) or isinstance(a.value, Input):
-                added = self.expected_infix_special
-                if self.curr_tok_is_in([TokenType.STRING_LITERAL, TokenType.STRING_PART_END]) or isinstance(a.value, Input):
+            elif not self.curr_tok_is_in(self.expected_prefix_kinds) or isinstance(a.value, Input):
+                added = list(self.expected_infix_special)
+                if self.curr_tok_is_in(STRING_END) or isinstance(a.value, Input):
                     added += [TokenType.CONCATENATION_OPERATOR]
             self.expected_error([TokenType.TERMINATOR, *added])
             self.advance(2)
@@ -1022,7 +1182,7 @@ class Parser:
             self.advance()
             return None
         self.advance()
-        stop_conditions = [TokenType.CLOSE_PAREN, TokenType.TERMINATOR, TokenType.EOF]
+        stop_conditions = ARGS_END
         while not self.curr_tok_is_in(stop_conditions):
             if self.curr_tok_is_class_name():
                 if (res := self.parse_class_ident()) is None:
@@ -1038,7 +1198,7 @@ class Parser:
 
         if not self.curr_tok_is(TokenType.CLOSE_PAREN):
             added = self.error_context(p.values)
-            self.expected_error([TokenType.CLOSE_PAREN, *added], curr=True if self.curr_tok_is_in([TokenType.TERMINATOR, TokenType.EOF]) else False)
+            self.expected_error([TokenType.CLOSE_PAREN, *added], curr=True if self.curr_tok_is_in(STATEMENT_END) else False)
             self.advance(2)
             return None
 
@@ -1050,7 +1210,7 @@ class Parser:
         return p
 
     def is_comment(self, token: Token):
-        return token.token in [TokenType.SINGLE_LINE_COMMENT, TokenType.MULTI_LINE_COMMENT]
+        return token.token in COMMENTS
 
     def parse_comment(self) -> Comment | None:
         return Comment(self.curr_tok)
@@ -1077,40 +1237,43 @@ class Parser:
             return None
 
         special = False
-        prefix = self.get_prefix_parse_fn(self.curr_tok.token)
+        kind = self.curr_tok.token.kind
+        prefix = self.prefix_parse_fns[kind]
         if prefix is None:
-            prefix = self.get_prefix_special_parse_fn(self.curr_tok.token)
+            prefix = self.prefix_special_parse_fns[kind]
             if prefix is None:
                 self.no_prefix_parse_fn_error(self.curr_tok.token, cwass=cwass, strfmt=strfmt, array=array, func=func)
                 self.advance()
                 return None
             special = True
-        if (left_exp := prefix()) is None:
+        if (left_exp := prefix(self)) is None:
             return None
 
-        postfix = self.get_postfix_parse_fn(self.curr_tok.token)
+        postfix = self.postfix_parse_fns[self.curr_tok.token.kind]
         if postfix is not None:
-            left_exp = postfix(left_exp)
+            left_exp = postfix(self, left_exp)
 
         operand_count = 1
-        while not self.peek_tok_is_in([TokenType.TERMINATOR, TokenType.EOF]) and precedence < self.peek_precedence():
+        while not self.peek_tok_is_in(STATEMENT_END) and precedence < self.peek_precedence():
             if not special or isinstance(left_exp, InfixExpression):
-                infix = self.get_infix_parse_fn(self.peek_tok.token)
-                expecteds = self.expected_infix+self.expected_infix_special
+                infix = self.infix_parse_fns[self.peek_tok.token.kind]
             else:
-                infix = self.get_infix_special_parse_fn(self.peek_tok.token)
-                expecteds = self.expected_infix_special
-            expecteds += [TokenType.STRING_PART_MID, TokenType.STRING_PART_END] if strfmt else []
-            expecteds += [TokenType.COMMA, TokenType.CLOSE_BRACE] if array else []
-            expecteds += [TokenType.COMMA, TokenType.CLOSE_PAREN] if func else []
+                infix = self.infix_special_parse_fns[self.peek_tok.token.kind]
             if infix is None:
+                if not special or isinstance(left_exp, InfixExpression):
+                    expecteds = self.expected_infix+self.expected_infix_special
+                else:
+                    expecteds = list(self.expected_infix_special)
+                expecteds += [TokenType.STRING_PART_MID, TokenType.STRING_PART_END] if strfmt else []
+                expecteds += [TokenType.COMMA, TokenType.CLOSE_BRACE] if array else []
+                expecteds += [TokenType.COMMA, TokenType.CLOSE_PAREN] if func else []
                 self.advance()
                 self.no_infix_parse_fn_error(self.curr_tok.token, left_exp, expecteds)
                 self.advance()
                 return None
 
             self.advance()
-            left_exp = infix(left_exp)
+            left_exp = infix(self, left_exp)
             operand_count += 1
 
         if grouped and operand_count < 2:
@@ -1119,9 +1282,9 @@ class Parser:
             self.advance(2)
             return None
 
-        postfix = self.get_postfix_parse_fn(self.curr_tok.token)
+        postfix = self.postfix_parse_fns[self.curr_tok.token.kind]
         if postfix is not None:
-            left_exp = postfix(left_exp)
+            left_exp = postfix(self, left_exp)
         
         return left_exp
     # PLEASE USE self.parse_expression(precedence)
@@ -1203,7 +1366,7 @@ class Parser:
         '''
         pe = PostfixExpression()
         pe.left = left
-        if not self.expect_peek_in([TokenType.INCREMENT_OPERATOR, TokenType.DECREMENT_OPERATOR]):
+        if not self.expect_peek_in(POSTFIX_OPERATORS):
             return left
         pe.op = self.curr_tok
         return pe
@@ -1248,7 +1411,7 @@ class Parser:
         start = self.curr_tok.position
         is_call = False
 
-        if not self.peek_tok_is_in([TokenType.OPEN_PAREN, TokenType.DOT_OP, TokenType.OPEN_BRACE]):
+        if not self.peek_tok_is_in(ACCESSORS):
             return ident
 
         if self.peek_tok_is(TokenType.OPEN_PAREN):
@@ -1259,7 +1422,7 @@ class Parser:
             fc.id = ident
             ident = fc
             self.advance(2)
-            stop_conditions = [TokenType.CLOSE_PAREN, TokenType.TERMINATOR, TokenType.EOF]
+            stop_conditions = ARGS_END
             cwass = False
             while not self.curr_tok_is_in(stop_conditions):
                 if self.curr_tok_is_class_name():
@@ -1285,7 +1448,7 @@ class Parser:
 
             if not self.curr_tok_is(TokenType.CLOSE_PAREN) or (cwass and self.curr_tok_is(TokenType.CLOSE_PAREN)):
                 added = self.error_context(ident.args) if not cwass else []
-                self.expected_error([TokenType.CLOSE_PAREN, TokenType.COMMA, *added], curr=True if self.curr_tok_is_in([TokenType.TERMINATOR, TokenType.EOF]) else False)
+                self.expected_error([TokenType.CLOSE_PAREN, TokenType.COMMA, *added], curr=True if self.curr_tok_is_in(STATEMENT_END) else False)
                 self.advance(2)
                 return None
 
@@ -1373,7 +1536,7 @@ class Parser:
             return None
 
         self.advance()
-        stop_conditions = [TokenType.CLOSE_PAREN, TokenType.TERMINATOR, TokenType.EOF]
+        stop_conditions = ARGS_END
         while not self.curr_tok_is_in(stop_conditions):
             if self.curr_tok_is_class_name():
                 if (res := self.parse_class_ident()) is None:
@@ -1392,7 +1555,7 @@ class Parser:
                 return None
             self.advance()
         if not self.curr_tok_is(TokenType.CLOSE_PAREN):
-            self.expected_error([TokenType.CLOSE_PAREN, *self.error_context(cc.args, cwass=True)], curr=True if self.curr_tok_is_in([TokenType.TERMINATOR, TokenType.EOF]) else False)
+            self.expected_error([TokenType.CLOSE_PAREN, *self.error_context(cc.args, cwass=True)], curr=True if self.curr_tok_is_in(STATEMENT_END) else False)
             return None
 
         cc.end_pos = self.curr_tok.position
@@ -1403,7 +1566,7 @@ class Parser:
         al.start_pos = self.curr_tok.position
         self.advance() # consume the opening brace
 
-        stop_conditions = [TokenType.CLOSE_BRACE, TokenType.TERMINATOR, TokenType.EOF]
+        stop_conditions = ARRAY_END
         cwass = False
         while not self.curr_tok_is_in(stop_conditions):
             if self.curr_tok_is_class_name():
@@ -1429,7 +1592,7 @@ class Parser:
 
         if not self.curr_tok_is(TokenType.CLOSE_BRACE):
             added = self.error_context(al.elements) if not cwass else []
-            self.expected_error([TokenType.CLOSE_BRACE, TokenType.COMMA, *added], curr=True if self.curr_tok_is_in([TokenType.TERMINATOR, TokenType.EOF]) else False)
+            self.expected_error([TokenType.CLOSE_BRACE, TokenType.COMMA, *added], curr=True if self.curr_tok_is_in(STATEMENT_END) else False)
             return None
 
         al.end_pos = self.curr_tok.position
@@ -1438,7 +1601,7 @@ class Parser:
         sf = StringFmt()
         sf.start = self.curr_tok
         # append middle parts if any
-        while not self.peek_tok_is_in([TokenType.STRING_PART_END, TokenType.TERMINATOR, TokenType.EOF]):
+        while not self.peek_tok_is_in(STRING_FMT_END):
             # no expression after string_mid
             if self.peek_tok_is(TokenType.STRING_PART_MID):
                 sf.exprs.append(Token("", TokenType.STRING_LITERAL, self.curr_tok.end_position, self.peek_tok.position))
@@ -1512,73 +1675,43 @@ class Parser:
 
     ### helper methods
     # registering prefix and infix functions to parse certain token types
-    def register_prefix(self, token_type: str | TokenType, fn: Callable):
-        self.prefix_parse_fns[token_type] = fn
-        self.expected_prefix.append(token_type)
-    def register_prefix_special(self, token_type: str | TokenType, fn: Callable):
-        self.prefix_special_parse_fns[token_type] = fn
-        self.expected_prefix_special.append(token_type)
-    def register_infix(self, token_type: str | TokenType, fn: Callable):
-        self.infix_parse_fns[token_type] = fn
-        self.expected_infix.append(token_type)
-    def register_infix_special(self, token_type: str | TokenType, fn: Callable):
-        self.infix_special_parse_fns[token_type] = fn
-        self.expected_infix_special.append(token_type)
-    def register_postfix(self, token_type: str | TokenType, fn: Callable):
-        self.postfix_parse_fns[token_type] = fn
-        self.expected_postfix.append(token_type)
-    def register_in_block(self, token_type: str | TokenType, fn: Callable):
-        self.in_block_parse_fns[token_type] = fn
-        self.expected_in_block.append(token_type)
-    # getting prefix and infix functions
+    @classmethod
+    def register_prefix(cls, token_type: str | TokenType, fn: Callable):
+        cls.prefix_parse_fns[token_kind(token_type)] = fn
+        cls.expected_prefix.append(token_type)
+    @classmethod
+    def register_prefix_special(cls, token_type: str | TokenType, fn: Callable):
+        cls.prefix_special_parse_fns[token_kind(token_type)] = fn
+        cls.expected_prefix_special.append(token_type)
+    @classmethod
+    def register_infix(cls, token_type: str | TokenType, fn: Callable):
+        cls.infix_parse_fns[token_kind(token_type)] = fn
+        cls.expected_infix.append(token_type)
+    @classmethod
+    def register_infix_special(cls, token_type: str | TokenType, fn: Callable):
+        cls.infix_special_parse_fns[token_kind(token_type)] = fn
+        cls.expected_infix_special.append(token_type)
+    @classmethod
+    def register_postfix(cls, token_type: str | TokenType, fn: Callable):
+        cls.postfix_parse_fns[token_kind(token_type)] = fn
+        cls.expected_postfix.append(token_type)
+    @classmethod
+    def register_in_block(cls, token_type: str | TokenType, fn: Callable):
+        cls.in_block_parse_fns[token_kind(token_type)] = fn
+        cls.expected_in_block.append(token_type)
+    # getting prefix and infix functions, which are unbound so they are called with the parser
     def get_prefix_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.prefix_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.prefix_parse_fns[token_kind(token_type)]
     def get_prefix_special_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.prefix_special_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.prefix_special_parse_fns[token_kind(token_type)]
     def get_infix_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.infix_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.infix_parse_fns[token_kind(token_type)]
     def get_infix_special_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.infix_special_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.infix_special_parse_fns[token_kind(token_type)]
     def get_postfix_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.postfix_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.postfix_parse_fns[token_kind(token_type)]
     def get_in_block_parse_fn(self, token_type: str | TokenType | UniqueTokenType) -> Callable | None:
-        if isinstance(token_type, UniqueTokenType):
-            token_type = "IDENTIFIER" if token_type.unique_type.startswith("IDENTIFIER") else "CWASS_ID"
-        try:
-            tmp = self.in_block_parse_fns[token_type]
-            return tmp
-        except KeyError:
-            return None
+        return self.in_block_parse_fns[token_kind(token_type)]
     # keeping track of tokens
     def curr_tok_is(self, token_type: TokenType) -> bool:
         return self.curr_tok.token == token_type
@@ -1649,31 +1782,30 @@ class Parser:
             return True
         else:
             return False
-    def curr_tok_is_in(self, token_types: list[TokenType]) -> bool:
-        'checks if the current token is in the list of token types.'
-        if "IDENTIFIER" in token_types and self.curr_tok_is_identifier() or (
-            "CWASS_ID" in token_types and self.curr_tok_is_class_name()):
-            return True
-        return self.curr_tok.token in token_types
-    def peek_tok_is_in(self, token_types: list[TokenType], peek_comments=False) -> bool:
-        'checks if the next token is in the list of token types.'
-        if "IDENTIFIER" in token_types and self.curr_tok_is_identifier() or (
-            "CWASS_ID" in token_types and self.curr_tok_is_class_name()):
+    def curr_tok_is_in(self, token_types: list[TokenType] | frozenset[int]) -> bool:
+        'checks if the current token is in the list of token types (or of token kinds).'
+        kinds = token_types if type(token_types) is frozenset else token_kinds(token_types)
+        return self.curr_tok.token.kind in kinds or self.curr_tok_is_in_names(kinds)
+    def curr_tok_is_in_names(self, kinds: frozenset[int]) -> bool:
+        'checks if the current token is an identifier or class name (by its unique type) when they are in kinds'
+        return IDENTIFIER_KIND in kinds and self.curr_tok_is_identifier() or (
+            CWASS_KIND in kinds and self.curr_tok_is_class_name())
+    def peek_tok_is_in(self, token_types: list[TokenType] | frozenset[int], peek_comments=False) -> bool:
+        'checks if the next token is in the list of token types (or of token kinds).'
+        kinds = token_types if type(token_types) is frozenset else token_kinds(token_types)
+        if (IDENTIFIER_KIND in kinds or CWASS_KIND in kinds) and self.curr_tok_is_in_names(kinds):
             return True
         if peek_comments:
-            return self.true_peek_tok.token in token_types
+            return self.true_peek_tok.token.kind in kinds
         else:
-            return self.peek_tok.token in token_types
+            return self.peek_tok.token.kind in kinds
     def expect_peek_in(self, token_types: list[TokenType]) -> bool:
         '''
         checks if the next token is in the list of token types.
         advances the cursor if it is.
         cursor won't advance if not.
         '''
-        if self.peek_tok_is_in(token_types) or (
-            "IDENTIFIER" in token_types and self.curr_tok_is_identifier() or (
-                "CWASS_ID" in token_types and self.curr_tok_is_class_name()
-            )):
+        if self.peek_tok_is_in(token_types):
             self.advance()
             return True
         else:
@@ -1681,16 +1813,10 @@ class Parser:
     # to keep track of precedence of tokens
     def curr_precedence(self):
         'returns the precedence of the current token'
-        if self.curr_tok.token in precedence_map:
-            return precedence_map[self.curr_tok.token]
-        else:
-            return LOWEST
+        return PRECEDENCES[self.curr_tok.token.kind]
     def peek_precedence(self):
         'returns the precedence of the next token'
-        if self.peek_tok.token in precedence_map:
-            return precedence_map[self.peek_tok.token]
-        else:
-            return LOWEST
+        return PRECEDENCES[self.peek_tok.token.kind]
 
     ### error methods
 
@@ -1742,7 +1868,7 @@ class Parser:
             expecteds += [TokenType.INCREMENT_OPERATOR, TokenType.DECREMENT_OPERATOR]
         if not expecteds:
             expecteds += self.expected_infix
-        if self.curr_tok_is_in([TokenType.STRING_LITERAL, TokenType.STRING_PART_END]) or isinstance(lhs, Input):
+        if self.curr_tok_is_in(STRING_END) or isinstance(lhs, Input):
             expecteds += [TokenType.CONCATENATION_OPERATOR]
 
         msg = f"'{token_type}' is not a valid operator for an expression"
@@ -1907,7 +2033,7 @@ class Parser:
     def unclosed_string_part_error(self, token: Token, exprs, added = False):
         msg = f"Expected any of the ff: "
         msg += "'STRING_PART_END',"
-        if not self.curr_tok_is_in(self.expected_prefix):
+        if not self.curr_tok_is_in(self.expected_prefix_kinds):
             if added:
                 added = []
                 for token in self.expected_infix_special:
@@ -1984,7 +2110,7 @@ class Parser:
     def error_context(self, tok, cwass=False) -> list[TokenType]:
         'error context for expression tokens'
         if isinstance(tok, list) and len(tok) == 0:
-            return self.expected_prefix
+            return list(self.expected_prefix)
         elif isinstance(tok, list) and len(tok) != 0:
             tok = tok[-1]
 
@@ -2022,3 +2148,5 @@ class Parser:
             if TokenType.OPEN_BRACKET in added: added.remove(TokenType.OPEN_BRACKET)
             if TokenType.OPEN_PAREN in added: added.remove(TokenType.OPEN_PAREN)
         return list(added)
+
+Parser.register_init()
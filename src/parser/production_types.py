@@ -1,9 +1,33 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 from src.lexer import Token
+from .emitter import Emitter
 
 ### BASE CLASS
 class Production(ABC): ... # to avoid undefined Production error in type hint
 class Production(ABC):
+    '''
+    nodes keep their fields in __slots__.
+    fields in lazy_defaults (eg. tokens and values that the parser sets anyway) are only made when first read
+    '''
+    __slots__ = ()
+    lazy_defaults: dict[str, Callable[[], object]] = {}
+
+    def __getattr__(self, name: str):
+        default = type(self).lazy_defaults.get(name)
+        if default is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = default()
+        setattr(self, name, value)
+        return value
+
+    def write_python(self, out: Emitter, indent = 0, cwass=False):
+        'writes python_string into out. nodes with blocks write their parts into out one by one instead'
+        out.write(self.python_string(indent, cwass=cwass))
+    def write_formatted(self, out: Emitter, indent=0):
+        'writes formatted_string into out, like write_python'
+        out.write(self.formatted_string(indent))
+
     @abstractmethod
     def string(self, indent = 0) -> str: ...
     @abstractmethod
@@ -17,6 +41,7 @@ class Production(ABC):
 
 class Statement(Production):
     'for productions that can be in blocks'
+    __slots__ = ()
     def string(self, indent = 0) -> str: ...
     def header(self) -> str: ...
     def child_nodes(self) -> None | dict[str, Production | Token]: ...
@@ -25,6 +50,7 @@ class Statement(Production):
 
 class Value(Production):
     'for productions that evaluate to a value'
+    __slots__ = ()
     start_pos = None
     end_pos = None
     def string(self, indent = 0) -> str: ...
@@ -36,6 +62,7 @@ class Value(Production):
 
 class ValueRequirements(Value):
     'interface for Value'
+    __slots__ = ()
     @abstractmethod
     def flat_string(self) -> str: ...
 class Expression(ValueRequirements):
@@ -43,6 +70,7 @@ class Expression(ValueRequirements):
     for values that have operands
     eg. id + id, id - id, fn_call() * id, id[1] / id
     '''
+    __slots__ = ()
     def string(self, indent = 0) -> str: ...
     def header(self) -> str: ...
     def child_nodes(self) -> None | dict[str, Production | Token]: ...
@@ -56,6 +84,7 @@ class Unit(ValueRequirements):
     eg. identifier, identifier[2], "string", ident.property
     fnCall(), "string | fmt | !"
     '''
+    __slots__ = ()
     def string(self, indent = 0) -> str: ...
     def header(self) -> str: ...
     def child_nodes(self) -> None | dict[str, Production | Token]: ...
@@ -68,6 +97,7 @@ class Iterable(ValueRequirements):
     for Units that can: contain other Productions, and/or be subsliced
     eg. arrays, string fmts, and string literals
     '''
+    __slots__ = ()
     def string(self, indent = 0) -> str: ...
     def header(self) -> str: ...
     def child_nodes(self) -> None | dict[str, Production | Token]: ...
@@ -80,6 +110,7 @@ class IdentifierProds(ValueRequirements):
     for Units that are identifiers
     eg. identifiers, identifier[2], fnCall(), ident.property
     '''
+    __slots__ = ()
     def string(self, indent = 0) -> str: ...
     def header(self) -> str: ...
     def child_nodes(self) -> None | dict[str, Production | Token]: ...
@@ -1,6 +1,9 @@
 import re
-from src.lexer.token import TokenType, UniqueTokenType, class_properties
+from contextlib import nullcontext
+from src.lexer.token import TokenType, UniqueTokenType
+from src.lexer.context import CompileContext, current_context
 from src.parser.production_types import *
+from src.parser.emitter import Emitter, emit
 from src.lexer import Token
 
 ### UTILS
@@ -13,10 +16,10 @@ def sprintln(*val, indent = 0):
 
 ### EXPRESSION PRODUCTIONS
 class PrefixExpression(Expression):
-    def __init__(self):
-        self.op: Token = Token()
-        self.right: Value = Value()
+    __slots__ = ('op', 'right', 'grouped')
+    lazy_defaults = {'op': Token, 'right': Value}
 
+    def __init__(self):
         self.grouped = False
 
     def header(self) -> str:
@@ -48,11 +51,10 @@ class PrefixExpression(Expression):
         return self.right.end_position if isinstance(self.right, Token) else self.right.end_pos
 
 class InfixExpression(Expression):
-    def __init__(self):
-        self.left: Value = Value()
-        self.op: Token = Token()
-        self.right: Value = Value()
+    __slots__ = ('left', 'op', 'right', '_start_pos', '_end_pos', 'grouped')
+    lazy_defaults = {'left': Value, 'op': Token, 'right': Value}
 
+    def __init__(self):
         self._start_pos = None
         self._end_pos = None
 
@@ -104,11 +106,10 @@ class InfixExpression(Expression):
         self._end_pos = value
 
 class PostfixExpression(Expression):
-    def __init__(self):
-        self.left: Value = Value()
-        self.op: Token = Token()
-
+    __slots__ = ('left', 'op', 'grouped')
+    lazy_defaults = {'left': Value, 'op': Token}
 
+    def __init__(self):
         self.grouped = False
 
     def header(self):
@@ -141,6 +142,8 @@ class PostfixExpression(Expression):
 
 ### LITERAL PRODUCTIONS
 class StringLiteral(Iterable):
+    __slots__ = ('val', 'concats', 'start_pos', 'end_pos')
+
     def __init__(self, val: Token):
         self.val: Token = val
         self.concats: list[StringFmt | Input | StringLiteral] = []
@@ -176,8 +179,10 @@ class StringLiteral(Iterable):
         return 1
 
 class Input(Iterable):
+    __slots__ = ('expr', 'concats', 'stmt', 'start_pos', 'end_pos')
+    lazy_defaults = {'expr': Value}
+
     def __init__(self):
-        self.expr: Value | Token = Value()
         self.concats: list[StringFmt | Input | StringLiteral] = []
         self.stmt: bool = False
 
@@ -214,11 +219,12 @@ class Input(Iterable):
         return 1
 
 class StringFmt(Iterable):
+    __slots__ = ('start', 'mid', 'exprs', 'end', 'concats', 'start_pos', 'end_pos')
+    lazy_defaults = {'start': Token, 'end': Token}
+
     def __init__(self):
-        self.start: Token = Token()
         self.mid: list[Token] = []
         self.exprs: list[Value | Token] = []
-        self.end: Token = Token()
         self.concats: list[StringFmt | Input | StringLiteral] = []
 
         self.start_pos = None
@@ -278,6 +284,8 @@ class StringFmt(Iterable):
         return 1
 
 class ArrayLiteral(Iterable):
+    __slots__ = ('elements', 'start_pos', 'end_pos')
+
     def __init__(self):
         self.elements: list[Value] = []
 
@@ -325,8 +333,10 @@ class ArrayLiteral(Iterable):
         return iter(self.elements)
 
 class FnCall(IdentifierProds):
+    __slots__ = ('id', 'args', 'need_self', 'start_pos', 'end_pos', 'is_statement')
+    lazy_defaults = {'id': Token}
+
     def __init__(self):
-        self.id: Token = Token()
         self.args: list[Value] = []
         self.need_self = False
 
@@ -361,8 +371,10 @@ class IndexedIdentifier(IdentifierProds):
     - token:             ident[i]
     - FnCall:            fn()[i]
     '''
+    __slots__ = ('id', 'index', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token}
+
     def __init__(self):
-        self.id: Token | FnCall = Token()
         self.index: list[Value] = []
 
         self.start_pos = None
@@ -393,8 +405,10 @@ class IndexedIdentifier(IdentifierProds):
         return res
 
 class ClassConstructor(IdentifierProds):
+    __slots__ = ('id', 'args', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token}
+
     def __init__(self):
-        self.id: Token = Token()
         self.args: list[Value] = []
 
         self.start_pos = None
@@ -430,10 +444,10 @@ class ClassAccessor(IdentifierProds):
     - indexed:       ident.property[index], Cwass.method()[index]
     - ClassAccessor: ident.property.property, Cwass.property.method()
     '''
-    def __init__(self):
-        self.id: Token | FnCall | IndexedIdentifier | ClassAccessor = Token()
-        self.accessed: Token | FnCall | IndexedIdentifier | ClassAccessor = Token()
+    __slots__ = ('id', 'accessed', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token, 'accessed': Token}
 
+    def __init__(self):
         self.start_pos = None
         self.end_pos = None
 
@@ -457,9 +471,10 @@ class ClassAccessor(IdentifierProds):
 
 ### BLOCK STATEMENT PRODUCTIONS
 class ReturnStatement(Statement):
-    def __init__(self):
-        self.expr: Value = Value()
+    __slots__ = ('expr', 'start_pos', 'end_pos')
+    lazy_defaults = {'expr': Value}
 
+    def __init__(self):
         self.start_pos = None
         self.end_pos = None
 
@@ -478,11 +493,10 @@ class ReturnStatement(Statement):
         return 1
 
 class Declaration(Statement):
+    __slots__ = ('id', 'dtype', 'value', 'dono_token', 'initialized', 'is_param', 'is_global', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token, 'dtype': Token, 'value': Value, 'dono_token': Token}
+
     def __init__(self):
-        self.id: Token = Token()
-        self.dtype: Token = Token() 
-        self.value: Value = Value()
-        self.dono_token: Token = Token()
         self.initialized: bool = False
         self.is_param: bool = False
         self.is_global: bool = False
@@ -508,8 +522,7 @@ class Declaration(Statement):
     def python_string(self, indent=0, cwass=False) -> str:
         res = ""
         if cwass:
-            global class_properties
-            if self.id.python_string(cwass=cwass) in class_properties:
+            if self.id.python_string(cwass=cwass) in current_context().class_properties:
                 res = "self."
         res += f"{self.id.python_string(cwass=cwass)}: {self.dtype.python_string(cwass=cwass)}"
         if self.is_param: return res
@@ -546,11 +559,10 @@ class Declaration(Statement):
         return res
 
 class Assignment(Statement):
-    def __init__(self):
-        self.id: Token | IndexedIdentifier | ClassAccessor = Token() 
-        self.value: Value = Value()
-        self.dtype: Token = Token()
+    __slots__ = ('id', 'value', 'dtype', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token, 'value': Value, 'dtype': Token}
 
+    def __init__(self):
         self.start_pos = None
         self.end_pos = None
 
@@ -570,8 +582,7 @@ class Assignment(Statement):
     def python_string(self, indent=0, cwass=False) -> str:
         res = ""
         if cwass:
-            global class_properties
-            if self.id.python_string(cwass=cwass) in class_properties:
+            if self.id.python_string(cwass=cwass) in current_context().class_properties:
                 res = "self."
         if not self.dtype.exists(): raise Exception(f"UNREACHABLE::no dtype for assignment: '{self.id.flat_string()}'")
         res += f"{self.id.python_string(cwass=cwass)}"
@@ -592,8 +603,10 @@ class Assignment(Statement):
         return 1
 
 class Print(Statement):
+    __slots__ = ('print', 'values', 'start_pos', 'end_pos')
+    lazy_defaults = {'print': Token}
+
     def __init__(self):
-        self.print: Token = Token()
         self.values: list[Value] = []
 
         self.start_pos = None
@@ -623,11 +636,11 @@ class Print(Statement):
         return sprint(res, indent=indent)
 
 class IfStatement(Statement):
+    __slots__ = ('condition', 'then', 'else_if', 'else_block', 'start_pos', 'end_pos')
+    lazy_defaults = {'condition': Value, 'then': lambda: BlockStatement(), 'else_block': lambda: BlockStatement()}
+
     def __init__(self):
-        self.condition: Value = Value()
-        self.then: BlockStatement = BlockStatement()
         self.else_if: list[ElseIfStatement] = []
-        self.else_block: BlockStatement = BlockStatement()
 
         self.start_pos = None
         self.end_pos = None
@@ -654,39 +667,41 @@ class IfStatement(Statement):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
-        res = sprintln(f"if {self.condition.python_string(cwass=cwass)}:", indent=0)
-        res += self.then.python_string(indent+1, cwass=cwass)
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
+        out.indent(indent)
+        out.write(sprintln(f"if {self.condition.python_string(cwass=cwass)}:", indent=0))
+        self.then.write_python(out, indent+1, cwass=cwass)
         for e in self.else_if:
-            res += e.python_string(indent, cwass=cwass)
+            e.write_python(out, indent, cwass=cwass)
         if self.else_block.statements:
-            res += sprintln("else:", indent=indent)
-            res += self.else_block.python_string(indent+1, cwass=cwass)
-        return sprint(res, indent=indent)
+            out.write(sprintln("else:", indent=indent))
+            self.else_block.write_python(out, indent+1, cwass=cwass)
 
     def formatted_string(self, indent=0) -> str:
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
         # iwf (condition) [[
-        res = sprintln(f"iwf ({self.condition.formatted_string()}) [[", indent=indent)
+        out.write(sprintln(f"iwf ({self.condition.formatted_string()}) [[", indent=indent))
 
         # then block
-        res += self.then.formatted_string(indent+1)
+        self.then.write_formatted(out, indent+1)
 
         # ]] ewse iwf (condition) [[
-        res += sprint("]]", indent=indent)
+        out.write(sprint("]]", indent=indent))
         for e in self.else_if:
-            res += e.formatted_string(indent=indent)
+            e.write_formatted(out, indent=indent)
         if self.else_block.statements:
-            res += sprintln(" ewse [[", indent=0)
-            res += self.else_block.formatted_string(indent=indent+1)
-            res += sprint("]]", indent=indent)
-
-        return res
+            out.write(sprintln(" ewse [[", indent=0))
+            self.else_block.write_formatted(out, indent=indent+1)
+            out.write(sprint("]]", indent=indent))
 
 
 class ElseIfStatement(Statement):
-    def __init__(self):
-        self.condition: Value = Value()
-        self.then: BlockStatement = BlockStatement()
+    __slots__ = ('condition', 'then', 'start_pos', 'end_pos')
+    lazy_defaults = {'condition': Value, 'then': lambda: BlockStatement()}
 
+    def __init__(self):
         self.start_pos = None
         self.end_pos = None
 
@@ -703,20 +718,24 @@ class ElseIfStatement(Statement):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
-        res = sprintln(f"elif {self.condition.python_string(cwass=cwass)}:", indent=0)
-        res += self.then.python_string(indent+1, cwass=cwass)
-        return sprint(res, indent=indent)
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
+        out.indent(indent)
+        out.write(sprintln(f"elif {self.condition.python_string(cwass=cwass)}:", indent=0))
+        self.then.write_python(out, indent+1, cwass=cwass)
 
     def formatted_string(self, indent=0) -> str:
-        res = sprintln(f" ewse iwf ({self.condition.formatted_string()}) [[", indent=0)
-        res += self.then.formatted_string(indent + 1)
-        res += sprint("]]", indent=indent)
-        return res
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
+        out.write(sprintln(f" ewse iwf ({self.condition.formatted_string()}) [[", indent=0))
+        self.then.write_formatted(out, indent + 1)
+        out.write(sprint("]]", indent=indent))
 
 class WhileLoop(Statement):
+    __slots__ = ('condition', 'body', 'is_do', 'start_pos', 'end_pos')
+    lazy_defaults = {'condition': Value, 'body': lambda: BlockStatement()}
+
     def __init__(self):
-        self.condition: Value = Value()
-        self.body: BlockStatement = BlockStatement()
         self.is_do = False
 
         self.start_pos = None
@@ -735,34 +754,31 @@ class WhileLoop(Statement):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
-        res = ""
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
         if self.is_do:
-            res = self.body.python_string(indent, cwass=cwass)
             # initial body of do while, remove breaks
-            res = re.sub(r"break", "...", res)
-        res += sprintln(f"while {self.condition.python_string(cwass=cwass)}:", indent=indent)
-        res += self.body.python_string(indent+1, cwass=cwass)
-        return res
+            out.write(re.sub(r"break", "...", emit(self.body.write_python, indent, cwass=cwass)))
+        out.write(sprintln(f"while {self.condition.python_string(cwass=cwass)}:", indent=indent))
+        self.body.write_python(out, indent+1, cwass=cwass)
 
     def formatted_string(self, indent=0) -> str:
-        res = ""
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
+        out.indent(indent)
 
         if self.is_do:
-            res += "do "
-
-        res += sprintln(f"whiwe({self.condition.formatted_string()}) [[", indent=0)
-        res += self.body.formatted_string(indent=indent+1)
-        res += sprint("]]", indent=indent)
+            out.write("do ")
 
-        return sprint(res, indent=indent)
+        out.write(sprintln(f"whiwe({self.condition.formatted_string()}) [[", indent=0))
+        self.body.write_formatted(out, indent=indent+1)
+        out.write(sprint("]]", indent=indent))
 
 class ForLoop(Statement):
-    def __init__(self):
-        self.init: Declaration = Declaration()
-        self.condition: Value = Value()
-        self.update: Value = Value()
-        self.body: BlockStatement = BlockStatement()
+    __slots__ = ('init', 'condition', 'update', 'body', 'start_pos', 'end_pos')
+    lazy_defaults = {'init': Declaration, 'condition': Value, 'update': Value, 'body': lambda: BlockStatement()}
 
+    def __init__(self):
         self.start_pos = None
         self.end_pos = None
 
@@ -781,26 +797,30 @@ class ForLoop(Statement):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
-        res = sprintln(self.init.python_string(indent=indent))
-        res += sprintln(f"while {self.condition.python_string(cwass=cwass)}:", indent=indent)
-        res += self.body.python_string(indent+1, cwass=cwass)
-        res += sprintln(f"{self.init.id.python_string(cwass=cwass)} = {self.update.python_string(cwass=cwass)}", indent=indent+1)
-        return res
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
+        out.write(sprintln(self.init.python_string(indent=indent)))
+        out.write(sprintln(f"while {self.condition.python_string(cwass=cwass)}:", indent=indent))
+        self.body.write_python(out, indent+1, cwass=cwass)
+        out.write(sprintln(f"{self.init.id.python_string(cwass=cwass)} = {self.update.python_string(cwass=cwass)}", indent=indent+1))
 
     def formatted_string(self, indent=0) -> str:
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
         init = self.init.formatted_string().replace(" ", "")
         condition = self.condition.formatted_string().replace(" ", "")
         update = self.update.formatted_string().replace(" ", "")
 
-        res = sprintln(f"fow({init} {condition}~ {update}) [[", indent=0)
-        res += self.body.formatted_string(indent=indent+1)
-        res += sprint("]]", indent=indent)
-
-        return sprint(res, indent=indent)
+        out.indent(indent)
+        out.write(sprintln(f"fow({init} {condition}~ {update}) [[", indent=0))
+        self.body.write_formatted(out, indent=indent+1)
+        out.write(sprint("]]", indent=indent))
 
 class Break(Statement):
+    __slots__ = ('token', 'in_loop', 'start_pos', 'end_pos')
+    lazy_defaults = {'token': Token}
+
     def __init__(self):
-        self.token: Token = Token()
         self.in_loop: bool = False
 
         self.start_pos = None
@@ -819,11 +839,11 @@ class Break(Statement):
         return sprint("bweak~", indent=indent)
 
 class Function(Production):
+    __slots__ = ('id', 'rtype', 'params', 'body', 'start_pos', 'end_pos')
+    lazy_defaults = {'id': Token, 'rtype': Token, 'body': lambda: BlockStatement()}
+
     def __init__(self):
-        self.id: Token = Token()
-        self.rtype: Token = Token()
         self.params: list[Declaration] = []
-        self.body: BlockStatement = BlockStatement()
 
         self.start_pos = None
         self.end_pos = None
@@ -851,40 +871,45 @@ class Function(Production):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
         params_string = [p.python_string(cwass=cwass) for p in self.params]
         if cwass:
             params_string.insert(0, "self")
-        res = sprintln(f"def {self.id.python_string(cwass=cwass)}({', '.join(params_string)}):", indent=0)
+        out.indent(indent)
+        out.write(sprintln(f"def {self.id.python_string(cwass=cwass)}({', '.join(params_string)}):", indent=0))
         for param in self.params:
             if param.dtype.is_unique_type():
-                res += sprintln(
+                out.write(sprintln(
                     f"{param.id.python_string(cwass=cwass)}: {param.dtype.python_string(cwass=cwass)} = {param.id.python_string(cwass=cwass)}",
-                    indent=indent + 1)
+                    indent=indent + 1))
             else:
-                res += sprintln(
+                out.write(sprintln(
                     f"{param.id.python_string(cwass=cwass)}: {param.dtype.python_string(cwass=cwass)} = {param.dtype.python_string(cwass=cwass)}({param.id.python_string(cwass=cwass)})",
-                    indent=indent + 1)
-        res += self.body.python_string(indent+1, cwass=cwass)
-        return sprintln(res, indent=indent)
+                    indent=indent + 1))
+        self.body.write_python(out, indent+1, cwass=cwass)
+        out.write("\n")
 
     def formatted_string(self, indent=0) -> str:
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
         params_string = [p.formatted_string() for p in self.params]
 
         # fwunc id-dtype(params, params) [[
         res = f"fwunc {self.id.formatted_string()}-{self.rtype.formatted_string()}({', '.join(params_string)}) [["
-        res = sprintln(res, indent=indent)
+        out.write(sprintln(res, indent=indent))
 
         # block statements
-        res += self.body.formatted_string(indent=indent+1)
+        self.body.write_formatted(out, indent=indent+1)
 
         # ]]
-        res += sprint("]]", indent=indent)
-
-        return res
+        out.write(sprint("]]", indent=indent))
 
 class Class(Production):
+    __slots__ = ('id', 'params', 'properties', 'methods', 'start_pos', 'end_pos', 'definition_order')
+    lazy_defaults = {'id': Token}
+
     def __init__(self):
-        self.id: Token = Token()
         self.params: list[Declaration] = []
         self.properties: list[Declaration] = []
         self.methods: list[Function] = []
@@ -924,53 +949,56 @@ class Class(Production):
         return res
 
     def python_string(self, indent=0, cwass=False) -> str:
-        global class_properties
-        res = sprintln(f"class {self.id.python_string(cwass=True)}:", indent=indent)
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
+        class_properties = current_context().class_properties
+        out.write(sprintln(f"class {self.id.python_string(cwass=True)}:", indent=indent))
         if self.params or self.properties:
-            res += sprint(f"def __init__(self", indent=indent+1)
+            out.write(sprint(f"def __init__(self", indent=indent+1))
             if self.params:
-                res += sprintln(f", {', '.join([p.python_string(cwass=cwass) for p in self.params])}):", indent=indent+1)
+                out.write(sprintln(f", {', '.join([p.python_string(cwass=cwass) for p in self.params])}):", indent=indent+1))
             else:
-                res += '):\n'
+                out.write('):\n')
             for param in self.params:
                 if param.dtype.is_unique_type():
-                    res += sprintln(
+                    out.write(sprintln(
                         f"self.{param.id.python_string(cwass=True)}: {param.dtype.python_string(cwass=True)} = {param.id.python_string(cwass=True)}",
-                        indent=indent + 2)
+                        indent=indent + 2))
                 else:
-                    res += sprintln(f"self.{param.id.python_string(cwass=True)}: {param.dtype.python_string(cwass=True)} = {param.dtype.python_string(cwass=True)}({param.id.python_string(cwass=True)})", indent=indent+2)
+                    out.write(sprintln(f"self.{param.id.python_string(cwass=True)}: {param.dtype.python_string(cwass=True)} = {param.dtype.python_string(cwass=True)}({param.id.python_string(cwass=True)})", indent=indent+2))
                 class_properties.add(param.id.python_string(cwass=True))
             for prop in self.properties:
-                res += sprintln(f"self.{prop.python_string(cwass=True)}", indent=indent+2)
+                out.write(sprintln(f"self.{prop.python_string(cwass=True)}", indent=indent+2))
                 class_properties.add(prop.id.python_string(cwass=True))
-        res += sprintln(f"def __repr__(self):", indent=indent+1)
-        res += sprintln(f'''return f"{{self.__class__.__name__[1:]}}({{', '.join(f'{{key[1:]}}={{value}}' for key, value in self.__dict__.items())}})"''', indent=indent+2)
-        res += sprintln(f"def __str__(self):", indent=indent+1)
-        res += sprintln(f'''return f"{{self.__class__.__name__[1:]}}({{', '.join(f'{{key[1:]}}={{value}}' for key, value in self.__dict__.items())}})"''', indent=indent+2)
+        out.write(sprintln(f"def __repr__(self):", indent=indent+1))
+        out.write(sprintln(f'''return f"{{self.__class__.__name__[1:]}}({{', '.join(f'{{key[1:]}}={{value}}' for key, value in self.__dict__.items())}})"''', indent=indent+2))
+        out.write(sprintln(f"def __str__(self):", indent=indent+1))
+        out.write(sprintln(f'''return f"{{self.__class__.__name__[1:]}}({{', '.join(f'{{key[1:]}}={{value}}' for key, value in self.__dict__.items())}})"''', indent=indent+2))
         for method in self.methods:
-            res += method.python_string(indent+1, cwass=True)
+            method.write_python(out, indent+1, cwass=True)
         class_properties.clear()
-        return res
 
     def formatted_string(self, indent=0) -> str:
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
         params = ', '.join([p.formatted_string() for p in self.params])
-        res = sprintln(f"cwass {self.id.formatted_string()}({params}) [[")
+        out.write(sprintln(f"cwass {self.id.formatted_string()}({params}) [["))
 
-        definitions = []
-        for definition in self.definition_order:
+        for i, definition in enumerate(self.definition_order):
+            if i > 0:
+                out.write("\n\n")
             if isinstance(definition, list):
                 attrib_group = [att.formatted_string(indent=indent+1) for att in definition]
-                definitions.append('\n'.join(attrib_group))
+                out.write('\n'.join(attrib_group))
             else:
-                definitions.append(definition.formatted_string(indent=indent+1))
+                definition.write_formatted(out, indent=indent+1)
 
-        res += "\n\n".join(definitions)
-        res += "\n]]"
-
-        return res
+        out.write("\n]]")
 
 
 class BlockStatement(Production):
+    __slots__ = ('statements', 'start_pos', 'end_pos')
+
     def __init__(self):
         self.statements: list[Statement] = []
 
@@ -991,19 +1019,23 @@ class BlockStatement(Production):
             res += s.string(indent+1)
         return res
     def python_string(self, indent=0, cwass=False) -> str:
-        res = ""
+        return emit(self.write_python, indent, cwass=cwass)
+    def write_python(self, out: Emitter, indent=0, cwass=False):
         for s in self.statements:
-            res += s.python_string(indent, cwass=cwass) + '\n'
-        return res
+            s.write_python(out, indent, cwass=cwass)
+            out.write('\n')
 
     def formatted_string(self, indent=0) -> str:
-        res = ""
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
         for s in self.statements:
-            res += s.formatted_string(indent=indent) + '\n'
-        return res
+            s.write_formatted(out, indent=indent)
+            out.write('\n')
 
 class Comment:
     'only used in formatting'
+    __slots__ = ('comment', 'start_pos', 'end_pos')
+
     def __init__(self, token):
         self.comment: Token = token
 
@@ -1016,8 +1048,15 @@ class Comment:
     def formatted_string(self, indent=0) -> str:
         return sprint(f"{str(self.comment)}", indent=indent)
 
+    def write_python(self, out: Emitter, indent=0, cwass=False):
+        pass
+    def write_formatted(self, out: Emitter, indent=0):
+        out.write(self.formatted_string(indent))
+
 class Program:
     'the root node of the syntax tree'
+    __slots__ = ('mainuwu', 'globals', 'functions', 'classes', 'start_pos', 'end_pos', 'definition_order')
+
     def __init__(self):
         self.mainuwu: Function | None = None
         self.globals: list[Declaration] = []
@@ -1055,36 +1094,44 @@ class Program:
             res += c.string(indent)
         return res + "\n"
 
-    def python_string(self, indent=0, cwass=False) -> str:
-        res = ""
+    def python_string(self, indent=0, cwass=False, clear_screen=True, context: CompileContext = None) -> str:
+        '''
+        clear_screen is turned off for programs that do not run in their own terminal.
+        the state of code generation is kept in context, the current one by default
+        '''
+        with context.activate() if context is not None else nullcontext():
+            return emit(self.write_python, indent, cwass=cwass, clear_screen=clear_screen)
+
+    def write_python(self, out: Emitter, indent=0, cwass=False, clear_screen=True):
         if self.mainuwu:
-            res += self.mainuwu.python_string(indent, cwass=cwass)
+            self.mainuwu.write_python(out, indent, cwass=cwass)
         for c in self.classes:
-            res += c.python_string(indent, cwass=cwass)
+            c.write_python(out, indent, cwass=cwass)
         for fn in self.functions:
-            res += fn.python_string(indent, cwass=cwass)
-        res += sprintln("if __name__ == '__main__':", indent=indent)
-        res += sprintln("# clear screen before executing", indent=indent+1)
-        res += sprintln("import platform", indent=indent+1)
-        res += sprintln("import os", indent=indent+1)
-        res += sprintln("os.system('cls' if platform.system() == 'Windows' else 'clear')", indent=indent+1)
-        res += sprintln()
-        res += sprintln("# declare globals", indent=indent+1)
+            fn.write_python(out, indent, cwass=cwass)
+        out.write(sprintln("if __name__ == '__main__':", indent=indent))
+        if clear_screen:
+            out.write(sprintln("# clear screen before executing", indent=indent+1))
+            out.write(sprintln("import platform", indent=indent+1))
+            out.write(sprintln("import os", indent=indent+1))
+            out.write(sprintln("os.system('cls' if platform.system() == 'Windows' else 'clear')", indent=indent+1))
+            out.write(sprintln())
+        out.write(sprintln("# declare globals", indent=indent+1))
         for g in self.globals:
-            res += sprintln(g.python_string(cwass=cwass), indent=indent+1)
-        res += sprintln("main()", indent=indent+1)
-        return res
+            out.write(sprintln(g.python_string(cwass=cwass), indent=indent+1))
+        out.write(sprintln("main()", indent=indent+1))
 
     def formatted_string(self, indent=0) -> str:
-        definitions = []
-        for definition in self.definition_order:
+        return emit(self.write_formatted, indent)
+    def write_formatted(self, out: Emitter, indent=0):
+        for i, definition in enumerate(self.definition_order):
+            if i > 0:
+                out.write("\n\n")
             if isinstance(definition, list):
                 global_dec_group = [dec.formatted_string() for dec in definition]
-                definitions.append('\n'.join(global_dec_group))
+                out.write('\n'.join(global_dec_group))
             else:
-                definitions.append(definition.formatted_string())
-
-        return "\n\n".join(definitions)
+                definition.write_formatted(out)
 
     def __str__(self):
         res = "MAINUWU:\n"
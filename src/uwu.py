@@ -161,8 +161,13 @@ class UwU(CTk):
         
         self.on_compile_and_run(code_editor=self.code_panel.code_view.editor)
 
+    def on_quick_run_done(self, code_editor: CodeEditor):
+        'called on the tk thread when a quick run finishes or is stopped'
+        compiler_status.is_compiling = False
+        self.code_panel.update_compiler_logs(editor=code_editor, is_compiling=False)
+
     def on_compile_and_run(self, code_editor: CodeEditor, mode='normal'):
-        if compiler_status.is_compiling and mode == 'normal':
+        if compiler_status.is_compiling:
             messagebox.showerror('COMPILATION ERROR', 'A compilation task is in progress, cannot run another process.')
             return
 
@@ -189,9 +194,9 @@ class UwU(CTk):
             self.code_panel.update_error_logs(errors=[])
             if mode == 'quick':
                 # Quick mode execution
-                code_editor.quick_run()
-                compiler_status.is_compiling = False
-                self.code_panel.update_compiler_logs(editor=code_editor, is_compiling=False)
+                self.code_panel.console_view.set('Console')
+                code_editor.quick_run(console=self.code_panel.console_view.program_console,
+                                      on_done=lambda _: self.after(0, self.on_quick_run_done, code_editor))
             else:
                 # Default compiling mode execution
                 code_editor.start(editor=code_editor, compiler_status=compiler_status, update_logs_callback=self.code_panel.update_compiler_logs)
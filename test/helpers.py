@@ -0,0 +1,9 @@
+'fixtures shared by the lexer tests'
+
+def token_fields(tokens) -> list[tuple]:
+    'what two lexes of the same source should agree on, per token'
+    return [(t.lexeme, str(t.token), t.token.unique_type, t.position, t.end_position) for t in tokens]
+
+def lex_fields(lexer) -> tuple[list[tuple], list[str], list[bool]]:
+    'the tokens, errors and line states of a lex'
+    return token_fields(lexer.tokens), [str(e) for e in lexer.errors], lexer.line_states
@@ -0,0 +1,64 @@
+import pytest
+
+from src.compiler.executor import runtime_namespace
+
+runtime = runtime_namespace()
+Int, Float, Bool, String, Array = runtime['Int'], runtime['Float'], runtime['Bool'], runtime['String'], runtime['Array']
+
+def ints(*vals):
+    return Array([Int(val) for val in vals])
+
+class TestArray:
+    @pytest.mark.parametrize('array, typecode', [
+        (lambda: ints(1, 2, 3), 'q'),
+        (lambda: Array([Float(1.5), Float(-2.0)]), 'd'),
+        (lambda: Array([Bool(True), Bool(False)]), 'b'),
+    ])
+    def test_homogeneous_arrays_are_typed(self, array, typecode):
+        assert array().typed().buffer.typecode == typecode
+
+    @pytest.mark.parametrize('array', [
+        lambda: Array([]),
+        lambda: Array([Int(1), Float(1.0)]),
+        lambda: Array([Float(1.0), Float(String('nan'))]),
+        lambda: Array([String('a'), String('b')]),
+        lambda: Array([ints(1), ints(2)]),
+    ])
+    def test_other_arrays_are_lists(self, array):
+        assert array().typed() is None
+
+    def test_bulk_operations_stay_typed(self):
+        a = ints(1, 2, 3, 2)
+        assert (a._has(Int(2)).val, a._count(Int(2)).val, a._index(Int(3)).val, a._index(Int(9)).val) == (True, 2, 2, -1)
+        a._replace(Int(2), Int(7))
+        a._reverse()
+        a._append(Int(4))
+        a._extend(ints(5))
+        assert str(a) == '{7, 3, 7, 1, 4, 5}'
+        assert (a == ints(7, 3, 7, 1, 4, 5)).val
+        assert a.typed() is not None
+
+    def test_elements_are_boxed_when_read(self):
+        a = Array([Float(1.5), Float(2.0)])
+        assert [(type(x).__name__, x.val) for x in a] == [('Float', 1.5), ('Float', 2.0)]
+        assert (type(a[-1]).__name__, a[-1].val) == ('Float', 2.0)
+        assert str(Array([Bool(True), Bool(False)])) == '{fax, cap}'
+
+    def test_other_elements_make_a_list(self):
+        a = ints(1, 2)
+        b = Array(a)
+        a._append(Float(2.5))
+        assert a.typed() is None
+        # arrays made from the same array still share their elements
+        b[0] = Int(9)
+        assert str(a) == '{9, 2, 2.5}' and str(b) == str(a)
+
+    def test_index_errors(self):
+        a = ints(1)
+        with pytest.raises(IndexError, match='list index out of range'):
+            a[1]
+        with pytest.raises(IndexError, match='list assignment index out of range'):
+            a[1] = Int(2)
+        a._clear()
+        with pytest.raises(Exception, match='pop from an empty array'):
+            a._pop()
@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+
+from constants.path import ROOT
+from src.batch import check_file, check_files, expand, summarize
+from src.lexer import TokenCache
+
+VALID = 'fwunc mainuwu-san() [[\n    a-chan = 1~\n    pwint(a)~\n]]\n'
+UNDEFINED = 'fwunc mainuwu-san() [[\n    pwint(b)~\n]]\n'
+UNDELIMITED = 'fwunc mainuwu-san() [[\n    a-chan = 1a~\n]]\n'
+
+def write_files(tmp_path) -> list[str]:
+    (tmp_path / 'nested').mkdir()
+    files = {'valid.uwu': VALID, 'nested/undefined.uwu': UNDEFINED, 'undelimited.uwu': UNDELIMITED}
+    for name, source in files.items():
+        (tmp_path / name).write_text(source)
+    (tmp_path / 'notes.txt').write_text('not uwu')
+    return sorted(str(tmp_path / name) for name in files)
+
+class TestBatch:
+    def test_expand_directories_and_globs(self, tmp_path):
+        paths = write_files(tmp_path)
+        assert expand([str(tmp_path)]) == paths
+        assert expand([str(tmp_path / '*.uwu'), str(tmp_path / '*.uwu')]) == [p for p in paths if 'nested' not in p]
+
+    def test_check_file_stops_at_first_failing_stage(self, tmp_path):
+        valid, undefined, undelimited = (tmp_path / name for name in ['valid.uwu', 'undefined.uwu', 'undelimited.uwu'])
+        for path, source in [(valid, VALID), (undefined, UNDEFINED), (undelimited, UNDELIMITED)]:
+            path.write_text(source)
+
+        result = check_file(str(valid))
+        assert result['ok'] and result['stage'] is None and result['errors'] == []
+
+        result = check_file(str(undefined))
+        assert not result['ok'] and result['stage'] == 'analyzer'
+        assert [(e['type'], e['line']) for e in result['errors']] == [('UndefinedError', 2)]
+
+        result = check_file(str(undelimited))
+        assert result['stage'] == 'lexer'
+        assert all(e['stage'] == 'lexer' and '\x1b' not in e['message'] for e in result['errors'])
+
+    def test_missing_file(self, tmp_path):
+        result = check_file(str(tmp_path / 'missing.uwu'))
+        assert not result['ok'] and result['errors'][0]['stage'] == 'read'
+
+    def test_pool_matches_serial(self, tmp_path):
+        paths = write_files(tmp_path)
+        strip = lambda results: [{k: v for k, v in r.items() if k != 'seconds'} for r in results]
+        assert strip(check_files(paths, jobs=2)) == strip(check_files(paths, jobs=1))
+        assert summarize(check_files(paths, jobs=1), 2.0)['files_per_second'] == 1.5
+
+    def test_token_cache_matches_lexing(self, tmp_path):
+        paths = write_files(tmp_path)
+        cache = TokenCache(tmp_path / 'cache')
+        strip = lambda results: [{k: v for k, v in r.items() if k != 'seconds'} for r in results]
+        expected = strip(check_files(paths, jobs=1))
+        assert strip(check_files(paths, jobs=2, cache=cache)) == expected
+        assert len(cache.entries()) == len(paths)
+        assert strip(check_files(paths, jobs=1, cache=cache)) == expected
+
+    def test_cli_prints_json(self, tmp_path):
+        write_files(tmp_path)
+        result = subprocess.run([sys.executable, '-m', 'src.batch', '-j', '1', '--no-cache', str(tmp_path)],
+                                cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 1
+        output = json.loads(result.stdout)
+        assert output['summary']['passed'] == 1 and output['summary']['failed'] == 2
+        assert 'files/sec' in result.stderr
@@ -0,0 +1,97 @@
+import os
+import shutil
+from pathlib import Path
+
+from src.compiler import BuildCache, Compiler
+from src.compiler import compiler as compiler_module
+
+def write(path: Path, size: int) -> Path:
+    path.write_bytes(b'x' * size)
+    return path
+
+class TestBuildCache:
+    def test_key_depends_on_source(self, tmp_path):
+        cache = BuildCache(tmp_path)
+        assert cache.key('pwint(1)') == cache.key('pwint(1)')
+        assert cache.key('pwint(1)') != cache.key('pwint(2)')
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = BuildCache(tmp_path / 'cache')
+        destination = tmp_path / 'dist' / 'aqua.exe'
+        assert not cache.get('aqua', destination)
+        cache.put('aqua', write(tmp_path / 'built.exe', 10))
+        assert cache.get('aqua', destination)
+        assert destination.read_bytes() == b'x' * 10
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = BuildCache(tmp_path / 'cache', max_size=25)
+        for i, key in enumerate(['a', 'b']):
+            cache.put(key, write(tmp_path / f'{key}.exe', 10))
+            os.utime(tmp_path / 'cache' / key, (i, i))
+        # a was used after b, so b goes first
+        assert cache.get('a', tmp_path / 'out.exe')
+        cache.put('c', write(tmp_path / 'c.exe', 10))
+        assert [entry.name for entry, _ in cache.entries()] == ['a', 'c']
+
+    def test_keeps_newest_entry_over_max_size(self, tmp_path):
+        cache = BuildCache(tmp_path / 'cache', max_size=5)
+        cache.put('a', write(tmp_path / 'a.exe', 10))
+        assert [entry.name for entry, _ in cache.entries()] == ['a']
+
+    def test_partial_entries_are_per_process(self, tmp_path):
+        cache = BuildCache(tmp_path / 'cache')
+        # another process halfway through putting the same entry
+        other = tmp_path / 'cache' / 'a.partial.0'
+        other.mkdir(parents=True)
+        write(other / 'a.exe', 5)
+        cache.put('a', write(tmp_path / 'a.exe', 10))
+        assert (other / 'a.exe').read_bytes() == b'x' * 5
+        assert [entry.name for entry, _ in cache.entries()] == ['a']
+
+    def test_entry_written_by_another_process_before_replace(self, tmp_path, monkeypatch):
+        cache = BuildCache(tmp_path / 'cache')
+        cache.put('a', write(tmp_path / 'a.exe', 10))
+        remove = cache.remove
+        def raced(entry):
+            remove(entry)
+            if entry.name == 'a':
+                # another process puts the same entry right after it is removed
+                entry.mkdir()
+                write(entry / 'a.exe', 5)
+        monkeypatch.setattr(cache, 'remove', raced)
+        cache.put('a', write(tmp_path / 'a.exe', 10))
+        assert [entry.name for entry in cache.directory.iterdir()] == ['a']
+        assert cache.get('a', tmp_path / 'out.exe')
+
+    def test_entries_skip_removed_entries(self, tmp_path, monkeypatch):
+        cache = BuildCache(tmp_path / 'cache')
+        cache.put('a', write(tmp_path / 'a.exe', 10))
+        cache.put('b', write(tmp_path / 'b.exe', 10))
+        iterdir = Path.iterdir
+        def evicted(path):
+            entries = list(iterdir(path))
+            if path == cache.directory:
+                # evicted by another process after being listed
+                shutil.rmtree(path / 'a')
+            return iter(entries)
+        monkeypatch.setattr(Path, 'iterdir', evicted)
+        assert [entry.name for entry, _ in cache.entries()] == ['b']
+
+class TestCompilerCache:
+    def test_unchanged_source_builds_once(self, tmp_path, monkeypatch):
+        builds = []
+        def pyinstaller(args, *_, **__):
+            builds.append(args)
+            write(Path('dist') / args[args.index('--name') + 1], 10)
+        monkeypatch.chdir(tmp_path)
+        Path('dist').mkdir()
+        monkeypatch.setattr(compiler_module.subprocess, 'run', pyinstaller)
+
+        cache = BuildCache(tmp_path / 'cache')
+        for _ in range(2):
+            Compiler('print(1)', 'aqua.uwu', cache=cache).compile()
+        assert len(builds) == 1
+        assert Path('dist/aqua.exe').exists()
+
+        Compiler('print(2)', 'aqua.uwu', cache=cache).compile()
+        assert len(builds) == 2
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.lexer import CompileContext, Lexer, TableLexer, Whitespace, current_context
+from src.lexer.token import UniqueTokenType
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.benchmark import generate_source
+
+def compile_source(source: list[str], context: CompileContext = None) -> tuple:
+    'unique types, error messages, and python code of a source'
+    lexer = TableLexer(source, whitespace=Whitespace.SKIP, context=context)
+    unique_types = [t.token.unique_type for t in lexer.tokens if isinstance(t.token, UniqueTokenType)]
+    errors = [str(e) for e in lexer.errors]
+    python = None
+    if not errors:
+        parser = Parser(lexer.tokens, context=context)
+        errors = [str(e) for e in parser.errors]
+        if not errors:
+            errors = [str(e) for e in MemberAnalyzer(parser.program, context=context).errors]
+        if not errors:
+            errors = [str(e) for e in TypeChecker(parser.program, context=context).errors]
+        if not errors:
+            python = parser.program.python_string(context=context)
+    return unique_types, errors, python
+
+SOURCES = [
+    generate_source(20),
+    ['fwunc mainuwu-san() [[\n', '    a-chan = 1~\n', '    pwint(b)~\n', ']]\n'],
+    ['fwunc mainuwu-san() [[\n', '    a-chan = 1bc~\n', ']]\n'],
+    ['fwunc mainuwu-san() [[\n', '    a-chan = (1~\n', ']]\n'],
+    ['cwass Aqua(name-senpai) [[\n', '    age-chan = 1~\n', ']]\n', 'fwunc mainuwu-san() [[\n',
+     '    a-Aqua = Aqua("aqua")~\n', '    pwint(a.age)~\n', ']]\n'],
+]
+
+class TestCompileContext:
+    def test_lexer_starts_a_compilation(self):
+        lexer = Lexer(['fwunc mainuwu-san() [[\n', ']]\n'])
+        assert current_context() is lexer.context
+        assert lexer.context.source[0] == 'fwunc mainuwu-san() [[\n'
+        context = CompileContext()
+        assert Lexer(['aqua\n'], context=context).context is context
+        assert current_context() is lexer.context
+
+    def test_unique_types_per_context(self):
+        aqua, shion = CompileContext(), CompileContext()
+        assert UniqueTokenType('aqua', context=aqua).unique_type == 'IDENTIFIER_1'
+        assert UniqueTokenType('shion', context=shion).unique_type == 'IDENTIFIER_1'
+        assert UniqueTokenType('shion', context=aqua).unique_type == 'IDENTIFIER_2'
+        assert UniqueTokenType('aqua', context=aqua) is UniqueTokenType('aqua', context=aqua)
+
+    def test_errors_keep_their_source(self):
+        errors = Lexer(['fwunc mainuwu-san() [[\n', '    a-chan = 1bc~\n', ']]\n']).errors
+        Lexer(['fwunc mainuwu-san() [[\n', ']]\n'])
+        assert '2 |     a-chan = 1bc~' in str(errors[0])
+
+    def test_interleaved_streams(self):
+        first, second = SOURCES[0], SOURCES[4]
+        expected = [compile_source(source)[0] for source in [first, second]]
+        streams = [TableLexer(source, whitespace=Whitespace.SKIP, lazy=True).stream() for source in [first, second]]
+        tokens = [[], []]
+        while any(streams):
+            for i, stream in enumerate(streams):
+                token = next(stream, None) if stream else None
+                if token is None:
+                    streams[i] = None
+                else:
+                    tokens[i].append(token)
+        assert [[t.token.unique_type for t in ts if isinstance(t.token, UniqueTokenType)] for ts in tokens] == expected
+
+    def test_parallel_compilations(self):
+        expected = [compile_source(source, CompileContext()) for source in SOURCES]
+        assert expected[0][2] is not None and any(e[1] for e in expected)
+        sources = SOURCES * 8
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(compile_source, sources))
+        assert results == expected * 8
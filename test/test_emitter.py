@@ -0,0 +1,39 @@
+import io
+
+from src.lexer import Lexer, Whitespace
+from src.parser import Parser
+from src.parser.emitter import Emitter, emit
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.compiler import Executor
+from src.benchmark.emit import generate_nested_source
+
+def parse(source: list[str]):
+    return Parser(Lexer(source, whitespace=Whitespace.SKIP).tokens).program
+
+class TestEmitter:
+    def test_joins_chunks(self):
+        out = Emitter()
+        out.indent(2)
+        out.write('a', 'b\n')
+        assert out.getvalue() == '        ab\n'
+        assert emit(lambda out, text: out.write(text), 'c') == 'c'
+
+    def test_block_strings_match_writes(self):
+        program = parse(generate_nested_source(100, depth=12))
+        assert not MemberAnalyzer(program).errors and not TypeChecker(program).errors
+        fn = program.functions[0]
+        out = Emitter()
+        fn.write_python(out, 1)
+        assert out.getvalue() == fn.python_string(1)
+        assert emit(fn.body.write_formatted, 2) == fn.body.formatted_string(2)
+
+    def test_formatting_is_stable(self):
+        formatted = parse(generate_nested_source(100, depth=12)).formatted_string()
+        assert parse(formatted.splitlines(keepends=True)).formatted_string() == formatted
+
+    def test_nested_program_runs(self):
+        program = parse(generate_nested_source(50, depth=6))
+        assert not MemberAnalyzer(program).errors and not TypeChecker(program).errors
+        stdout = io.StringIO()
+        assert Executor(program.python_string(clear_screen=False), stdout=stdout).run() is None
+        assert stdout.getvalue()
@@ -0,0 +1,78 @@
+import io
+import queue
+
+from src.lexer import Lexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.compiler import Executor, ProgramStopped
+
+def transpile(source: str) -> str:
+    program = Parser(Lexer(source.splitlines(keepends=True), whitespace=Whitespace.SKIP).tokens).program
+    assert not MemberAnalyzer(program).errors
+    assert not TypeChecker(program).errors
+    return program.python_string(clear_screen=False)
+
+class TestExecutor:
+    def test_runs_program_with_runtime(self):
+        py_source = transpile('fwunc mainuwu-san() [[\n'
+                              '    a-chan = 4~\n'
+                              '    pwint("sum", a + 2)~\n'
+                              ']]\n')
+        stdout = io.StringIO()
+        assert Executor(py_source, stdout=stdout).run() is None
+        assert stdout.getvalue() == 'sum 6\n'
+
+    def test_reads_stdin(self):
+        py_source = transpile('fwunc mainuwu-san() [[\n'
+                              '    name-senpai = inpwt("name? ")~\n'
+                              '    pwint("hi", name)~\n'
+                              ']]\n')
+        stdout = io.StringIO()
+        assert Executor(py_source, stdout=stdout, stdin=io.StringIO('aqua\n')).run() is None
+        assert stdout.getvalue() == 'name? hi aqua\n'
+
+    def test_runs_do_not_share_globals(self):
+        Executor('leak = 1', stdout=io.StringIO()).run()
+        stdout = io.StringIO()
+        error = Executor('print(leak)', stdout=stdout).run()
+        assert isinstance(error, NameError)
+        assert 'NameError' in stdout.getvalue()
+
+    def test_error_is_written_to_stdout(self):
+        stdout = io.StringIO()
+        error = Executor('def main():\n    raise ValueError("uwu")\nmain()\n', stdout=stdout).run()
+        assert isinstance(error, ValueError)
+        assert 'File "<uwu>", line 2' in stdout.getvalue()
+        assert 'executor.py' not in stdout.getvalue()
+
+    def test_start_runs_in_thread(self):
+        stdout, done = io.StringIO(), []
+        Executor('print(Int(2) * Int(21))', stdout=stdout).start(on_done=done.append).join()
+        assert done == [None]
+        assert stdout.getvalue() == '42\n'
+
+    def test_stop_busy_program(self):
+        done = []
+        executor = Executor('while True:\n    pass\n', stdout=io.StringIO())
+        thread = executor.start(on_done=done.append)
+        executor.stop()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert len(done) == 1 and isinstance(done[0], ProgramStopped)
+
+    def test_stop_program_waiting_for_input(self):
+        lines = queue.Queue()
+        class Stdin:
+            def readline(self):
+                line = lines.get()
+                return '' if line is None else line
+        stdout, done = io.StringIO(), []
+        executor = Executor('while True:\n    print(input())\n', stdout=stdout, stdin=Stdin())
+        thread = executor.start(on_done=done.append)
+        lines.put('uwu\n')
+        executor.stop()
+        lines.put(None)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert isinstance(done[0], ProgramStopped)
+        assert 'the program was stopped' in stdout.getvalue()
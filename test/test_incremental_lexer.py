@@ -0,0 +1,25 @@
+import pytest
+
+from src.lexer import TableLexer
+from src.lexer.incremental import edit_range, relex
+
+def lex(tokens, errors):
+    return [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in tokens], [str(e) for e in errors]
+
+class TestRelex:
+    source_code = [line if line else "\n" for line in open('files/main.uwu', "r").readlines()]
+
+    @pytest.mark.parametrize('line, text', [
+        (3, '    x-chan = 1~\n'),
+        (0, '>//<\n'),
+        (5, 'aqua-senpai = "|"~ >.< unclosed\n'),
+    ])
+    def test_same_as_full_lex(self, line, text):
+        old = TableLexer(self.source_code)
+        new_source = self.source_code[:line] + [text] + self.source_code[line:]
+
+        tokens, errors, line_states, _ = relex(TableLexer, new_source, old.tokens, old.errors, old.line_states,
+                                               *edit_range(self.source_code, new_source))
+        full = TableLexer(new_source)
+        assert lex(tokens, errors) == lex(full.tokens, full.errors)
+        assert line_states == full.line_states
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from src.lexer import CompileContext, TableLexer, Token
+from src.lexer.incremental import edit_range
+from src.parser import Parser, reparse
+from src.parser.productions import Comment
+from src.parser.production_types import Production
+from src.benchmark import generate_source
+
+def parse(source: list[str]) -> Parser:
+    context = CompileContext(source)
+    return Parser(TableLexer(source, context=context).tokens, context=context)
+
+def edit(parser: Parser, source: list[str], new_source: list[str]) -> Parser:
+    context = CompileContext(new_source)
+    tokens = TableLexer(new_source, context=context).tokens
+    return reparse(parser, tokens, *edit_range(source, new_source), context=context)
+
+def tree(value):
+    'the nodes, tokens and positions of a syntax tree'
+    if isinstance(value, Token):
+        return value.lexeme, value.position, value.end_position, getattr(value, 'start_pos', None), getattr(value, 'end_pos', None)
+    if isinstance(value, list):
+        return [tree(item) for item in value]
+    if isinstance(value, (Production, Comment)):
+        names = [name for cls in type(value).__mro__ for name in vars(cls).get('__slots__', ())]
+        return type(value).__name__, [(name, tree(getattr(value, name))) for name in names]
+    return value
+
+def parsed(parser: Parser):
+    program = parser.program
+    return tree(program.definition_order) if program else None, [str(e) for e in parser.errors]
+
+class TestReparse:
+    source_code = generate_source(60)
+
+    @pytest.mark.parametrize('line, text', [
+        (2, '    pwint(1)~\n'),
+        (14, '    count-chan = 1~\n'),
+        (11, '>//< opened\n'),
+        (0, 'gwobaw g-chan = 1~\n'),
+        (30, 'fwunc broken-chan( [[\n'),
+        (len(source_code), 'gwobaw last-chan = 2~\n'),
+    ])
+    def test_same_as_full_parse(self, line, text):
+        new_source = self.source_code[:line] + [text] + self.source_code[line:]
+        assert parsed(edit(parse(self.source_code), self.source_code, new_source)) == parsed(parse(new_source))
+
+    def test_reuses_untouched_definitions(self):
+        old = parse(self.source_code)
+        before = list(old.program.definition_order)
+        # a line inside compute0, after the mainuwu and Counter0
+        new_source = self.source_code[:14] + ['    extra-chan = 1~\n'] + self.source_code[14:]
+        new = edit(old, self.source_code, new_source)
+
+        after = new.program.definition_order
+        assert len(after) == len(before)
+        changed = [i for i, (a, b) in enumerate(zip(before, after)) if a is not b]
+        assert [type(after[i]).__name__ for i in changed] == ['Function']
+        assert after[changed[0]].id.lexeme == 'compute0'
+        assert parsed(new) == parsed(parse(new_source))
+
+    def test_errors_are_moved(self):
+        source = ['fwunc broken-chan( [[\n', ']]\n'] + self.source_code
+        old = parse(source)
+        new_source = ['>.< a comment\n'] + source
+        new = edit(old, source, new_source)
+        assert new.errors and [str(e) for e in new.errors] == [str(e) for e in parse(new_source).errors]
+        assert all(e.src is new.context.source for e in new.errors)
+
+    def test_random_edits(self):
+        rng = random.Random(0)
+        source = list(self.source_code)
+        parser = parse(source)
+        for _ in range(40):
+            new_source = list(source)
+            line = rng.randrange(len(new_source))
+            match rng.randrange(3):
+                case 0:
+                    new_source.insert(line, rng.choice(self.source_code))
+                case 1:
+                    del new_source[line]
+                case 2:
+                    col = rng.randrange(len(new_source[line]))
+                    new_source[line] = new_source[line][:col] + rng.choice(['~', '[[', ']]', '"', 'x']) + new_source[line][col:]
+            parser = edit(parser, source, new_source)
+            assert parsed(parser) == parsed(parse(new_source))
+            source = new_source
@@ -0,0 +1,23 @@
+import pytest
+
+from src.lexer import Lexer, TableLexer, Whitespace
+from src.lexer.token import TokenType
+
+source_code = ['fwunc mainuwu-san() [[\n', '    aqua-chan = - 1~  >.< c\n', '\t\n', ']]\n']
+
+def without_whitespace(tokens):
+    return [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in tokens if t.token != TokenType.WHITESPACE]
+
+class TestWhitespace:
+    @pytest.mark.parametrize('lexer', [Lexer, TableLexer])
+    @pytest.mark.parametrize('whitespace', [Whitespace.COALESCE, Whitespace.SKIP])
+    def test_same_tokens(self, lexer, whitespace):
+        full, lx = lexer(source_code), lexer(source_code, whitespace=whitespace)
+        assert without_whitespace(lx.tokens) == without_whitespace(full.tokens)
+        assert [str(e) for e in lx.errors] == [str(e) for e in full.errors]
+        assert lx.line_states == full.line_states
+
+    def test_coalesced_runs(self):
+        whitespace = [t for t in TableLexer(source_code, whitespace=Whitespace.COALESCE).tokens if t.token == TokenType.WHITESPACE]
+        assert whitespace[2].lexeme == '\n    '
+        assert (whitespace[2].position, whitespace[2].end_position) == ((0, 22), (1, 3))
@@ -0,0 +1,127 @@
+import ast
+import io
+
+import pytest
+
+from src.lexer import CompileContext, Lexer, Whitespace
+from src.parser import Parser
+from src.analyzer import MemberAnalyzer, TypeChecker
+from src.compiler import Executor, lower
+from src.benchmark import generate_source
+
+PROGRAM = [
+    'cwass Counter(start-chan) [[\n',
+    '    count-chan = start~\n',
+    '    names-senpai[] = {"a", "b"}~\n',
+    '    fwunc add-chan(n-chan) [[\n',
+    '        count = count + n~\n',
+    '        wetuwn(count)~\n',
+    '    ]]\n',
+    ']]\n',
+    'fwunc mainuwu-san() [[\n',
+    '    c-Counter = Counter(1)~\n',
+    '    i-chan = 0~\n',
+    '    do whiwe (i < 3) [[\n',
+    '        i = i + 1~\n',
+    '        iwf (i == 2) [[\n',
+    '            bweak~\n',
+    '        ]] ewse iwf (i > 5) [[\n',
+    '            pwint("big")~\n',
+    '        ]] ewse [[\n',
+    '            pwint("i | i | of {3}")~\n',
+    '        ]]\n',
+    '    ]]\n',
+    '    fow (j-chan = 0~ j < 2~ j + 1) [[\n',
+    '        pwint(c.add(j), -i, fax && cap)~\n',
+    '    ]]\n',
+    ']]\n',
+]
+
+NUMERIC = [
+    'fwunc scale-kun(n-chan, by-kun, loud-sama) [[\n',
+    '    total-chan = 9999999990~\n',
+    '    part-kun = n / 4~\n',
+    '    fow (i-chan = 0~ i < n~ i + 1) [[\n',
+    '        total = total + i * 3~\n',
+    '    ]]\n',
+    '    part = part + by~\n',
+    '    cut-chan = part~\n',
+    '    iwf (loud && cut < 2.9 || total == 9999999999) [[\n',
+    '        pwint(total, part, cut, loud, cut >= 2.9, "at | n / 2 | and | cut % 2 |")~\n',
+    '    ]]\n',
+    '    wetuwn(part + -cut)~\n',
+    ']]\n',
+    'fwunc mainuwu-san() [[\n',
+    '    pwint(scale(5, 1.5, fax), scale(3, -99999.5, cap))~\n',
+    ']]\n',
+]
+
+def analyzed(source: list[str]):
+    context = CompileContext(source)
+    program = Parser(Lexer(source, whitespace=Whitespace.SKIP, context=context).tokens, context=context).program
+    assert not MemberAnalyzer(program, context=context).errors
+    assert not TypeChecker(program, context=context).errors
+    return program, context
+
+class TestLower:
+    @pytest.mark.parametrize('source', [PROGRAM, generate_source(300)], ids=['program', 'generated'])
+    @pytest.mark.parametrize('clear_screen', [True, False])
+    def test_same_as_parsed_python_string(self, source, clear_screen):
+        program, context = analyzed(source)
+        expected = ast.parse(program.python_string(clear_screen=clear_screen, context=context))
+        lowered = lower(program, clear_screen=clear_screen, context=context, specialize=False)
+        assert ast.unparse(lowered) == ast.unparse(expected)
+
+    @pytest.mark.parametrize('specialize', [False, True])
+    def test_runs_like_python_string(self, specialize):
+        program, context = analyzed(PROGRAM)
+        outputs = []
+        for py_source in [program.python_string(clear_screen=False, context=context),
+                          lower(program, clear_screen=False, context=context, specialize=specialize)]:
+            stdout = io.StringIO()
+            assert Executor(py_source, stdout=stdout).run() is None
+            outputs.append(stdout.getvalue())
+        assert outputs[0] == outputs[1]
+        assert outputs[1].startswith('i 1 of {3}\n')
+
+    def test_errors_point_at_uwu_lines(self):
+        program, context = analyzed(['fwunc mainuwu-san() [[\n',
+                                     '    a-chan[] = {1}~\n',
+                                     '    pwint(a{3})~\n',
+                                     ']]\n'])
+        stdout = io.StringIO()
+        assert Executor(lower(program, clear_screen=False, context=context), stdout=stdout).run() is not None
+        assert 'File "<uwu>", line 3' in stdout.getvalue()
+
+class TestSpecialize:
+    @pytest.mark.parametrize('source', [NUMERIC, generate_source(60)], ids=['numeric', 'generated'])
+    def test_runs_like_python_string(self, source):
+        program, context = analyzed(source)
+        outputs = []
+        for py_source in [program.python_string(clear_screen=False, context=context),
+                          lower(program, clear_screen=False, context=context)]:
+            stdout = io.StringIO()
+            assert Executor(py_source, stdout=stdout).run() is None
+            outputs.append(stdout.getvalue())
+        assert outputs[0] == outputs[1]
+
+    def test_numbers_are_capped_and_truncated(self):
+        program, context = analyzed(NUMERIC)
+        stdout = io.StringIO()
+        assert Executor(lower(program, clear_screen=False, context=context), stdout=stdout).run() is None
+        assert stdout.getvalue().splitlines() == [
+            # ints compare with kuns truncated
+            '9999999999 2.75 2 fax fax at 2.5 and 0',
+            '9999999999 -99998.75 -99998 cap cap at 1.5 and 0',
+            '0.75 -0.75',
+        ]
+
+    def test_checked_locals_are_native(self):
+        program, context = analyzed(NUMERIC + PROGRAM[:8])
+        lowered = ast.unparse(lower(program, clear_screen=False, context=context))
+        assert '_n: int = Int(_n).val' in lowered
+        assert '_cut: int = int(_part)' in lowered
+        assert '_total = cap_int(_total + cap_int(_i * 3))' in lowered
+        assert 'return Float(_part + -_cut)' in lowered
+        # class fields stay boxed
+        assert 'self._count = Int(Float(self._count + Int(_n)))' in lowered
@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+from src.compiler.executor import runtime_namespace
+
+runtime = runtime_namespace()
+Int, Float, Bool, String = runtime['Int'], runtime['Float'], runtime['Bool'], runtime['String']
+
+def result(value):
+    'the type and value of a runtime number'
+    return type(value).__name__, value.val
+
+class TestNumber:
+    @pytest.mark.parametrize('value, expected', [
+        (lambda: Int(3) + Int(4), ('Int', 7)),
+        (lambda: Int(9999999999) + Int(1), ('Int', 9999999999)),
+        (lambda: Int(-9999999999) * Int(2), ('Int', -9999999999)),
+        (lambda: Int(7) % Int(3), ('Int', 1)),
+        (lambda: Int(3) + Float(0.5), ('Float', 3.5)),
+        (lambda: Int(5) / Int(2), ('Float', 2.5)),
+        (lambda: Float(9999999999.0) * Int(10), ('Float', 9999999999.0)),
+        (lambda: Float(1.5) - Float(0.25), ('Float', 1.25)),
+        (lambda: Bool(True) + Bool(True), ('Int', 2)),
+        (lambda: Bool(True) * Float(2.5), ('Float', 2.5)),
+        (lambda: Int(2) - Bool(True), ('Int', 1)),
+        (lambda: Int(1) + 1, ('Int', 2)),
+        (lambda: -Int(3), ('Int', -3)),
+        # ints compare with the other value truncated
+        (lambda: Int(3) < Float(3.9), ('Bool', False)),
+        (lambda: Int(3) == Float(3.9), ('Bool', True)),
+        (lambda: Float(3.9) > Int(3), ('Bool', True)),
+        (lambda: Bool(True) == Int(1), ('Bool', True)),
+    ])
+    def test_operators(self, value, expected):
+        assert result(value()) == expected
+
+    @pytest.mark.parametrize('value', [
+        lambda: Int(1) + Int(None),
+        lambda: Int(1) + Float(String('nan')),
+        lambda: Int(1) < String('one'),
+    ])
+    def test_operands_that_cannot_be_converted(self, value):
+        with pytest.raises(ValueError, match='cannot be converted'):
+            value()
+
+    def test_nan_is_kept(self):
+        assert math.isnan((Float(1.5) + Float(String('nan'))).val)
+
+    def test_small_ints_are_shared(self):
+        assert (Int(1) + Int(2)) is (Int(2) + Int(1))
+        assert (Int(1000) + Int(1)) is not (Int(1) + Int(1000))
+        assert (Int(1) < Int(2)) is (Int(0) < Int(5))
+
+    def test_numbers_have_no_dict(self):
+        for value in [Int(1), Float(1.5), Bool(True), Int(1) + Int(2)]:
+            assert not hasattr(value, '__dict__')
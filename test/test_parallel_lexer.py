@@ -0,0 +1,61 @@
+import pytest
+
+from src.lexer import Lexer, TableLexer, ParallelLexer, Whitespace
+from src.lexer import parallel
+from src.benchmark import generate_source
+from helpers import lex_fields
+
+# multi line comments, unclosed strings and runs of whitespace across lines, and errors
+SOURCE = generate_source(60) + [
+    '>//< a comment\n', 'that goes on\n', 'for lines >//<\n',
+    'fwunc oops-chan() [[\n', '    a-chan = 1bc~\n', '    b-senpai = "unclosed\n', '    \n', '\n', '    c = 1.~\n', ']]\n',
+] + generate_source(40) + ['>//< unclosed\n', 'fwunc mainuwu-san() [[\n', ']]\n']
+
+class TestParallelLexer:
+    def test_boundaries_outside_comments(self):
+        lines = ['a\n', '>//< b\n', 'c\n', 'd >//<\n', 'e\n', 'f\n']
+        assert parallel.chunk_boundaries(lines, 1) == []
+        assert parallel.chunk_boundaries(lines, 3) == [4]
+        assert parallel.chunk_boundaries(lines, 6) == [1, 4, 5]
+        # lines starting with whitespace may continue a run of whitespace
+        assert parallel.chunk_boundaries(['a\n', '  b\n', '\n', 'c\n'], 4) == [3]
+
+    @pytest.mark.parametrize('whitespace', list(Whitespace))
+    def test_unsafe_boundaries(self, whitespace, monkeypatch):
+        # every line is a boundary, even inside comments and runs of whitespace
+        monkeypatch.setattr(parallel, 'chunk_boundaries', lambda lines, _: list(range(1, len(lines))))
+        monkeypatch.setattr(parallel, 'ProcessPoolExecutor', _Inline)
+        assert lex_fields(ParallelLexer(SOURCE, whitespace=whitespace, jobs=2)) == lex_fields(TableLexer(SOURCE, whitespace=whitespace))
+
+    @pytest.mark.parametrize('lexer', [Lexer, TableLexer])
+    @pytest.mark.parametrize('whitespace', list(Whitespace))
+    def test_same_as_sequential(self, lexer, whitespace, monkeypatch):
+        monkeypatch.setattr(parallel, 'MIN_CHUNK_LINES', 5)
+        # chunks are lexed in the parent when there is no pool
+        monkeypatch.setattr(parallel, 'ProcessPoolExecutor', _Inline)
+        expected = lex_fields(lexer(SOURCE, whitespace=whitespace))
+        for jobs in [1, 2, 7, 40]:
+            assert lex_fields(ParallelLexer(SOURCE, whitespace=whitespace, lexer=lexer, jobs=jobs)) == expected
+
+    def test_process_pool(self, monkeypatch):
+        monkeypatch.setattr(parallel, 'MIN_CHUNK_LINES', 50)
+        lexer = ParallelLexer(SOURCE, jobs=2)
+        assert lex_fields(lexer) == lex_fields(TableLexer(SOURCE))
+        assert lexer.errors and all(e.src is SOURCE for e in lexer.errors)
+
+class _Inline:
+    'a pool that runs its tasks when their results are asked for'
+    def __init__(self, *_):
+        pass
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        pass
+    def submit(self, fn, *args):
+        return _Result(fn, args)
+
+class _Result:
+    def __init__(self, fn, args):
+        self.fn, self.args = fn, args
+    def result(self):
+        return self.fn(*self.args)
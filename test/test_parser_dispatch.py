@@ -0,0 +1,40 @@
+from src.lexer import Lexer
+from src.lexer.token import TokenType, UniqueTokenType, IDENTIFIER_KIND, CWASS_KIND
+from src.parser import Parser
+from src.parser.parser import NO_KIND, token_kind, token_kinds
+
+SOURCE = ['fwunc mainuwu-san() [[\n', '    a-chan = 1 + 2~\n', '    pwint(a)~\n', ']]\n']
+
+class TestDispatchTables:
+    def test_kinds(self):
+        assert token_kind(TokenType.DASH) == TokenType.DASH.kind
+        assert token_kind(UniqueTokenType('a')) == token_kind("IDENTIFIER") == IDENTIFIER_KIND
+        assert token_kind(UniqueTokenType('A', UniqueTokenType.CWASS)) == token_kind("CWASS_ID") == CWASS_KIND
+        assert token_kind("not a kind") == NO_KIND
+        kinds = token_kinds([TokenType.DASH, "IDENTIFIER"])
+        assert kinds == {TokenType.DASH.kind, IDENTIFIER_KIND} and token_kinds(kinds) is kinds
+
+    def test_tables_are_shared(self):
+        first, second = Parser(Lexer(SOURCE).tokens), Parser(Lexer(SOURCE).tokens)
+        assert first.prefix_parse_fns is second.prefix_parse_fns is Parser.prefix_parse_fns
+        assert Parser.prefix_parse_fns[TokenType.DASH.kind] is Parser.parse_prefix_expression
+        assert Parser.get_in_block_parse_fn(first, UniqueTokenType('a')) is Parser.parse_ident_statement
+        assert first.get_infix_parse_fn(TokenType.TERMINATOR) is None
+
+    def test_subclass_overrides(self):
+        printed = []
+        class PrintCounter(Parser):
+            def parse_print(self):
+                printed.append(self.curr_tok)
+                return super().parse_print()
+        parser = PrintCounter(Lexer(SOURCE).tokens)
+        assert not parser.errors and [t.lexeme for t in printed] == ['pwint']
+        assert PrintCounter.in_block_parse_fns is not Parser.in_block_parse_fns
+        assert Parser.in_block_parse_fns[TokenType.PWINT.kind] is Parser.parse_print
+
+    def test_errors_do_not_grow_expected_tokens(self):
+        source = ['fwunc mainuwu-san() [[\n', '    a-senpai = "a" "b"~\n', ']]\n']
+        expected = list(Parser.expected_infix_special)
+        first, second = Parser(Lexer(source).tokens), Parser(Lexer(source).tokens)
+        assert first.errors and [str(e) for e in first.errors] == [str(e) for e in second.errors]
+        assert Parser.expected_infix_special == expected
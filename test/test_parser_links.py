@@ -0,0 +1,39 @@
+import pytest
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.parser.parser import COMMENTS
+from src.benchmark import generate_source
+
+def naive_links(tokens) -> list[int]:
+    'the index of the next token that is not a comment, found by walking'
+    links = []
+    for i in range(len(tokens)):
+        j = i + 1
+        while j < len(tokens) and tokens[j].token in COMMENTS:
+            j += 1
+        links.append(j)
+    return links
+
+SOURCE = ['>.< leading\n', 'fwunc mainuwu-san() [[\n', '    pwint(1)~ >.< trailing\n',
+          *['    >.< comment\n'] * 100, '    >//< a comment\n', '    of lines >//<\n', '    pwint(2)~\n', ']]\n', '>.< last\n', '>.< really last\n']
+
+class TestCommentLinks:
+    @pytest.mark.parametrize('source', [SOURCE, generate_source(100)])
+    def test_links_of_list(self, source):
+        parser = Parser(Lexer(source).tokens)
+        assert list(parser.next_code) == naive_links(parser.tokens)
+
+    @pytest.mark.parametrize('source', [SOURCE, generate_source(100)])
+    def test_links_of_stream(self, source):
+        parser = Parser(Lexer(source, lazy=True).stream())
+        assert list(parser.next_code) == naive_links(parser.tokens)
+
+    def test_peek_skips_comments(self):
+        parser = Parser(Lexer(SOURCE).tokens)
+        parser.pos = 0
+        assert parser.curr_tok.token in COMMENTS and parser.peek_tok.lexeme == 'fwunc'
+        parser.pos = parser.tokens.index(next(t for t in parser.tokens if t.lexeme == '~'))
+        assert parser.peek_tok.lexeme == 'pwint'
+        parser.advance()
+        assert parser.curr_tok.lexeme == 'pwint'
@@ -0,0 +1,37 @@
+from copy import copy
+
+import pytest
+
+from src.lexer import Lexer, Token
+from src.lexer.token import TokenType
+from src.parser import Parser
+from src.parser.productions import BlockStatement, Comment, Declaration, IfStatement, Program
+from src.parser.production_types import Value
+from src.benchmark import generate_source
+
+class TestSlots:
+    def test_nodes_have_no_dict(self):
+        program = Parser(Lexer(generate_source(60)).tokens).program
+        nodes = [program, *program.functions, *program.classes, *program.mainuwu.body.statements]
+        assert all(not hasattr(node, '__dict__') for node in nodes)
+        assert not hasattr(Comment(Token()), '__dict__')
+
+    def test_lazy_default_is_made_once(self):
+        d = Declaration()
+        assert isinstance(d.dono_token, Token) and not d.dono_token.exists()
+        assert d.dono_token is d.dono_token
+        assert isinstance(IfStatement().else_block, BlockStatement)
+        assert type(d.value) is Value
+
+    def test_set_fields_are_kept(self):
+        d = Declaration()
+        d.id = Token('x', TokenType.CHAN)
+        d.is_global = True
+        copied = copy(d)
+        assert copied.id is d.id and copied.is_global
+
+    def test_unknown_field(self):
+        with pytest.raises(AttributeError):
+            Declaration().unknown
+        with pytest.raises(AttributeError):
+            Program().unknown = 1
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from src.compiler.runtime import PROGRAM_HEADER, RUNTIME_MODULE, install, runtime_source
+
+class TestRuntime:
+    def test_install_writes_module_and_bytecode(self, tmp_path):
+        path = install(tmp_path)
+        assert path == tmp_path / f'{RUNTIME_MODULE}.py'
+        assert path.read_text() == runtime_source()
+        assert list((tmp_path / '__pycache__').glob(f'{RUNTIME_MODULE}.*.pyc'))
+
+    def test_install_is_skipped_when_up_to_date(self, tmp_path):
+        path = install(tmp_path)
+        mtime = path.stat().st_mtime_ns
+        assert install(tmp_path) == path
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_program_imports_runtime(self, tmp_path):
+        install(tmp_path)
+        program = tmp_path / 'program.py'
+        program.write_text(PROGRAM_HEADER + "print(Int(1) + Int(2), String('aqua') + String('!'))\n"
+                           "print(_randomInt(Int(4), Int(4)))\n")
+        result = subprocess.run([sys.executable, program], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ['3', 'aqua!', '4']
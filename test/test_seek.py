@@ -0,0 +1,55 @@
+from src.lexer import Lexer
+from src.lexer.token import TokenType
+from src.lexer.lexer_components.move_cursor import Cursor
+from src.lexer.lexer_components.seek import seek
+
+def cursor_at(lines: list[str], offset: int) -> Cursor:
+    cursor = Cursor(lines)
+    cursor.offset = offset
+    return cursor
+
+class TestSeek:
+    def test_find(self):
+        cursor = Cursor(['a >.< b >.<\n', '>.<\n'])
+        assert list(cursor.occurrences('>.<')) == [2, 8, 12]
+        assert cursor.find('>.<', 3, 12) == 8
+        # has to fit before the end
+        assert cursor.find('>.<', 3, 10) == -1
+        assert cursor.find('>//<', 0, cursor.length) == -1
+
+    def test_seek_within_lines(self):
+        lines = ['a > b\n', '>//< c\n', 'd >//<\n']
+        assert not seek(cursor_at(lines, 2), '>//<', include_current=True)
+        assert seek(cursor_at(lines, 2), '>//<', include_current=True, multi_line_count=1)
+        assert seek(cursor_at(lines, 6), '>//<', include_current=True)
+        # starts after the current character
+        assert not seek(cursor_at(lines, 6), '>//<')
+        assert seek(cursor_at(lines, 6), '>//<', multi_line_count=1)
+        assert seek(cursor_at(lines, 6), '>//<', multi_line_count='EOF')
+
+    def test_seek_does_not_move_cursor(self):
+        cursor = cursor_at(['a > b >.<\n'], 2)
+        assert seek(cursor, '>.<', include_current=True)
+        assert cursor.offset == 2
+
+    def test_long_line_of_comparisons_is_linear(self, monkeypatch):
+        steps = 0
+        advance, reverse = Cursor.advance, Cursor.reverse
+        def counted(move):
+            def step(self, increment: int = 1):
+                nonlocal steps
+                steps += increment
+                return move(self, increment)
+            return step
+        monkeypatch.setattr(Cursor, 'advance', counted(advance))
+        monkeypatch.setattr(Cursor, 'reverse', counted(reverse))
+
+        def lex_steps(n: int) -> int:
+            nonlocal steps
+            steps = 0
+            line = ' > '.join(['b'] * n)
+            tokens = Lexer(['fwunc mainuwu-san() [[\n', f'    a-chan = {line}~\n', ']]\n']).tokens
+            assert sum(t.token == TokenType.GREATER_THAN_SIGN for t in tokens) == n - 1
+            return steps
+        # characters the cursor moves over, quadratic would be 16 times more
+        assert lex_steps(4000) < 5 * lex_steps(1000)
@@ -0,0 +1,37 @@
+import io
+
+import pytest
+
+from src.lexer import Lexer, TableLexer, SourceLines, Whitespace
+from src.benchmark import generate_source
+from helpers import lex_fields
+
+class TestSourceLines:
+    @pytest.mark.parametrize('text', ['', 'a', 'a\n', 'a\nb', 'a\n\nb\n', '\n\n', 'x\r\ny\rz'])
+    def test_same_lines_as_readlines(self, text):
+        lines = SourceLines(text)
+        expected = io.StringIO(text, newline=None).readlines()
+        assert list(lines) == expected
+        assert len(lines) == len(expected)
+        assert lines[1:] == expected[1:]
+        if expected:
+            assert lines[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            lines[len(expected)]
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / 'aqua.uwu'
+        path.write_bytes('pwint("héllo")~\nbye\n'.encode())
+        assert list(SourceLines.from_file(path)) == ['pwint("héllo")~\n', 'bye\n']
+        (tmp_path / 'empty.uwu').write_bytes(b'')
+        assert len(SourceLines.from_file(tmp_path / 'empty.uwu')) == 0
+
+    @pytest.mark.parametrize('lexer', [Lexer, TableLexer])
+    def test_lexes_like_lines(self, lexer):
+        text = ''.join(generate_source(100)) + '    a-chan = 1a~\n'
+        lines = io.StringIO(text).readlines()
+        expected = lexer(lines, whitespace=Whitespace.COALESCE)
+        for source in [SourceLines(text), text, text.encode()]:
+            actual = lexer(source, whitespace=Whitespace.COALESCE)
+            assert lex_fields(actual) == lex_fields(expected)
+            assert actual.line_states == expected.line_states
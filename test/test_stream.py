@@ -0,0 +1,62 @@
+import pytest
+
+from src.lexer import Lexer, TableLexer, Whitespace
+from src.lexer import lexer as lexer_module
+from src.parser import Parser
+from src.benchmark import generate_source
+from helpers import token_fields
+
+SOURCE = ['fwunc mainuwu-san() [[\n',
+          '    >//< comment\n',
+          '    a-chan = -1 + 2~\n',
+          '    pwint(a)~\n',
+          ']]\n']
+
+class TestLazyLexer:
+    @pytest.mark.parametrize('lexer', [Lexer, TableLexer])
+    @pytest.mark.parametrize('whitespace', list(Whitespace))
+    def test_stream_matches_tokens(self, lexer, whitespace, monkeypatch):
+        # small enough for the lexer to forget tokens of previous lines
+        monkeypatch.setattr(lexer_module, 'STREAM_BUFFER_SIZE', 4)
+        source = generate_source(100)
+        eager = lexer(source, whitespace=whitespace)
+        lazy = lexer(source, whitespace=whitespace, lazy=True)
+        assert lazy.tokens == [] and lazy.errors == []
+        assert token_fields(lazy.stream()) == token_fields(eager.tokens)
+        assert [str(e) for e in lazy.errors] == [str(e) for e in eager.errors]
+        assert lazy.line_states == eager.line_states
+        assert len(lazy.tokens) < len(eager.tokens)
+
+    def test_stream_only_once(self):
+        with pytest.raises(ValueError):
+            Lexer(SOURCE).stream()
+        lexer = Lexer(SOURCE, lazy=True)
+        lexer.stream()
+        with pytest.raises(ValueError):
+            lexer.stream()
+
+class TestStreamingParser:
+    @pytest.mark.parametrize('source', [SOURCE, generate_source(100), ['\n'], ['>//< only a comment\n'],
+                                        ['fwunc mainuwu-san() [[\n', '    pwint(1)\n', ']]\n']])
+    def test_same_program_as_list(self, source):
+        eager = Parser(Lexer(source).tokens)
+        lazy = Parser(Lexer(source, lazy=True).stream())
+        assert str(eager.program) == str(lazy.program)
+        assert [str(e) for e in eager.errors] == [str(e) for e in lazy.errors]
+
+    def test_peeks_past_many_comments(self):
+        source = ['fwunc mainuwu-san() [[\n', '    pwint(1)~\n', *['    >//< comment\n'] * 200, '    pwint(2)~\n', ']]\n']
+        eager = Parser(Lexer(source).tokens)
+        lazy = Parser(Lexer(source, lazy=True).stream())
+        assert str(eager.program) == str(lazy.program)
+        assert [str(e) for e in eager.errors] == [str(e) for e in lazy.errors]
+
+    def test_stop_at_first_error(self):
+        source = ['fwunc oops-chan( [[\n', ']]\n', *generate_source(50)]
+        lexer = Lexer(source, whitespace=Whitespace.SKIP, lazy=True)
+        stream = lexer.stream()
+        parser = Parser(stream, stop_at_first_error=True)
+        assert parser.errors
+        # the rest of the source was never lexed
+        assert next(stream, None) is not None
+        assert len(Parser(Lexer(source).tokens).errors) >= len(parser.errors)
@@ -0,0 +1,19 @@
+import glob
+import pytest
+
+from src.lexer import Lexer, TableLexer
+
+def lex(lexer, source_code: list[str]):
+    lx = lexer(source_code)
+    tokens = [(t.lexeme, t.token.unique_type, t.position, t.end_position) for t in lx.tokens]
+    return tokens, [str(e) for e in lx.errors]
+
+class TestTableLexer:
+    @pytest.mark.parametrize('path', sorted(glob.glob('files/*.uwu')))
+    def test_same_as_lexer(self, path):
+        source_code = [line if line else "\n" for line in open(path, "r").readlines()]
+        assert lex(TableLexer, source_code) == lex(Lexer, source_code)
+
+    def test_keyword_fallbacks(self):
+        source_code = ['chanx-chan = -1~ ewse  iwf>=2 >.< c\n', 'cwass Aqua[[ fax| ~ 1bc !x "a|b"\n']
+        assert lex(TableLexer, source_code) == lex(Lexer, source_code)
@@ -0,0 +1,21 @@
+import pytest
+
+from src.lexer import TableLexer, Token, TokenBuffer
+from src.lexer.token import TokenType
+from helpers import token_fields
+
+class TestTokenBuffer:
+    @pytest.mark.parametrize('position', [(0, 0), (12, 7), (-1, -1), (100000, 2**31 - 2)])
+    def test_packed_positions(self, position):
+        token = Token('aqua', TokenType.EOF, position, (position[0], position[1] + 1))
+        assert token.position == position
+        assert token.end_position == (position[0], position[1] + 1)
+
+    def test_same_tokens_as_lexer(self):
+        source_code = ['fwunc mainuwu-san() [[\n', '    pwint("hello", 1.5)~\n', ']]\n']
+        tokens = TableLexer(source_code).tokens
+        buffer = TokenBuffer(tokens)
+        assert len(buffer) == len(tokens)
+        assert token_fields(buffer) == token_fields(tokens)
+        assert token_fields([buffer[-1]]) == token_fields([tokens[-1]])
+        assert token_fields(buffer[2:5]) == token_fields(tokens[2:5])
@@ -0,0 +1,86 @@
+import pickle
+
+import pytest
+
+from src.lexer import CachedLexer, CompileContext, Lexer, TableLexer, TokenCache, Whitespace
+from src.lexer import token_cache
+from src.benchmark import generate_source
+from helpers import lex_fields
+
+# identifiers, class names, errors and a unicode string
+SOURCE = generate_source(20) + [
+    'fwunc oops-chan() [[\n', '    a-chan = 1bc~\n', '    b-senpai = "unclosed\n', '    c = "ñé ✨"~\n', ']]\n',
+    '>//< unclosed\n',
+]
+
+class TestTokenCache:
+    @pytest.mark.parametrize('lexer', [Lexer, TableLexer])
+    @pytest.mark.parametrize('whitespace', list(Whitespace))
+    def test_load_is_same_as_lex(self, lexer, whitespace, tmp_path):
+        cache = TokenCache(tmp_path)
+        expected = lex_fields(lexer(SOURCE, whitespace=whitespace))
+        first = CachedLexer(SOURCE, whitespace=whitespace, lexer=lexer, cache=cache)
+        second = CachedLexer(SOURCE, whitespace=whitespace, lexer=lexer, cache=cache)
+        assert not first.cached and second.cached
+        assert lex_fields(first) == lex_fields(second) == expected
+        assert second.errors and all(e.src is SOURCE for e in second.errors)
+
+    def test_unique_types_numbered_in_context(self, tmp_path):
+        cache = TokenCache(tmp_path)
+        CachedLexer(SOURCE, cache=cache)
+        context = CompileContext()
+        loaded = CachedLexer(SOURCE, context=context, cache=cache)
+        assert loaded.cached
+        assert context.identifier_dict and context.identifier_dict == TableLexer(SOURCE).context.identifier_dict
+
+    def test_key(self, tmp_path):
+        cache = TokenCache(tmp_path)
+        key = cache.key(SOURCE, TableLexer, Whitespace.KEEP)
+        # lines from the editor have no newline at their end
+        assert cache.key(['a', 'b'], TableLexer, Whitespace.KEEP) != cache.key(['ab'], TableLexer, Whitespace.KEEP)
+        assert key != cache.key(SOURCE[:-1], TableLexer, Whitespace.KEEP)
+        assert key != cache.key(SOURCE, Lexer, Whitespace.KEEP)
+        assert key != cache.key(SOURCE, TableLexer, Whitespace.SKIP)
+
+    def test_line_breaks_are_part_of_the_source(self, tmp_path):
+        cache = TokenCache(tmp_path)
+        CachedLexer(['fwunc mainuwu-san() [[', ']]'], cache=cache)
+        joined = CachedLexer(['fwunc mainuwu-san() [[]]'], cache=cache)
+        assert not joined.cached and len(joined.line_states) == 1
+
+    def test_changed_delims_miss(self, tmp_path, monkeypatch):
+        cache = TokenCache(tmp_path)
+        CachedLexer(SOURCE, cache=cache)
+        assert CachedLexer(SOURCE, cache=cache).cached
+        delims = token_cache.constants.DELIMS
+        monkeypatch.setitem(delims, 'end', delims['end'] | {'!'})
+        token_cache.lexer_version.cache_clear()
+        try:
+            assert not CachedLexer(SOURCE, cache=cache).cached
+        finally:
+            monkeypatch.undo()
+            token_cache.lexer_version.cache_clear()
+
+    def test_broken_files_are_misses(self, tmp_path):
+        cache = TokenCache(tmp_path)
+        CachedLexer(SOURCE, cache=cache)
+        [(path, size)] = cache.entries()
+        path.write_bytes(path.read_bytes()[:size // 2])
+        assert cache.get(path.name, SOURCE, CompileContext()) is None
+        path.write_bytes(b'not a cache')
+        relexed = CachedLexer(SOURCE, cache=cache)
+        assert not relexed.cached and lex_fields(relexed) == lex_fields(TableLexer(SOURCE))
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = TokenCache(tmp_path)
+        for i in range(3):
+            CachedLexer(SOURCE[i:], cache=cache)
+        sizes = [size for _, size in cache.entries()]
+        cache.max_size = sum(sizes[1:])
+        cache.evict()
+        assert len(cache.entries()) == 2
+
+    def test_smaller_than_pickle(self):
+        lexer = TableLexer(SOURCE)
+        dumped = token_cache.dump_tokens(lexer.tokens, [], lexer.line_states)
+        assert len(dumped) < len(pickle.dumps(lexer.tokens))
@@ -0,0 +1,47 @@
+import pickle
+from copy import deepcopy
+
+from src.lexer import Lexer, Token
+from src.lexer.token import UniqueTokenType
+
+class TestUniqueTokenType:
+    def setup_method(self):
+        UniqueTokenType.clear()
+
+    def test_interned_per_lexeme(self):
+        aqua = UniqueTokenType('aqua')
+        assert UniqueTokenType('aqua') is aqua
+        assert UniqueTokenType('shion') is not aqua
+        assert UniqueTokenType('Aqua', UniqueTokenType.CWASS).delim_id == 'cwass'
+
+    def test_interned_tokens_from_lexer(self):
+        tokens = [t for t in Lexer(['fwunc mainuwu-san() [[\n', '    aqua = aqua + aqua~\n', ']]\n']).tokens
+                  if t.lexeme == 'aqua']
+        assert len(tokens) == 3
+        assert all(t.token is tokens[0].token for t in tokens)
+
+    def test_arr_and_unit_types(self):
+        aqua = UniqueTokenType('Aqua', UniqueTokenType.CWASS)
+        arr = aqua.to_arr_type()
+        assert arr.token == 'Aqua[]'
+        assert arr.unique_type == aqua.unique_type and arr.delim_id == aqua.delim_id
+        assert arr.is_arr_type() and not aqua.is_arr_type()
+        assert aqua.to_arr_type() is arr
+        assert arr.to_arr_type() is arr
+        assert arr.to_unit_type() is aqua
+        assert aqua.to_unit_type() is aqua
+
+    def test_copies_are_shared(self):
+        aqua = UniqueTokenType('aqua')
+        assert deepcopy(aqua) is aqua
+        restored = pickle.loads(pickle.dumps(aqua.to_arr_type()))
+        assert (restored.token, restored.unique_type) == ('aqua[]', aqua.unique_type)
+
+    def test_token_conversions_copy_token(self):
+        token = Token('Aqua', UniqueTokenType('Aqua', UniqueTokenType.CWASS), (1, 2), (1, 5))
+        arr = token.to_arr_type()
+        assert arr is not token
+        assert (arr.lexeme, arr.token.token, arr.position) == ('Aqua[1]', 'Aqua[]', (1, 2))
+        assert token.lexeme == 'Aqua' and token.token.token == 'Aqua'
+        unit = arr.to_unit_type()
+        assert unit.lexeme == 'Aqua' and unit.token is token.token